@@ -0,0 +1,58 @@
+"""Keystroke activity of sessions, counted per tick."""
+
+import array
+
+from typing import Dict
+
+# How often keystroke activity is sent to /watch_list clients.
+TICK_MS = 100
+# Number of ticks the keystroke rate is averaged over.
+WINDOW_TICKS = 10
+
+
+class KeystrokeActivity:
+    """Per-session keystroke counters kept in fixed size ring buffers.
+
+    Every tick covers TICK_MS. `flush` closes the current tick and
+    returns the counts of the sessions that were typed in during it.
+    """
+
+    _counters: Dict[int, array.array]
+
+    def __init__(self, window_ticks=WINDOW_TICKS):
+        self._window_ticks = window_ticks
+        self._counters = {}
+        self._tick = 0
+
+    def record(self, session_id, count=1):
+        counter = self._counters.get(session_id)
+        if counter is None:
+            counter = self._counters[session_id] = array.array(
+                "L", [0] * self._window_ticks
+            )
+        counter[self._tick] += count
+
+    def forget(self, session_id):
+        self._counters.pop(session_id, None)
+
+    def flush(self):
+        """Returns an `activity` message for the closing tick or None."""
+        sessions = []
+        window_seconds = self._window_ticks * TICK_MS / 1000
+        next_tick = (self._tick + 1) % self._window_ticks
+        for session_id, counter in list(self._counters.items()):
+            if counter[self._tick]:
+                sessions.append(
+                    {
+                        "id": session_id,
+                        "keystrokes": counter[self._tick],
+                        "rate": sum(counter) / window_seconds,
+                    }
+                )
+            counter[next_tick] = 0
+            if not any(counter):
+                del self._counters[session_id]
+        self._tick = next_tick
+        if not sessions:
+            return None
+        return {"command": "activity", "sessions": sessions}
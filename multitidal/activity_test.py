@@ -0,0 +1,22 @@
+from multitidal import activity
+
+
+def test_flushes_keystrokes_of_the_tick_and_the_rate_over_the_window():
+    counter = activity.KeystrokeActivity(window_ticks=2)
+    window_seconds = 2 * activity.TICK_MS / 1000
+    counter.record(1, 3)
+    counter.record(2)
+
+    assert counter.flush() == {
+        "command": "activity",
+        "sessions": [
+            {"id": 1, "keystrokes": 3, "rate": 3 / window_seconds},
+            {"id": 2, "keystrokes": 1, "rate": 1 / window_seconds},
+        ],
+    }
+
+    counter.record(1)
+    assert counter.flush()["sessions"] == [
+        {"id": 1, "keystrokes": 1, "rate": 4 / window_seconds}
+    ]
+    assert counter.flush() is None
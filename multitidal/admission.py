@@ -0,0 +1,148 @@
+"""Limits how many sessions run at once.
+
+Sessions that arrive while the limit is reached wait in a FIFO queue and are
+admitted one by one as running sessions release their slots or capacity frees
+up.
+"""
+
+import asyncio
+import collections
+
+from typing import Callable, Deque, Optional
+
+
+class _Waiter:
+    def __init__(self, key, future, on_position):
+        self.key = key
+        self.future = future
+        self.on_position = on_position
+        self.position = None
+
+
+class AdmissionController:
+    _waiters: Deque[_Waiter]
+
+    def __init__(
+        self,
+        max_sessions: Optional[int] = None,
+        has_capacity: Optional[Callable[[], bool]] = None,
+    ):
+        """Creates an admission controller.
+
+        Args:
+          max_sessions: number of sessions allowed to hold a slot at once, no
+            limit if None.
+          has_capacity: returns whether there are resources for one more
+            session. Checked in addition to `max_sessions`.
+        """
+        self.max_sessions = max_sessions
+        self._has_capacity = has_capacity or (lambda: True)
+        self._waiters = collections.deque()
+        self._running = 0
+        # Admitted waiters that have not resumed yet. Capacity they are about
+        # to use is not visible to `has_capacity` until they do.
+        self._resuming = 0
+        self._admitted = 0
+        self._queued = 0
+        self._abandoned = 0
+
+    async def acquire(self, key, on_position=None) -> bool:
+        """Waits for a slot for `key`. Must be paired with `release`.
+
+        Args:
+          key: identifies the waiter to `withdraw`.
+          on_position: called with the 1-based queue position whenever it
+            changes while waiting. Not called if a slot is free right away.
+
+        Returns:
+          True once a slot was taken, False if `key` was withdrawn.
+        """
+        if not self._waiters and self._can_admit():
+            self._take()
+            return True
+        future = asyncio.get_event_loop().create_future()
+        self._waiters.append(_Waiter(key, future, on_position))
+        self._queued += 1
+        self._notify_positions()
+        try:
+            admitted = await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled() and future.result():
+                # Admitted just before being cancelled, give the slot back.
+                self._resuming -= 1
+                self.release()
+            else:
+                self._remove(lambda w: w.future is future)
+            raise
+        if admitted:
+            self._resuming -= 1
+            # The caller has used its capacity by the time this runs.
+            asyncio.get_event_loop().call_soon(self.dispatch)
+        return admitted
+
+    def withdraw(self, key):
+        """Removes `key` from the queue. Its `acquire` returns False."""
+        for waiter in self._remove(lambda w: w.key is key):
+            waiter.future.set_result(False)
+
+    def occupy(self):
+        """Takes a slot for a session that is already running."""
+        self._take()
+
+    def release(self):
+        self._running -= 1
+        self.dispatch()
+
+    def dispatch(self):
+        """Admits queued sessions while there is room.
+
+        Called on release and periodically, since capacity can also free up
+        without a release.
+        """
+        admitted = False
+        while self._waiters and self._can_admit():
+            waiter = self._waiters.popleft()
+            if waiter.future.done():
+                continue
+            self._take()
+            self._resuming += 1
+            waiter.future.set_result(True)
+            admitted = True
+        if admitted:
+            self._notify_positions()
+
+    def stats(self):
+        return {
+            "running": self._running,
+            "queued": len(self._waiters),
+            "max_sessions": self.max_sessions,
+            "admitted": self._admitted,
+            "waited": self._queued,
+            "abandoned": self._abandoned,
+        }
+
+    def _can_admit(self):
+        if self.max_sessions is not None and self._running >= self.max_sessions:
+            return False
+        return not self._resuming and self._has_capacity()
+
+    def _remove(self, predicate):
+        removed = [w for w in self._waiters if predicate(w)]
+        if removed:
+            self._abandoned += len(removed)
+            self._waiters = collections.deque(
+                w for w in self._waiters if not predicate(w)
+            )
+            self._notify_positions()
+        return removed
+
+    def _take(self):
+        self._running += 1
+        self._admitted += 1
+
+    def _notify_positions(self):
+        for position, waiter in enumerate(self._waiters, start=1):
+            if waiter.position != position:
+                waiter.position = position
+                if waiter.on_position is not None:
+                    waiter.on_position(position)
@@ -0,0 +1,68 @@
+import asyncio
+
+from multitidal import admission
+
+
+def test_queued_sessions_are_admitted_in_order_with_their_positions():
+    async def run():
+        controller = admission.AdmissionController(max_sessions=1)
+        positions = {"b": [], "c": []}
+        assert await controller.acquire("a")
+        waiters = {
+            key: asyncio.ensure_future(
+                controller.acquire(key, on_position=positions[key].append)
+            )
+            for key in ("b", "c")
+        }
+        await asyncio.sleep(0)
+        assert positions == {"b": [1], "c": [2]}
+
+        controller.release()
+        assert await waiters["b"]
+        assert not waiters["c"].done()
+        assert positions == {"b": [1], "c": [2, 1]}
+
+        controller.release()
+        assert await waiters["c"]
+        return controller.stats()
+
+    stats = asyncio.run(run())
+    assert stats["running"] == 1
+    assert stats["waited"] == 2
+
+
+def test_withdrawn_session_leaves_the_queue():
+    async def run():
+        controller = admission.AdmissionController(max_sessions=1)
+        positions = []
+        assert await controller.acquire("a")
+        b = asyncio.ensure_future(controller.acquire("b"))
+        c = asyncio.ensure_future(controller.acquire("c", on_position=positions.append))
+        await asyncio.sleep(0)
+
+        controller.withdraw("b")
+        assert not await b
+        assert positions == [2, 1]
+
+        controller.release()
+        assert await c
+        return controller.stats()
+
+    assert asyncio.run(run())["abandoned"] == 1
+
+
+def test_waits_for_capacity():
+    capacity = [False]
+
+    async def run():
+        controller = admission.AdmissionController(has_capacity=lambda: capacity[0])
+        waiter = asyncio.ensure_future(controller.acquire("a"))
+        await asyncio.sleep(0)
+        controller.dispatch()
+        assert not waiter.done()
+
+        capacity[0] = True
+        controller.dispatch()
+        return await waiter
+
+    assert asyncio.run(run())
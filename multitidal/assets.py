@@ -0,0 +1,169 @@
+"""Production bundle of the web UI's scripts.
+
+In development the browser loads React's development builds and compiles
+session_list.jsx itself with Babel. `build` compiles the JSX once and joins
+it with React's production builds into a single minified bundle named after
+its content hash, next to gzip and, with the optional `brotli` module, brotli
+compressed copies. `PrecompressedStaticHandler` serves those copies to
+browsers that accept them, and marks hashed files immutable.
+"""
+
+import gzip
+import hashlib
+import json
+import mimetypes
+import os.path
+import subprocess
+
+from typing import Optional
+
+import tornado.web
+
+try:
+    import brotli  # type: ignore
+except ImportError:
+    brotli = None
+
+MEDIA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "media")
+# Bundles are written here, relative to MEDIA_PATH.
+DIST_DIR = "dist"
+MANIFEST = "manifest.json"
+APP_SOURCE = os.path.join("js", "session_list.jsx")
+BABEL = os.path.join("js", "babel.min.js")
+
+# Vendored next to the development builds, of the same React version.
+REACT_BUILDS = (
+    os.path.join("js", "react.production.min.js"),
+    os.path.join("js", "react-dom.production.min.js"),
+)
+
+# Seconds files named after their content are cached for, a year.
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+# Compiles the JSX on stdin with the vendored Babel, whose path is argv[1].
+_COMPILE_SCRIPT = """
+const Babel = require(process.argv[1]);
+let source = '';
+process.stdin.on('data', chunk => source += chunk);
+process.stdin.on('end', () => process.stdout.write(Babel.transform(source, {
+  presets: ['es2015', 'react', 'stage-2'], minified: true, comments: false,
+}).code));
+"""
+
+
+class Error(Exception):
+    pass
+
+
+def load_manifest(media_path=MEDIA_PATH) -> Optional[dict]:
+    """Returns paths of the built bundles by name, None if there is no build."""
+    try:
+        with open(
+            os.path.join(media_path, DIST_DIR, MANIFEST), encoding="utf-8"
+        ) as manifest:
+            return json.load(manifest)
+    except FileNotFoundError:
+        return None
+
+
+def bundle_path(media_path=MEDIA_PATH) -> str:
+    """Returns the path of the built bundle relative to `media_path`."""
+    manifest = load_manifest(media_path)
+    if manifest is None:
+        raise Error("No script bundle, run multitidal/build_assets.py first")
+    return manifest["app.js"]
+
+
+def compile_jsx(source: bytes, node="node", media_path=MEDIA_PATH) -> bytes:
+    try:
+        result = subprocess.run(
+            [node, "-e", _COMPILE_SCRIPT, os.path.join(media_path, BABEL)],
+            input=source,
+            capture_output=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        stderr = getattr(e, "stderr", b"") or b""
+        raise Error(f"Failed to compile JSX: {e} {stderr.decode()}") from e
+    return result.stdout
+
+
+def read_react(media_path=MEDIA_PATH) -> bytes:
+    """Returns React's vendored production builds."""
+    builds = []
+    for name in REACT_BUILDS:
+        with open(os.path.join(media_path, name), "rb") as f:
+            builds.append(f.read())
+    return b"\n".join(builds)
+
+
+def build(node="node", media_path=MEDIA_PATH) -> str:
+    """Builds the bundle and its compressed copies.
+
+    Args:
+      node: node.js binary running Babel.
+      media_path: directory with the sources, and the bundle once built.
+
+    Returns:
+      Path of the bundle relative to `media_path`.
+    """
+    with open(os.path.join(media_path, APP_SOURCE), "rb") as f:
+        app = compile_jsx(f.read(), node=node, media_path=media_path)
+    react = read_react(media_path)
+    bundle = react + b"\n" + app
+    name = f"app.{hashlib.sha256(bundle).hexdigest()[:16]}.js"
+    dist = os.path.join(media_path, DIST_DIR)
+    os.makedirs(dist, exist_ok=True)
+    for stale in os.listdir(dist):
+        os.remove(os.path.join(dist, stale))
+    path = os.path.join(dist, name)
+    with open(path, "wb") as f:
+        f.write(bundle)
+    with open(path + ".gz", "wb") as f:
+        f.write(gzip.compress(bundle, compresslevel=9, mtime=0))
+    if brotli is not None:
+        with open(path + ".br", "wb") as f:
+            f.write(brotli.compress(bundle))
+    manifest = {"app.js": f"{DIST_DIR}/{name}"}
+    with open(os.path.join(dist, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    return manifest["app.js"]
+
+
+class PrecompressedStaticHandler(tornado.web.StaticFileHandler):
+    """Serves a file's .br or .gz copy to clients that accept it.
+
+    Files under DIST_DIR are named after their content and never change, so
+    they are cached for good.
+    """
+
+    _encoding: Optional[str] = None
+
+    def validate_absolute_path(self, root, absolute_path):
+        absolute_path = super().validate_absolute_path(root, absolute_path)
+        if absolute_path is None:
+            return None
+        accepted = self.request.headers.get("Accept-Encoding", "")
+        for encoding, suffix in (("br", ".br"), ("gzip", ".gz")):
+            if encoding in accepted and os.path.isfile(absolute_path + suffix):
+                self._encoding = encoding
+                return absolute_path + suffix
+        return absolute_path
+
+    def get_content_type(self):
+        if self._encoding is None:
+            return super().get_content_type()
+        # Typed after the uncompressed file rather than as an archive.
+        mime_type, _ = mimetypes.guess_type(os.path.splitext(self.absolute_path)[0])
+        return mime_type or "application/octet-stream"
+
+    def set_extra_headers(self, path):
+        if not self.settings.get("compress_response"):
+            # Added by the response compression otherwise.
+            self.set_header("Vary", "Accept-Encoding")
+        if self._encoding is not None:
+            self.set_header("Content-Encoding", self._encoding)
+        if path.startswith(DIST_DIR + "/"):
+            self.set_header(
+                "Cache-Control", f"public, max-age={IMMUTABLE_MAX_AGE}, immutable"
+            )
@@ -0,0 +1,226 @@
+"""Relays session mp3 streams to many listeners.
+
+Each relay pulls a single upstream stream from a session's container and keeps
+its most recent chunks in a ring buffer. Listeners read from the ring buffer,
+so the container encodes and sends the stream once however many browsers are
+listening. Listeners that fall further behind than the buffer holds are
+dropped.
+"""
+
+import asyncio
+import collections
+import itertools
+import logging
+
+from typing import Deque, Dict, List, Optional, Set
+
+import tornado.httpclient
+
+# Bytes of stream kept for listeners.
+BUFFER_BYTES = 256 * 1024
+# Bytes of already relayed stream a new listener starts with. More makes
+# playback start sooner, less keeps listeners closer to live.
+START_BYTES = 32 * 1024
+# Seconds between attempts to reconnect to the upstream.
+RECONNECT_DELAY = 1.0
+UPSTREAM_CONNECT_TIMEOUT = 5.0
+# Upstreams are endless, so neither limit may ever be reached.
+UPSTREAM_MAX_BODY_SIZE = 1 << 62
+UPSTREAM_REQUEST_TIMEOUT = 365 * 24 * 3600.0
+
+
+class Error(Exception):
+    pass
+
+
+class _Closed(Exception):
+    """Aborts the upstream request of a closed relay."""
+
+
+class Listener:
+    """A reader of a relay's stream. Created by `Relay.listen`."""
+
+    _wakeup: Optional[asyncio.Future] = None
+    dropped = False
+
+    def __init__(self, relay, next_seq, on_drop=None):
+        self._relay = relay
+        self.next_seq = next_seq
+        self._on_drop = on_drop
+
+    async def read(self) -> List[bytes]:
+        """Returns the chunks relayed since the last call.
+
+        Raises:
+          Error: the listener fell behind or the relay was closed.
+        """
+        while True:
+            if self.dropped:
+                raise Error("Listener fell behind")
+            if self._relay.closed:
+                raise Error("Relay closed")
+            chunks = self._relay.chunks_since(self.next_seq)
+            if chunks:
+                self.next_seq += len(chunks)
+                return chunks
+            self._wakeup = asyncio.get_event_loop().create_future()
+            try:
+                await self._wakeup
+            finally:
+                self._wakeup = None
+
+    def wake(self):
+        if self._wakeup is not None and not self._wakeup.done():
+            self._wakeup.set_result(None)
+
+    def drop(self):
+        self.dropped = True
+        self.wake()
+        if self._on_drop is not None:
+            self._on_drop()
+
+    def close(self):
+        self._relay.remove_listener(self)
+
+
+class Relay:
+    _chunks: Deque[bytes]
+    _listeners: Set[Listener]
+    _pull_task: Optional[asyncio.Task] = None
+    closed = False
+
+    def __init__(self, url, buffer_bytes=BUFFER_BYTES, start_bytes=START_BYTES):
+        self.url = url
+        self.buffer_bytes = buffer_bytes
+        self.start_bytes = start_bytes
+        self._chunks = collections.deque()
+        # Sequence number of the first chunk in `_chunks`.
+        self._first_seq = 0
+        self._size = 0
+        self._listeners = set()
+        self._relayed_bytes = 0
+        self._dropped = 0
+        self._upstream_connects = 0
+
+    def listen(self, on_drop=None) -> Listener:
+        """Adds a listener starting `start_bytes` before the live position.
+
+        Args:
+          on_drop: called when the listener falls behind, e.g. to disconnect
+            a client that may be blocked writing.
+        """
+        seq = self._first_seq + len(self._chunks)
+        size = 0
+        for chunk in reversed(self._chunks):
+            if size + len(chunk) > self.start_bytes:
+                break
+            size += len(chunk)
+            seq -= 1
+        listener = Listener(self, seq, on_drop)
+        self._listeners.add(listener)
+        if self._pull_task is None:
+            self._pull_task = asyncio.ensure_future(self._pull())
+        return listener
+
+    def remove_listener(self, listener):
+        self._listeners.discard(listener)
+
+    def has_listeners(self) -> bool:
+        return bool(self._listeners)
+
+    def chunks_since(self, seq) -> List[bytes]:
+        start = max(0, seq - self._first_seq)
+        return list(itertools.islice(self._chunks, start, None))
+
+    def stats(self):
+        return {
+            "listeners": len(self._listeners),
+            "buffered_bytes": self._size,
+            "relayed_bytes": self._relayed_bytes,
+            "dropped_listeners": self._dropped,
+            "upstream_connects": self._upstream_connects,
+        }
+
+    def _push(self, chunk):
+        if self.closed:
+            raise _Closed()
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+        self._relayed_bytes += len(chunk)
+        while self._size > self.buffer_bytes and len(self._chunks) > 1:
+            self._size -= len(self._chunks.popleft())
+            self._first_seq += 1
+        for listener in list(self._listeners):
+            if listener.next_seq < self._first_seq:
+                self._dropped += 1
+                self._listeners.discard(listener)
+                listener.drop()
+            else:
+                listener.wake()
+
+    async def _pull(self):
+        client = tornado.httpclient.AsyncHTTPClient(
+            force_instance=True, max_body_size=UPSTREAM_MAX_BODY_SIZE
+        )
+        try:
+            while not self.closed:
+                self._upstream_connects += 1
+                try:
+                    await client.fetch(
+                        self.url,
+                        streaming_callback=self._push,
+                        connect_timeout=UPSTREAM_CONNECT_TIMEOUT,
+                        request_timeout=UPSTREAM_REQUEST_TIMEOUT,
+                    )
+                except _Closed:
+                    break
+                except Exception as e:  # pylint: disable=broad-except
+                    if self.closed:
+                        break
+                    logging.info("Audio upstream %s failed: %s", self.url, e)
+                await asyncio.sleep(RECONNECT_DELAY)
+        finally:
+            client.close()
+
+    def close(self):
+        self.closed = True
+        for listener in list(self._listeners):
+            listener.wake()
+        self._listeners.clear()
+
+
+class RelayPool:
+    """Keeps one relay per session while it has listeners."""
+
+    _relays: Dict[int, Relay]
+
+    def __init__(self, buffer_bytes=BUFFER_BYTES, start_bytes=START_BYTES):
+        self.buffer_bytes = buffer_bytes
+        self.start_bytes = start_bytes
+        self._relays = {}
+
+    def listen(self, session_id, url, on_drop=None) -> Listener:
+        relay = self._relays.get(session_id)
+        if relay is None or relay.closed or relay.url != url:
+            if relay is not None:
+                relay.close()
+            relay = self._relays[session_id] = Relay(
+                url, buffer_bytes=self.buffer_bytes, start_bytes=self.start_bytes
+            )
+        return relay.listen(on_drop)
+
+    def release(self, session_id, listener: Listener):
+        """Closes `listener`, and the session's relay if it was the last."""
+        listener.close()
+        relay = self._relays.get(session_id)
+        if relay is not None and not relay.has_listeners():
+            relay.close()
+            del self._relays[session_id]
+
+    def close(self, session_id):
+        relay = self._relays.pop(session_id, None)
+        if relay is not None:
+            relay.close()
+
+    def stats(self):
+        return {session_id: r.stats() for session_id, r in self._relays.items()}
@@ -0,0 +1,162 @@
+"""Fan-out of JSON messages to websockets with slow consumer handling."""
+
+import collections
+import itertools
+import json
+import logging
+import time
+
+from typing import Deque, Dict, Tuple
+
+import tornado.websocket
+
+from . import metrics
+
+# Outbound bytes queued on a websocket above which its client counts as slow.
+SLOW_CONSUMER_BYTES = 64 * 1024
+# Outbound bytes queued on a websocket above which its client is disconnected.
+DISCONNECT_CONSUMER_BYTES = 1024 * 1024
+
+MESSAGES = metrics.counter(
+    "multitidal_broadcast_messages_total",
+    "Messages handed to websocket recipients, by what happened to them.",
+    labels=("outcome",),
+)
+PENDING_BYTES = metrics.histogram(
+    "multitidal_websocket_pending_bytes",
+    "Outbound bytes queued on a websocket when a message is sent to it.",
+    buckets=metrics.BYTES_BUCKETS,
+)
+
+
+class BroadcastHub:
+    """Sends messages to many websockets, encoding each message once.
+
+    Every message has a kind that decides what happens when a recipient has
+    more than `slow_bytes` of output queued:
+      EVENT messages are always sent.
+      STATE messages are held back and replaced by later ones with the same
+        key, so a slow client only gets the latest state once it catches up.
+      ACTIVITY messages are dropped.
+    Recipients with more than `disconnect_bytes` queued are disconnected.
+    """
+
+    EVENT, STATE, ACTIVITY = range(3)
+
+    _held: Dict[tornado.websocket.WebSocketHandler, Dict[Tuple[int, object], str]]
+    _fanout_latencies: Deque[float]
+
+    def __init__(
+        self,
+        slow_bytes=SLOW_CONSUMER_BYTES,
+        disconnect_bytes=DISCONNECT_CONSUMER_BYTES,
+    ):
+        self.slow_bytes = slow_bytes
+        self.disconnect_bytes = disconnect_bytes
+        self._held = {}
+        self._seq = itertools.count()
+        self._fanout_latencies = collections.deque(maxlen=1024)
+        self._max_pending_bytes = 0
+        self._counts = collections.Counter()
+        MESSAGES.set_function(
+            lambda: {
+                (outcome,): count
+                for outcome, count in self._counts.items()
+                if outcome != "published"
+            }
+        )
+
+    def publish(self, recipients, message, kind=EVENT, key=None):
+        started = time.monotonic()
+        data = json.dumps(message)
+        for r in list(recipients):
+            self._deliver(r, data, kind, key)
+        self._counts["published"] += 1
+        self._fanout_latencies.append(time.monotonic() - started)
+
+    def send(self, recipient, message, kind=EVENT, key=None):
+        self._deliver(recipient, json.dumps(message), kind, key)
+
+    def flush_held(self):
+        """Sends held messages to recipients that have caught up."""
+        for r in list(self._held):
+            if self._pending_bytes(r) > self.slow_bytes:
+                continue
+            for data in self._held.pop(r).values():
+                self._write(r, data)
+
+    def forget(self, recipient):
+        self._held.pop(recipient, None)
+
+    def stats(self):
+        latencies = sorted(self._fanout_latencies)
+        pending = [self._pending_bytes(r) for r in self._held]
+        return {
+            **self._counts,
+            "held_recipients": len(self._held),
+            "held_messages": sum(len(h) for h in self._held.values()),
+            "pending_bytes_max": self._max_pending_bytes,
+            "held_pending_bytes": sum(pending),
+            "fanout_latency_p50": _percentile(latencies, 0.5),
+            "fanout_latency_p99": _percentile(latencies, 0.99),
+        }
+
+    def _deliver(self, recipient, data, kind, key):
+        pending = self._pending_bytes(recipient)
+        PENDING_BYTES.observe(pending)
+        self._max_pending_bytes = max(self._max_pending_bytes, pending)
+        if pending > self.disconnect_bytes:
+            logging.warning("Disconnecting slow client with %d bytes queued", pending)
+            self._counts["disconnected"] += 1
+            self.forget(recipient)
+            recipient.close()
+            return
+        held = self._held.get(recipient)
+        if pending <= self.slow_bytes and held is None:
+            self._write(recipient, data)
+            return
+        if kind == self.ACTIVITY:
+            self._counts["dropped"] += 1
+            return
+        if held is None:
+            held = self._held[recipient] = {}
+        if kind == self.STATE and key is not None:
+            # Keys of STATE and EVENT messages may be equal numbers.
+            if held.pop((self.STATE, key), None) is not None:
+                self._counts["coalesced"] += 1
+            # Sent after the messages held before it, in publishing order.
+            held[(self.STATE, key)] = data
+        else:
+            held[(self.EVENT, next(self._seq))] = data
+
+    def _write(self, recipient, data):
+        try:
+            recipient.write_message(data)
+        except tornado.websocket.WebSocketClosedError:
+            self.forget(recipient)
+            return
+        self._counts["delivered"] += 1
+
+    @staticmethod
+    def _pending_bytes(recipient):
+        conn = recipient.ws_connection
+        if conn is None or conn.stream is None:
+            return 0
+        return stream_pending_bytes(conn.stream)
+
+
+def stream_pending_bytes(stream) -> int:
+    """Returns the bytes queued on a tornado IOStream but not yet written.
+
+    Tornado doesn't expose it, so this reads IOStream's private write buffer
+    as of tornado 6.0.
+    """
+    return len(stream._write_buffer)  # pylint: disable=protected-access
+
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[
+        min(len(sorted_values) - 1, int(len(sorted_values) * fraction))
+    ]
@@ -0,0 +1,102 @@
+import asyncio
+import socket
+
+import tornado.iostream
+
+from multitidal import broadcast
+
+
+class FakeStream:
+    def __init__(self):
+        # Named like IOStream's buffer of bytes not written yet.
+        self._write_buffer = bytearray()
+
+
+class FakeConnection:
+    def __init__(self, stream):
+        self.stream = stream
+
+
+class FakeRecipient:
+    def __init__(self, stream=None):
+        self.ws_connection = FakeConnection(stream or FakeStream())
+        self.messages = []
+
+    def write_message(self, data):
+        self.messages.append(data)
+
+    def close(self):
+        self.ws_connection = None
+
+    def set_pending_bytes(self, pending):
+        # pylint: disable=protected-access
+        self.ws_connection.stream._write_buffer = bytearray(pending)
+
+
+def pending_bytes_sum():
+    for line in broadcast.PENDING_BYTES.render():
+        if line.startswith("multitidal_websocket_pending_bytes_sum"):
+            return float(line.split()[-1])
+    return 0.0
+
+
+def test_slow_recipient_gets_held_events_and_latest_states_in_order():
+    hub = broadcast.BroadcastHub(slow_bytes=10, disconnect_bytes=100)
+    recipient = FakeRecipient()
+    recipient.set_pending_bytes(50)
+
+    hub.send(recipient, {"event": "session_add", "id": 0})
+    hub.send(recipient, {"state": "starting", "id": 0}, hub.STATE, key=0)
+    hub.send(recipient, {"event": "session_add", "id": 1})
+    hub.send(recipient, {"state": "running", "id": 0}, hub.STATE, key=0)
+    hub.send(recipient, {"activity": 1}, hub.ACTIVITY)
+    assert not recipient.messages
+
+    recipient.set_pending_bytes(0)
+    hub.flush_held()
+
+    assert recipient.messages == [
+        '{"event": "session_add", "id": 0}',
+        '{"event": "session_add", "id": 1}',
+        '{"state": "running", "id": 0}',
+    ]
+    assert hub.stats()["coalesced"] == 1
+    assert hub.stats()["dropped"] == 1
+
+
+def test_disconnects_recipient_over_the_limit():
+    hub = broadcast.BroadcastHub(slow_bytes=10, disconnect_bytes=100)
+    recipient = FakeRecipient()
+    recipient.set_pending_bytes(101)
+
+    hub.send(recipient, {"event": "session_add", "id": 0})
+
+    assert recipient.ws_connection is None
+    assert not recipient.messages
+    assert hub.stats()["disconnected"] == 1
+
+
+def test_measures_bytes_queued_on_a_real_stream():
+    async def run():
+        reader, writer = socket.socketpair()
+        stream = tornado.iostream.IOStream(writer)
+        try:
+            # Nobody reads, so what doesn't fit in the socket stays queued.
+            stream.write(b"x" * (16 * 1024 * 1024))
+            pending = broadcast.stream_pending_bytes(stream)
+            before = pending_bytes_sum()
+            hub = broadcast.BroadcastHub(slow_bytes=1024, disconnect_bytes=1 << 30)
+            recipient = FakeRecipient(stream)
+            recipient.write_message = recipient.messages.append
+            hub.send(recipient, {"event": "session_add", "id": 0})
+            return pending, pending_bytes_sum() - before, recipient.messages
+        finally:
+            stream.close()
+            reader.close()
+
+    pending, observed, messages = asyncio.run(run())
+
+    assert pending > 0
+    assert observed == pending
+    # Held back as the recipient is slow.
+    assert not messages
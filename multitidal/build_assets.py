@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+"""Builds the web UI's script bundle served with server.py --production.
+
+    $ python multitidal/build_assets.py
+
+Needs node.js to run the vendored Babel.
+"""
+
+import sys
+
+import tornado.options
+
+from tornado.options import define, options
+
+from multitidal import assets
+
+define("node", default="node", help="node.js binary", type=str)
+
+
+def main():
+    tornado.options.parse_command_line()
+    try:
+        path = assets.build(node=options.node)
+    except assets.Error as e:
+        print(e, file=sys.stderr)
+        return 1
+    print(f"Built {path}, compressed copies: gzip", end="")
+    print(", brotli" if assets.brotli is not None else "")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,45 @@
+"""Versioned log of changes to a worker's session list.
+
+Every change gets the next version. List watchers remember the last version
+they saw and, when they reconnect, get the changes since then instead of the
+whole list. Versions are only comparable within one epoch: a restarted or
+different worker starts a new one.
+"""
+
+import collections
+import secrets
+
+from typing import Deque, List, Optional
+
+# Changes kept for reconnecting watchers to catch up on.
+CHANGE_LOG_SIZE = 1000
+
+
+class ChangeLog:
+    _changes: Deque[dict]
+
+    def __init__(self, size=CHANGE_LOG_SIZE):
+        self.epoch = secrets.token_hex(4)
+        self.version = 0
+        self._changes = collections.deque(maxlen=size)
+
+    def append(self, change: dict) -> dict:
+        """Returns `change` stamped with its version."""
+        self.version += 1
+        change = dict(change, version=self.version)
+        self._changes.append(change)
+        return change
+
+    def since(self, version, epoch) -> Optional[List[dict]]:
+        """Returns changes after `version` of `epoch`.
+
+        Returns:
+          None if they are not all in the log any more, or `version` is of
+          another epoch.
+        """
+        if epoch != self.epoch or not 0 <= version <= self.version:
+            return None
+        oldest = self._changes[0]["version"] if self._changes else self.version + 1
+        if version < oldest - 1:
+            return None
+        return [c for c in self._changes if c["version"] > version]
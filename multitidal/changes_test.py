@@ -0,0 +1,30 @@
+from multitidal import changes
+
+
+def test_replays_changes_since_a_version():
+    log = changes.ChangeLog()
+    first = log.append({"command": "session_add"})
+    second = log.append({"command": "session_state"})
+
+    assert (first["version"], second["version"]) == (1, 2)
+    assert log.since(0, log.epoch) == [first, second]
+    assert log.since(1, log.epoch) == [second]
+    assert log.since(2, log.epoch) == []
+
+
+def test_refuses_versions_of_another_epoch_or_out_of_range():
+    log = changes.ChangeLog()
+    log.append({"command": "session_add"})
+
+    assert log.since(0, "other") is None
+    assert log.since(2, log.epoch) is None
+    assert log.since(-1, log.epoch) is None
+
+
+def test_refuses_versions_no_longer_in_the_log():
+    log = changes.ChangeLog(size=2)
+    for _ in range(3):
+        log.append({"command": "session_add"})
+
+    assert log.since(0, log.epoch) is None
+    assert [c["version"] for c in log.since(1, log.epoch)] == [2, 3]
@@ -1,18 +1,23 @@
 import asyncio
 import json
 import os
-import pty
 import shutil
+import signal
 import sys
 import tty
 import termios
 import time
-import threading
+import urllib.parse
+
+from typing import Optional
 
 import tornado.iostream
 from tornado.ioloop import IOLoop
 from tornado.websocket import websocket_connect
 
+from . import protocol
+from . import terminal
+
 ioloop = tornado.ioloop.IOLoop.instance()
 
 
@@ -21,40 +26,71 @@ SSH_PASSWORD = "algorave"
 
 SCREEN_TO_SCREEN_0_SEQ = b"ls -l\r\x1bOC" + b"\x010"  # ^A 0
 
+READ_SIZE = 1024
+# Seconds to wait for a web terminal to set up the session's screen before
+# attaching to it anyway.
+SCREEN_READY_TIMEOUT = 10.0
+# Seconds between attempts to reconnect a dropped websocket.
+RECONNECT_DELAY = 0.5
+# Keystrokes read within this many seconds of each other go out in one message.
+BATCH_DELAY = 0.005
+
+
+class KeystrokeSender:
+    """Batches keystrokes read close together into a single message."""
+
+    def __init__(self, ws, binary, batch_delay=BATCH_DELAY):
+        self.ws = ws
+        self.binary = binary
+        self.batch_delay = batch_delay
+        self._buffer = bytearray()
+        self._flush_handle = None
+
+    def add(self, content: bytes):
+        self._buffer += content
+        if self._flush_handle is None:
+            self._flush_handle = ioloop.call_later(self.batch_delay, self.flush)
 
-async def send_stdin_to_ws_task(ws, on_finish_cb):
+    def flush(self):
+        if self._flush_handle is not None:
+            ioloop.remove_timeout(self._flush_handle)
+            self._flush_handle = None
+        if not self._buffer:
+            return
+        content, self._buffer = bytes(self._buffer), bytearray()
+        if self.binary:
+            self.ws.write_message(
+                protocol.encode(protocol.KEYSTROKES, content), binary=True
+            )
+        else:
+            self.ws.write_message(
+                json.dumps(
+                    {
+                        "client_command": "keystrokes",
+                        "keystrokes": [int(x) for x in content],
+                    }
+                )
+            )
+
+
+async def read_stdin_task(on_input, on_finish_cb):
+    """Passes raw stdin to `on_input` until it returns False or stdin closes."""
     print("mangling terminal")
+    fn = os.dup(sys.stdin.fileno())
+    inp = tornado.iostream.PipeIOStream(fn)
+    mode = termios.tcgetattr(sys.stdin.fileno())
     try:
-        fn = os.dup(sys.stdin.fileno())
-        inp = tornado.iostream.PipeIOStream(fn)
-        mode = termios.tcgetattr(sys.stdin.fileno())
         tty.setraw(fn)
         while True:
             try:
-                print("reading stdin", end="\r\n")
-                content = await inp.read_bytes(100, partial=True)
-                print("read stdin", end="\r\n")
-            #    content = await self.inp.read_bytes(100, partial=True)
+                content = await inp.read_bytes(READ_SIZE, partial=True)
             except tornado.iostream.StreamClosedError:
                 print("Stdin closed", end="\r\n")
-                # await self.finish()
                 ioloop.add_callback(on_finish_cb)
                 break
-            print(f"stdin: {content}", end="\r\n")
-            if content[0] == 3 or not content:  # CTRL-C
-                print("Got a ^C", end="\r\n")
+            if not content or not on_input(content):
                 ioloop.add_callback(on_finish_cb)
                 break
-            ioloop.add_callback(
-                ws.write_message,
-                json.dumps(
-                    {
-                        "client_command": "keystrokes",
-                        "keystrokes": [int(x) for x in content],
-                    }
-                ),
-            )
-        print("no exc", end="\r\n")
     except asyncio.CancelledError:
         print("stdin read task cancelled", end="\r\n")
     except Exception as e:  # pylint: disable=broad-except
@@ -62,77 +98,88 @@ async def send_stdin_to_ws_task(ws, on_finish_cb):
     finally:
         inp.close()
         termios.tcsetattr(sys.stdin, termios.TCSADRAIN, mode)
-        print("finally")
-
-
-async def run_ssh(host, port, login=SSH_LOGIN, password=SSH_PASSWORD):
-    os.environ["SSHPASS"] = password
-    ssh_cmd = [
-        "ssh",
-        "-o",
-        "PreferredAuthentications=password",
-        "-o",
-        "PubkeyAuthentication=no",
-        "-o",
-        "StrictHostKeyChecking=no",  # Skip fingerpint warning.
-        f"{login}@{host}",
-        "-p",
-        str(port),
-    ]
-    sshpass_cmd = [shutil.which("sshpass"), "-e"] + ssh_cmd
-    args = sshpass_cmd
-    print(" ".join(args))
-
-    e = threading.Event()
-
-    def stdin_read(fd):
-        if not e.is_set():
-            e.set()
-            return SCREEN_TO_SCREEN_0_SEQ + os.read(fd, 1024)
-
-        b = os.read(fd, 1024)
-        return b
-
-    def master_read(fd):
-        b = os.read(fd, 1024)
-        return b
-
-    # Let Web UI connect to screen 0 first.
-    time.sleep(3)
-    res = pty.spawn(args, master_read=master_read, stdin_read=stdin_read)
-    print(f"ssh returned {res}")
 
 
 class Client:
+    """Keyboard client of a session.
+
+    Keystrokes go over the websocket until the server sends the session's SSH
+    details. The client then opens an SSH session in the io loop and types
+    into it directly, while the websocket stays connected.
+    """
+
+    # "idle" while typing into the websocket, "ssh" while typing into SSH.
     mode: str
+    ssh: Optional[terminal.SSHTerminal] = None
+    _sender: Optional[KeystrokeSender] = None
+
+    def __init__(self, url, timeout, compress=False):
+        """Creates a client.
 
-    def __init__(self, url, timeout):
+        Args:
+          url: the server's /console websocket URL.
+          timeout: seconds to keep reconnecting a dropped websocket for.
+          compress: whether to ask for permessage-deflate.
+        """
         self.url = url
         self.timeout = timeout
+        self.compress = compress
         self.ioloop = IOLoop.instance()
         self.ws = None
+        self.mode = "idle"
+        # Lets a reconnect attach to the same session.
+        self.resume_token = None
+        # (host, port) of the session's SSH server, once it runs.
+        self.ssh_address = None
+        self._screen_ready = asyncio.Event()
+        # Whether the next keystroke is the first one typed into SSH.
+        self._first_ssh_input = False
 
         self.send_stdin_task = None
 
-    async def connect(self):
-        print("trying to connect")
+    async def _open_ws(self):
+        url = self.url
+        if self.resume_token:
+            url += "?" + urllib.parse.urlencode({"resume": self.resume_token})
         try:
-            self.ws = await websocket_connect(self.url)
+            self.ws = await websocket_connect(
+                url,
+                subprotocols=[protocol.BINARY_SUBPROTOCOL],
+                compression_options={} if self.compress else None,
+            )
         except Exception as e:  # pylint: disable=broad-except
-            print(f"connection error: {str(e)}")
+            print(f"connection error: {str(e)}", end="\r\n")
+            return False
+        binary = self.ws.selected_subprotocol == protocol.BINARY_SUBPROTOCOL
+        if self._sender is None:
+            self._sender = KeystrokeSender(self.ws, binary)
         else:
+            self._sender.ws, self._sender.binary = self.ws, binary
+        return True
+
+    async def connect(self):
+        print("trying to connect")
+        if await self._open_ws():
             print("connected")
-            # await self.ws.write_message({'client': self.i})
-            self.mode = "idle"
             self.ioloop.spawn_callback(self.run_idle)
             self.ioloop.spawn_callback(self.run)
 
+    async def _reconnect(self) -> bool:
+        deadline = time.monotonic() + self.timeout
+        while time.monotonic() < deadline:
+            print("server left, reconnecting", end="\r\n")
+            if await self._open_ws():
+                return True
+            await asyncio.sleep(RECONNECT_DELAY)
+        return False
+
     def finish_ws(self):
         if self.ws:
             self.ws.close()
             self.ws = None
 
     async def finish(self):
+        self.close_ssh()
         if self.send_stdin_task:
             await self.stop_idle()
 
@@ -143,38 +190,116 @@ class Client:
         assert not self.send_stdin_task
         print("running idle, spawning task")
         self.send_stdin_task = asyncio.create_task(
-            send_stdin_to_ws_task(self.ws, self.finish)
+            read_stdin_task(self._on_input, self.finish)
         )
+        asyncio.get_event_loop().add_signal_handler(signal.SIGWINCH, self._on_resize)
 
     async def stop_idle(self):
         assert self.send_stdin_task
         self.send_stdin_task.cancel()
         await self.send_stdin_task
         self.send_stdin_task = None
+        if self._sender is not None:
+            self._sender.flush()
+
+    def _on_input(self, content: bytes) -> bool:
+        if self.ssh is not None:
+            if self._first_ssh_input:
+                self._first_ssh_input = False
+                content = SCREEN_TO_SCREEN_0_SEQ + content
+            self.ssh.write(content)
+            return True
+        if content[0] == 3:  # CTRL-C
+            print("Got a ^C", end="\r\n")
+            return False
+        if content == b"\r" and self.ssh_address is not None:
+            self.ioloop.spawn_callback(self.open_ssh)
+            return True
+        if self.ws is not None and self._sender is not None:
+            self._sender.add(content)
+        return True
+
+    def _on_resize(self):
+        if self.ssh is not None:
+            self.ssh.resize(*shutil.get_terminal_size())
+
+    async def attach(self):
+        """Opens SSH once a web terminal set up the session's screen."""
+        try:
+            await asyncio.wait_for(self._screen_ready.wait(), SCREEN_READY_TIMEOUT)
+        except asyncio.TimeoutError:
+            print("No web terminal set up the screen yet", end="\r\n")
+        await self.open_ssh()
+
+    async def open_ssh(self):
+        if self.mode != "idle" or self.ssh_address is None:
+            return
+        self.mode = "ssh"
+        host, port = self.ssh_address
+        print(f"Connecting to ssh {host}:{port}...", end="\r\n")
+        ssh = terminal.SSHTerminal(
+            on_output=self._on_ssh_output, on_close=self._on_ssh_close
+        )
+        try:
+            await ssh.open(
+                host,
+                port,
+                SSH_LOGIN,
+                SSH_PASSWORD,
+                size=tuple(shutil.get_terminal_size()),
+            )
+        except terminal.Error as e:
+            print(str(e), end="\r\n")
+            return
+        self.ssh = ssh
+        self._first_ssh_input = True
+
+    def close_ssh(self):
+        if self.ssh is not None:
+            self.ssh.close()
 
     @staticmethod
-    async def run_ssh(host, port):
-        # Blocks ioloop
-        await run_ssh(host, port)
+    def _on_ssh_output(data: bytes):
+        sys.stdout.buffer.write(data)
+        sys.stdout.flush()
+
+    def _on_ssh_close(self):
+        self.ssh = None
+        self.mode = "idle"
+        if self.ssh_address is not None:
+            print("ssh closed, press Enter to attach again", end="\r\n")
+
+    def _on_message(self, msg):
+        self.resume_token = msg.get("resume_token", self.resume_token)
+        if msg.get("event") == "screen_ready":
+            self._screen_ready.set()
+        elif msg.get("mode") == "ssh":
+            address = (msg["ssh"]["host"], msg["ssh"]["port"])
+            if self.ssh is not None and address == self.ssh_address:
+                # Resumed the session this client is typing into.
+                return
+            self.close_ssh()
+            self.ssh_address = address
+            if msg.get("screen_ready"):
+                self._screen_ready.set()
+            self.ioloop.spawn_callback(self.attach)
+        elif msg.get("mode") == "idle":
+            self.ssh_address = None
+            self._screen_ready.clear()
+            self.close_ssh()
 
     async def run(self):
         while True:
             msg = await self.ws.read_message()
             if msg is None:
+                self.ws = None
+                if self.resume_token is not None and await self._reconnect():
+                    continue
                 print("server left, terminating", end="\r\n")
                 self.ioloop.add_callback(self.finish)
                 return
 
             msg = json.loads(msg)
-            print(f"got msg: {msg}", end="\r\n")
-            if "mode" not in msg:
-                continue
-            if msg["mode"] == "ssh":
-                host, port = msg["ssh"]["host"], msg["ssh"]["port"]
-                print(f"Connecting to ssh {host}:{port}...", end="\r\n")
-                await self.stop_idle()
-                await self.run_ssh(host, port)
-                print("restarting idle task")
-                self.finish_ws()
-                await self.connect()
-                break
+            if self.ssh is None:
+                print(f"got msg: {msg}", end="\r\n")
+            self._on_message(msg)
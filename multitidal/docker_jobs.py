@@ -0,0 +1,170 @@
+import asyncio
+import functools
+import heapq
+import itertools
+import logging
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from . import metrics
+
+# Job priorities, lower runs first. Stopping frees resources so it goes ahead
+# of anything that allocates them.
+STOP = 0
+START = 1
+SPECULATIVE = 2
+
+# Waits longer than this are logged.
+SLOW_WAIT_SECONDS = 1.0
+
+CALL_SECONDS = metrics.histogram(
+    "multitidal_docker_call_seconds",
+    "Duration of docker API calls.",
+    labels=("call",),
+)
+CALL_ERRORS = metrics.counter(
+    "multitidal_docker_call_errors_total",
+    "Docker API calls that raised or timed out.",
+    labels=("call", "reason"),
+)
+WAIT_SECONDS = metrics.histogram(
+    "multitidal_docker_wait_seconds",
+    "Time docker API calls waited for a free slot.",
+)
+JOBS = metrics.gauge(
+    "multitidal_docker_jobs",
+    "Docker API calls queued and running.",
+    labels=("status",),
+)
+
+
+class Error(Exception):
+    pass
+
+
+class JobScheduler:
+    """Runs blocking docker SDK calls with bounded concurrency.
+
+    Calls wait in a priority queue until one of `max_concurrency` slots is
+    free. A slot stays taken until the call returns, even if the caller gave up
+    on it after a timeout, so the daemon never sees more than
+    `max_concurrency` calls from this process.
+    """
+
+    _queue: List[Tuple[int, int, asyncio.Future]]
+    _executor: Optional[ThreadPoolExecutor] = None
+
+    def __init__(self, max_concurrency=4, default_timeout=60.0):
+        self.max_concurrency = max_concurrency
+        self.default_timeout = default_timeout
+        self._queue = []
+        self._seq = itertools.count()
+        self._running = 0
+
+        self._submitted = 0
+        self._failed = 0
+        self._timed_out = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+        self.configure()
+
+    def configure(self, max_concurrency=None, default_timeout=None):
+        if max_concurrency is not None:
+            self.max_concurrency = max_concurrency
+        if default_timeout is not None:
+            self.default_timeout = default_timeout
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="docker"
+        )
+        JOBS.set_function(
+            lambda: {("queued",): len(self._queue), ("running",): self._running}
+        )
+
+    async def run(self, fn, *args, priority=START, timeout=None, **kwargs):
+        """Runs `fn(*args, **kwargs)` in a worker thread and returns its result.
+
+        Raises:
+          Error: the call did not finish within `timeout` seconds.
+        """
+        loop = asyncio.get_event_loop()
+        slot = loop.create_future()
+        heapq.heappush(self._queue, (priority, next(self._seq), slot))
+        queued_at = time.monotonic()
+        self._submitted += 1
+        self._dispatch()
+        try:
+            await slot
+        except asyncio.CancelledError:
+            if slot.done() and not slot.cancelled():
+                self._release()
+            raise
+        self._record_wait(fn, time.monotonic() - queued_at)
+
+        job = loop.run_in_executor(
+            self._executor, functools.partial(fn, *args, **kwargs)
+        )
+        job.add_done_callback(
+            functools.partial(self._on_job_done, _name(fn), time.monotonic())
+        )
+        timeout = self.default_timeout if timeout is None else timeout
+        try:
+            return await asyncio.wait_for(asyncio.shield(job), timeout)
+        except asyncio.TimeoutError:
+            self._timed_out += 1
+            CALL_ERRORS.labels(_name(fn), "timeout").inc()
+            raise Error(f"{_name(fn)} timed out after {timeout}s") from None
+
+    def stats(self):
+        started = self._submitted - len(self._queue)
+        return {
+            "queued": len(self._queue),
+            "running": self._running,
+            "max_concurrency": self.max_concurrency,
+            "submitted": self._submitted,
+            "failed": self._failed,
+            "timed_out": self._timed_out,
+            "avg_wait": self._total_wait / started if started else 0.0,
+            "max_wait": self._max_wait,
+        }
+
+    def _record_wait(self, fn, waited):
+        WAIT_SECONDS.observe(waited)
+        self._total_wait += waited
+        self._max_wait = max(self._max_wait, waited)
+        if waited > SLOW_WAIT_SECONDS:
+            logging.warning(
+                "%s waited %.2fs for a docker slot, %d more queued",
+                _name(fn),
+                waited,
+                len(self._queue),
+            )
+
+    def _dispatch(self):
+        while self._running < self.max_concurrency and self._queue:
+            _, _, slot = heapq.heappop(self._queue)
+            if slot.cancelled():
+                continue
+            self._running += 1
+            slot.set_result(None)
+
+    def _release(self):
+        self._running -= 1
+        self._dispatch()
+
+    def _on_job_done(self, name, started, job):
+        CALL_SECONDS.labels(name).observe(time.monotonic() - started)
+        if not job.cancelled() and job.exception() is not None:
+            self._failed += 1
+            CALL_ERRORS.labels(name, "error").inc()
+        self._release()
+
+
+def _name(fn):
+    if isinstance(fn, functools.partial):
+        fn = fn.func
+    return getattr(fn, "__qualname__", repr(fn))
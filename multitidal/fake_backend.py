@@ -0,0 +1,112 @@
+"""An instance backend that runs nothing, for load tests without docker.
+
+Instances only wait for their configured latencies and fail at the configured
+rates. Their SSH and mp3 addresses point at ports nothing listens on.
+"""
+
+import asyncio
+import logging
+import random
+
+from . import docker_jobs
+from . import instance_manager
+
+# Port handed out as the address of every fake instance.
+FAKE_PORT = 9
+
+
+class FakeInstance(instance_manager.Instance):
+    def __init__(self, backend):
+        self._backend = backend
+        self.timings = {}
+        self.paused = False
+        self.running = False
+
+    async def start(self, hostname, priority=docker_jobs.START):
+        backend = self._backend
+        loop = asyncio.get_event_loop()
+        started = loop.time()
+        backend.active += 1
+        await asyncio.sleep(backend.sample(backend.start_latency))
+        self.timings = {"total": loop.time() - started}
+        if backend.random.random() < backend.start_failure_rate:
+            backend.active -= 1
+            backend.failed += 1
+            raise instance_manager.Error("Fake start failure")
+        self.ssh_port = self.mp3_port = FAKE_PORT
+        self.assign_hostname(hostname)
+        self.running = True
+
+    async def stop(self):
+        if not self.running:
+            return
+        self.running = False
+        await asyncio.sleep(self._backend.sample(self._backend.stop_latency))
+        self._backend.active -= 1
+
+    async def pause(self):
+        self.paused = True
+
+    async def resume(self):
+        self.paused = False
+
+    def assign_hostname(self, hostname):
+        self.hostname = hostname
+
+    def get_ssh_address(self):
+        return (instance_manager.PROBE_HOST, FAKE_PORT)
+
+    def get_mp3_address(self):
+        return (instance_manager.PROBE_HOST, FAKE_PORT)
+
+
+class FakeBackend(instance_manager.Backend):
+    def __init__(
+        self,
+        *,
+        start_latency=1.0,
+        stop_latency=0.2,
+        start_failure_rate=0.0,
+        jitter=0.2,
+        capacity=None,
+        seed=None,
+    ):
+        """Configures fake instances.
+
+        Args:
+          start_latency: mean seconds a start takes.
+          stop_latency: mean seconds a stop takes.
+          start_failure_rate: fraction of starts that fail.
+          jitter: latencies are uniformly spread this fraction around the mean.
+          capacity: number of instances that can run at once, no limit if None.
+          seed: seed for latencies and failures, for repeatable runs.
+        """
+        self.start_latency = start_latency
+        self.stop_latency = stop_latency
+        self.start_failure_rate = start_failure_rate
+        self.jitter = jitter
+        self.capacity = capacity
+        self.random = random.Random(seed)
+        # Instances starting, running or stopping.
+        self.active = 0
+        self.failed = 0
+
+    def sample(self, mean):
+        return max(0.0, mean * (1 + self.random.uniform(-self.jitter, self.jitter)))
+
+    def new_instance(self) -> instance_manager.Instance:
+        return FakeInstance(self)
+
+    def has_capacity(self, max_load=1.0) -> bool:
+        if self.capacity is None:
+            return True
+        return self.active + 1 <= self.capacity * max_load
+
+    def stats(self):
+        return {"active": self.active, "failed": self.failed}
+
+
+def install(backend: FakeBackend):
+    """Makes servers in this process use `backend`."""
+    logging.info("Using fake instances, nothing will be started in docker")
+    instance_manager.BACKEND = backend
@@ -0,0 +1,179 @@
+"""Makes sure docker hosts have the images sessions run.
+
+Missing images are pulled in the background at startup, and images referenced
+by tag are refreshed. Images can be pinned by digest, e.g.
+"parabolala/supertidebox@sha256:...", so every host runs the same bytes.
+Pinned images that are present are never pulled again.
+"""
+
+import asyncio
+import logging
+import time
+
+from typing import Dict, Optional, Sequence, Tuple
+
+import docker
+
+# Seconds between attempts to pull an image that failed to pull.
+PULL_RETRY_DELAY = 30.0
+
+# Image states.
+MISSING = "missing"
+PULLING = "pulling"
+READY = "ready"
+FAILED = "failed"
+
+
+def parse(image) -> Tuple[str, str]:
+    """Splits `image` into its repository and its digest or tag."""
+    name, _, digest = image.partition("@")
+    repository, tag = name, "latest"
+    if ":" in name.rsplit("/", 1)[-1]:
+        repository, tag = name.rsplit(":", 1)
+    return repository, digest or tag
+
+
+def is_pinned(image) -> bool:
+    return "@" in image
+
+
+class ImageStatus:
+    """Progress of preparing one image on one host."""
+
+    digest: Optional[str] = None
+    error: Optional[str] = None
+    finished: Optional[float] = None
+    # Downloaded and total bytes by layer id.
+    layers: Dict[str, Tuple[int, int]]
+
+    def __init__(self, image):
+        self.image = image
+        self.state = MISSING
+        self.started = time.monotonic()
+        self.layers = {}
+
+    def on_progress(self, event):
+        """Records a progress message of a pull stream."""
+        layer = event.get("id")
+        status = event.get("status", "")
+        detail = event.get("progressDetail") or {}
+        if status.startswith("Digest:"):
+            self.digest = status.split(":", 1)[1].strip()
+        elif layer and status == "Downloading" and detail.get("total"):
+            self.layers[layer] = (detail.get("current", 0), detail["total"])
+        elif layer and status in ("Download complete", "Pull complete"):
+            _, total = self.layers.get(layer, (0, 0))
+            self.layers[layer] = (total, total)
+
+    def progress(self) -> float:
+        if self.state == READY:
+            return 1.0
+        total = sum(t for _, t in self.layers.values())
+        if not total:
+            return 0.0
+        return sum(c for c, _ in self.layers.values()) / total
+
+    def to_dict(self):
+        return {
+            "state": self.state,
+            "progress": round(self.progress(), 3),
+            "digest": self.digest,
+            "error": self.error,
+            "seconds": round((self.finished or time.monotonic()) - self.started, 1),
+        }
+
+
+class ImagePuller:
+    """Pulls the images of one docker host.
+
+    Pulls stream progress for minutes, so they run in threads of their own
+    rather than taking the slots of short docker calls.
+    """
+
+    _task: Optional[asyncio.Task] = None
+
+    def __init__(self, client, images: Sequence[str], name=""):
+        self.name = name
+        self._client = client
+        self._statuses = {image: ImageStatus(image) for image in images}
+
+    def start(self):
+        """Starts preparing images. Must be called from the io loop."""
+        if self._task is None:
+            self._task = asyncio.ensure_future(
+                asyncio.gather(*(self._prepare(s) for s in self._statuses.values()))
+            )
+
+    def ready(self) -> bool:
+        """Returns whether every image is present."""
+        return all(s.state == READY for s in self._statuses.values())
+
+    def stats(self):
+        return {image: s.to_dict() for image, s in self._statuses.items()}
+
+    async def _prepare(self, status: ImageStatus):
+        if await self._present(status.image):
+            status.state = READY
+            status.finished = time.monotonic()
+            if is_pinned(status.image):
+                return
+            # Sessions can start on the local copy while the tag is refreshed.
+            logging.info("Refreshing image %s on %s", status.image, self.name)
+        while True:
+            try:
+                await self._pull(status)
+                return
+            except Exception as e:  # pylint: disable=broad-except
+                status.error = str(e)
+                if status.state == READY:
+                    logging.warning("Failed to refresh image %s: %s", status.image, e)
+                    return
+                status.state = FAILED
+                logging.error(
+                    "Failed to pull image %s on %s, retrying in %.0fs: %s",
+                    status.image,
+                    self.name,
+                    PULL_RETRY_DELAY,
+                    e,
+                )
+            await asyncio.sleep(PULL_RETRY_DELAY)
+
+    async def _present(self, image) -> bool:
+        loop = asyncio.get_event_loop()
+        try:
+            await loop.run_in_executor(None, self._client.api.inspect_image, image)
+        except docker.errors.ImageNotFound:
+            return False
+        except Exception as e:  # pylint: disable=broad-except
+            logging.warning("Failed to inspect image %s on %s: %s", image, self.name, e)
+            return False
+        return True
+
+    async def _pull(self, status: ImageStatus):
+        if status.state != READY:
+            status.state = PULLING
+            logging.info("Pulling image %s on %s", status.image, self.name)
+        status.started = time.monotonic()
+        status.layers.clear()
+        repository, reference = parse(status.image)
+        loop = asyncio.get_event_loop()
+
+        def pull():
+            for event in self._client.api.pull(
+                repository, tag=reference, stream=True, decode=True
+            ):
+                if "error" in event:
+                    raise docker.errors.APIError(event["error"])
+                loop.call_soon_threadsafe(status.on_progress, event)
+
+        await loop.run_in_executor(None, pull)
+        status.state = READY
+        status.error = None
+        status.finished = time.monotonic()
+        logging.info(
+            "Image %s on %s is ready, digest %s, pull took %.1fs",
+            status.image,
+            self.name,
+            status.digest,
+            status.finished - status.started,
+        )
@@ -1,156 +1,951 @@
-from concurrent.futures import ThreadPoolExecutor
+import abc
+import asyncio
+import collections
+import contextlib
 import logging
-import os
-import uuid
+import re
 import socket
+import urllib.parse
+import uuid
 import time
 
-from typing import Optional
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
 
 import docker
+import requests
+
+from . import docker_jobs
+from . import images
+from . import metrics
+from . import readiness
+from . import reaper
 
-# For executing dockere commands out of main io loop.
-EXECUTOR = ThreadPoolExecutor(max_workers=4)
+# For executing docker commands out of main io loop. Shared by every MusicBox
+# so the number of concurrent calls to the daemon stays bounded.
+SCHEDULER = docker_jobs.JobScheduler(max_concurrency=4)
 
+# Removes the containers and networks of stopped MusicBoxes.
+REAPER = reaper.Reaper(SCHEDULER)
+
+# Client of the local docker daemon, the "local" placement host.
 CLIENT = docker.client.from_env()
 
 
-SSH_PORT_NAME = "22/tcp"
-MP3_PORT_NAME = "8090/tcp"
-WEBSSH_PORT_NAME = "2222/tcp"
+SSH_PORT = 22
+SSH_PORT_NAME = f"{SSH_PORT}/tcp"
+MP3_PORT = 8090
+MP3_PORT_NAME = f"{MP3_PORT}/tcp"
+MP3_PATH = "/stream.mp3"
 
-WEBSSH_CONFIG_PATH = os.path.join(
-    os.path.dirname(__file__), "resources/webssh_config.json"
-)
+SSH_LOGIN = "root"
+SSH_PASSWORD = "algorave"
 
+# May be pinned by digest, e.g. "parabolala/supertidebox@sha256:...".
 SUPERTIDEBOX_IMAGE = "parabolala/supertidebox:3"
-WEBSSH2_IMAGE = "parabolala/webssh2:1"
+
+# When a SUPERTIDEBOX_IMAGE container is ready, whichever repository or
+# mirror the image comes from.
+SUPERTIDEBOX_READINESS = readiness.Rule(
+    log_marker=b"success: sshd",
+    log_path="/tmp/supervisord.log",
+    port_name=SSH_PORT_NAME,
+    timeout=15.0,
+)
+
+# Host where ports published by the local daemon can be reached.
+PROBE_HOST = "127.0.0.1"
+
+# Whether this process can reach containers of the local daemon by their
+# address on the session network, e.g. when it runs on the docker host itself
+# rather than in a container or on Docker Desktop. Otherwise terminals and
+# audio relays connect to the published ports.
+ROUTE_TO_SESSION_NETWORK = False
+
+# Resources a single MusicBox is expected to use. Hosts are not given more
+# sessions than their CPUs and memory fit.
+SESSION_CPUS = 0.5
+SESSION_MEMORY = 512 * 1024 * 1024
+
+# How often docker hosts are asked for their capacity.
+HOST_REFRESH_INTERVAL = 30.0
+
+START_PHASE_SECONDS = metrics.histogram(
+    "multitidal_musicbox_start_phase_seconds",
+    "Duration of the phases of starting a MusicBox.",
+    labels=("phase",),
+)
+
+# How often the pools check whether they need refilling or trimming.
+POOL_MAINTENANCE_INTERVAL = 5.0
+
+# Label put on networks created by a NetworkPool. The value is the pool id.
+NETWORK_POOL_LABEL = "multitidal.network_pool"
+
+# Labels put on containers and networks so a restarted server finds the ones
+# it left behind.
+SERVER_LABEL = "multitidal.server"
+SERVER_INSTANCE_LABEL = "multitidal.server_instance"
+WORKER_LABEL = "multitidal.worker"
+# Put on containers started for a known session. The value is the session id.
+SESSION_LABEL = "multitidal.session"
+
+# Identifies this server's resources on docker hosts shared with other servers.
+# Keep it across restarts for sessions to be adopted.
+SERVER_ID = socket.gethostname()
+# Identifies resources created by this run of the server.
+SERVER_INSTANCE_ID = str(uuid.uuid4())
+# This worker process and the number of workers. Set by server.py.
+WORKER_ID = 0
+WORKERS = 1
+
+# Containers of boxes handed out by the warm pool are renamed to record their
+# session, since labels can't change after a container is created.
+CONTAINER_NAME_RE = re.compile(r"^/?multitidal-s(\d+)-")
 
 
 class Error(Exception):
     pass
 
 
-class MusicBox:
-    id: int
-    network: Optional[docker.models.networks.Network] = None
-    hostname: str
+class NetworkPool:
+    """Leases isolated bridge networks to MusicBoxes.
+
+    Up to `size` free networks are created ahead of time. Released networks are
+    scrubbed of leftover endpoints and reused; networks that fail scrubbing or
+    exceed `size` are removed. Networks carrying this pool's label but not
+    tracked by it in two consecutive garbage collection passes are leaked and
+    get removed.
+    """
+
+    _free: Deque[docker.models.networks.Network]
+    _leased: Dict[str, docker.models.networks.Network]
+    _maintenance_task: Optional[asyncio.Task] = None
+
+    def __init__(self, client, size=0):
+        self.size = size
+        self.pool_id = str(uuid.uuid4())
+        self._client = client
+        self._free = collections.deque()
+        self._leased = {}
+        self._suspects = set()
+        self._creating = 0
+        self._stopped = False
+
+        self._created = 0
+        self._removed = 0
+        self._reused = 0
+        self._scrub_failures = 0
+        self._collected = 0
+
+    def start(self):
+        """Starts background maintenance. Must be called from the io loop."""
+        if self._maintenance_task is None:
+            self._maintenance_task = asyncio.ensure_future(self._maintain())
+
+    async def lease(self, priority=docker_jobs.START):
+        if self._free:
+            network = self._free.popleft()
+            self._reused += 1
+        else:
+            network = await self._create(priority)
+        self._leased[network.id] = network
+        return network
+
+    def adopt(self, network):
+        """Tracks a network leased by an earlier run of the server."""
+        self._leased[network.id] = network
+
+    async def release(self, network):
+        try:
+            if self._stopped or len(self._free) >= self.size:
+                await self._remove(network)
+                return
+            try:
+                await _docker(_scrub_network, network, priority=docker_jobs.STOP)
+            except Error:
+                logging.exception("Failed to scrub network %s", network.name)
+                self._scrub_failures += 1
+                await self._remove(network)
+                return
+            self._free.append(network)
+        finally:
+            self._leased.pop(network.id, None)
+
+    def stats(self):
+        return {
+            "size": self.size,
+            "free": len(self._free),
+            "leased": len(self._leased),
+            "creating": self._creating,
+            "created": self._created,
+            "removed": self._removed,
+            "reused": self._reused,
+            "scrub_failures": self._scrub_failures,
+            "collected": self._collected,
+        }
+
+    async def _create(self, priority):
+        self._creating += 1
+        try:
+            network = await _docker(
+                self._client.networks.create,
+                name=f"multitidal-{uuid.uuid4()}",
+                driver="bridge",
+                labels={NETWORK_POOL_LABEL: self.pool_id, **resource_labels()},
+                priority=priority,
+            )
+        finally:
+            self._creating -= 1
+        self._created += 1
+        return network
+
+    async def _remove(self, network):
+        try:
+            await _docker(network.remove, priority=docker_jobs.STOP)
+        except Error:
+            # Picked up by garbage collection later.
+            logging.exception("Failed to remove network %s", network.name)
+            return
+        self._removed += 1
+
+    async def _fill(self):
+        while not self._stopped and len(self._free) + self._creating < self.size:
+            self._free.append(await self._create(docker_jobs.SPECULATIVE))
+
+    async def collect_garbage(self):
+        networks = await _docker(
+            self._client.networks.list,
+            filters={"label": f"{NETWORK_POOL_LABEL}={self.pool_id}"},
+            priority=docker_jobs.SPECULATIVE,
+        )
+        known = set(self._leased) | {n.id for n in self._free}
+        untracked = {n.id: n for n in networks if n.id not in known}
+        # A network may be listed between its creation and being tracked, so
+        # only collect it when it is still untracked on the next pass.
+        leaked = [n for i, n in untracked.items() if i in self._suspects]
+        self._suspects = set(untracked)
+        for network in leaked:
+            self._suspects.discard(network.id)
+            logging.info("Removing leaked network %s", network.name)
+            try:
+                await _docker(_scrub_network, network, priority=docker_jobs.STOP)
+            except Error:
+                logging.exception("Failed to scrub network %s", network.name)
+                continue
+            await self._remove(network)
+            self._collected += 1
+
+    async def _maintain(self):
+        while not self._stopped:
+            try:
+                await self._fill()
+                await self.collect_garbage()
+            except Exception:  # pylint: disable=broad-except
+                logging.exception("Network pool maintenance failed")
+            await asyncio.sleep(POOL_MAINTENANCE_INTERVAL)
+
+    async def stop(self):
+        self._stopped = True
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            self._maintenance_task = None
+        free, self._free = list(self._free), collections.deque()
+        await asyncio.gather(*(self._remove(n) for n in free))
+
+
+class Host:
+    """A docker daemon MusicBoxes can be placed on.
+
+    Capacity is taken from the daemon's reported CPUs and memory and divided
+    between sessions by the SESSION_CPUS and SESSION_MEMORY estimates.
+    """
+
+    cpus: Optional[float] = None
+    memory: Optional[int] = None
+    containers_running = 0
+    healthy = True
+
+    def __init__(
+        self,
+        name,
+        client,
+        *,
+        public_hostname=None,
+        probe_host=PROBE_HOST,
+        route_to_networks=False,
+        max_sessions=None,
+        network_pool_size=0,
+    ):
+        """Describes a docker host.
+
+        Args:
+          name: name used in logs and stats.
+          client: docker client of the host's daemon.
+          public_hostname: host name browsers reach published ports on. The
+            host name of the request is used if None.
+          probe_host: host name this process reaches published ports on.
+          route_to_networks: whether this process can reach containers by
+            their address on the session network.
+          max_sessions: limit on sessions regardless of resources.
+          network_pool_size: number of networks created ahead of time.
+        """
+        self.name = name
+        self.client = client
+        self.public_hostname = public_hostname
+        self.probe_host = probe_host
+        self.route_to_networks = route_to_networks
+        self.max_sessions = max_sessions
+        self.network_pool = NetworkPool(client, size=network_pool_size)
+        self.images = images.ImagePuller(client, [SUPERTIDEBOX_IMAGE], name=name)
+        self.sessions = 0
+        # Sessions whose containers are paused. They hold memory but no CPU.
+        self.paused = 0
+
+    @classmethod
+    def from_url(cls, url, **kwargs):
+        """Creates a host from "local" or a docker daemon URL."""
+        if url == "local":
+            return cls(
+                "local", CLIENT, route_to_networks=ROUTE_TO_SESSION_NETWORK, **kwargs
+            )
+        hostname = urllib.parse.urlparse(url).hostname
+        return cls(
+            url,
+            docker.DockerClient(base_url=url),
+            public_hostname=hostname,
+            probe_host=hostname,
+            **kwargs,
+        )
+
+    def load(self, extra_sessions=0) -> float:
+        """Returns the fraction of capacity used with `extra_sessions` more."""
+        sessions = self.sessions + extra_sessions
+        loads = []
+        if self.cpus:
+            loads.append((sessions - self.paused) * SESSION_CPUS / self.cpus)
+        if self.memory:
+            loads.append(sessions * SESSION_MEMORY / self.memory)
+        if self.max_sessions:
+            loads.append(sessions / self.max_sessions)
+        return max(loads, default=0.0)
+
+    def has_headroom(self, max_load=1.0) -> bool:
+        return (
+            self.healthy
+            and self.images.ready()
+            and self.load(extra_sessions=1) <= max_load
+        )
+
+    async def refresh(self):
+        try:
+            info = await _docker(self.client.info, priority=docker_jobs.SPECULATIVE)
+        except Exception as e:  # pylint: disable=broad-except
+            if self.healthy:
+                logging.warning("Docker host %s is unavailable: %s", self.name, e)
+            self.healthy = False
+            return
+        self.cpus = info.get("NCPU")
+        self.memory = info.get("MemTotal")
+        self.containers_running = info.get("ContainersRunning", 0)
+        self.healthy = True
+
+    def stats(self):
+        return {
+            "healthy": self.healthy,
+            "sessions": self.sessions,
+            "paused": self.paused,
+            "load": self.load(),
+            "cpus": self.cpus,
+            "memory": self.memory,
+            "containers_running": self.containers_running,
+            "networks": self.network_pool.stats(),
+            "images": self.images.stats(),
+        }
+
+
+def least_loaded(hosts: Sequence[Host]) -> Host:
+    """Spreads sessions evenly over hosts."""
+    return min(hosts, key=lambda h: h.load())
+
+
+def bin_packing(hosts: Sequence[Host]) -> Host:
+    """Fills the busiest host first so idle hosts can be shut down."""
+    return max(hosts, key=lambda h: h.load())
+
+
+PLACEMENT_POLICIES: Dict[str, Callable[[Sequence[Host]], Host]] = {
+    "least_loaded": least_loaded,
+    "bin_packing": bin_packing,
+}
+
+
+class Placement:
+    """Chooses the docker host for each new MusicBox."""
+
+    _refresh_task: Optional[asyncio.Task] = None
+
+    def __init__(self, hosts: Sequence[Host], policy=least_loaded):
+        self.hosts = list(hosts)
+        self.policy = policy
+
+    def start(self):
+        """Starts background maintenance. Must be called from the io loop."""
+        for host in self.hosts:
+            host.network_pool.start()
+            host.images.start()
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.ensure_future(self._refresh())
+
+    def acquire(self) -> Host:
+        candidates = [h for h in self.hosts if h.has_headroom()]
+        if not candidates:
+            raise Error("No docker host has room for another session")
+        host = self.policy(candidates)
+        host.sessions += 1
+        return host
+
+    def has_headroom(self, max_load=1.0) -> bool:
+        """Returns whether some host can take another session."""
+        return any(h.has_headroom(max_load) for h in self.hosts)
+
+    @staticmethod
+    def release(host: Host):
+        host.sessions -= 1
+
+    def stats(self):
+        return {h.name: h.stats() for h in self.hosts}
+
+    async def _refresh(self):
+        while True:
+            await asyncio.gather(*(h.refresh() for h in self.hosts))
+            await asyncio.sleep(HOST_REFRESH_INTERVAL)
+
+    async def stop(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        await asyncio.gather(*(h.network_pool.stop() for h in self.hosts))
+
+
+PLACEMENT = Placement([Host.from_url("local")])
+
+
+class Instance(abc.ABC):
+    """A MusicBox as sessions see it, whatever runs it."""
+
+    hostname: Optional[str] = None
     ssh_port: int
     mp3_port: int
-    webssh_port: int
+    paused = False
+    # Seconds spent in each phase of the last start.
+    timings: Dict[str, float]
+
+    @abc.abstractmethod
+    async def start(self, hostname, priority=docker_jobs.START):
+        """Starts the instance.
+
+        Raises:
+          Error: the instance could not be started. It is cleaned up.
+        """
+
+    @abc.abstractmethod
+    async def stop(self):
+        pass
+
+    @abc.abstractmethod
+    async def pause(self):
+        pass
+
+    @abc.abstractmethod
+    async def resume(self):
+        pass
+
+    @abc.abstractmethod
+    def assign_hostname(self, hostname):
+        pass
+
+    def assign_session(self, session_id):
+        """Records the session the instance runs for, before or after start."""
+
+    @abc.abstractmethod
+    def get_ssh_address(self):
+        pass
+
+    @abc.abstractmethod
+    def get_mp3_address(self):
+        pass
+
+
+class Backend(abc.ABC):
+    """Creates instances and maintains what they run on."""
+
+    @abc.abstractmethod
+    def new_instance(self) -> Instance:
+        pass
+
+    def start(self):
+        """Starts background maintenance. Must be called from the io loop."""
+
+    async def reconcile(self) -> Dict[int, Instance]:
+        """Adopts instances an earlier run of this worker left running.
+
+        Returns:
+          The healthy instances by the id of the session they ran for.
+        """
+        return {}
+
+    async def stop(self):
+        pass
+
+    def has_capacity(self, max_load=1.0) -> bool:
+        """Returns whether another instance can be started."""
+        del max_load
+        return True
+
+    def image_status(self):
+        """Returns whether instances can start and the images' progress."""
+        return {"ready": True, "hosts": {}}
+
+    def stats(self):
+        return {}
+
+
+class DockerBackend(Backend):
+    """Runs instances as docker containers on the PLACEMENT hosts."""
+
+    def new_instance(self) -> Instance:
+        return MusicBox()
+
+    def start(self):
+        PLACEMENT.start()
+
+    async def reconcile(self) -> Dict[int, Instance]:
+        """Adopts containers left by an earlier run and removes orphans.
+
+        Hosts are listed in parallel and healthy containers are adopted as soon
+        as they are inspected. Orphaned containers and networks are removed in
+        the background, so this doesn't wait for however many were left.
+        """
+        results = await asyncio.gather(
+            *(_reconcile_host(h) for h in PLACEMENT.hosts), return_exceptions=True
+        )
+        adopted: Dict[int, Instance] = {}
+        for host, result in zip(PLACEMENT.hosts, results):
+            if isinstance(result, BaseException):
+                logging.error(
+                    "Failed to reconcile docker host %s: %s", host.name, result
+                )
+                continue
+            for session_id, box in result:
+                if session_id in adopted:
+                    logging.warning("Found two containers of session %d", session_id)
+                    asyncio.ensure_future(box.stop())
+                else:
+                    adopted[session_id] = box
+        return adopted
+
+    async def stop(self):
+        await REAPER.drain()
+        await PLACEMENT.stop()
+
+    def has_capacity(self, max_load=1.0) -> bool:
+        return PLACEMENT.has_headroom(max_load)
+
+    def image_status(self):
+        return {
+            "ready": any(h.images.ready() for h in PLACEMENT.hosts),
+            "hosts": {h.name: h.images.stats() for h in PLACEMENT.hosts},
+        }
+
+    def stats(self):
+        return PLACEMENT.stats()
+
+
+BACKEND: Backend = DockerBackend()
+
+
+class MusicBox(Instance):
+    id: str
+    host: Optional[Host] = None
+    network: Optional[docker.models.networks.Network] = None
+    session_id: Optional[int] = None
 
     tidal_container: docker.models.containers.Container = None
-    webssh_container: docker.models.containers.Container = None
 
     _cleaned_up = True
+    # Scheduling priority of the docker calls made while starting.
+    _priority = docker_jobs.START
 
-    def _supertidebox_container(self):
-        t_cont = CLIENT.containers.run(
-            image=SUPERTIDEBOX_IMAGE,
-            ports={
-                "22/tcp": ("0.0.0.0", None),
-                "8090/tcp": ("0.0.0.0", None),
-            },
-            detach=True,
-            network=self.network.id,
-            shm_size="128m",
-        )
-        # Resolve autoassigned ports.
-        t_cont = CLIENT.containers.get(t_cont.id)
+    @contextlib.contextmanager
+    def _phase(self, name):
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.timings[name] = time.monotonic() - started
+            START_PHASE_SECONDS.labels(name).observe(self.timings[name])
+
+    async def _supertidebox_container(self):
+        with self._phase("tidebox_run"):
+            self.tidal_container = t_cont = await _docker(
+                _run_container,
+                self.host.client,
+                SUPERTIDEBOX_IMAGE,
+                priority=self._priority,
+                ports=[SSH_PORT_NAME, MP3_PORT_NAME],
+                network=self.network,
+                labels=self._labels(),
+                name=(
+                    None
+                    if self.session_id is None
+                    else _container_name(self.session_id)
+                ),
+                shm_size="128m",
+            )
         logging.info("Started tidebox container.")
-        wait_for_healthy_tidebox(t_cont)
-        return t_cont
+        with self._phase("tidebox_ready"):
+            await wait_ready(self.host, t_cont, SUPERTIDEBOX_READINESS)
+
+    @classmethod
+    def adopt(cls, host, container, network, session_id):
+        """Wraps a container of session `session_id` left by an earlier run."""
+        box = cls()
+        box.id = container.name
+        box.session_id = session_id
+        box.timings = {}
+        box.ssh_port = get_port(container, SSH_PORT_NAME)
+        box.mp3_port = get_port(container, MP3_PORT_NAME)
+        box.tidal_container = container
+        box.network = network
+        box.host = host
+        box.paused = container.status == "paused"
+        box.assign_hostname(None)
+        box._cleaned_up = False
+        host.sessions += 1
+        if box.paused:
+            host.paused += 1
+        host.network_pool.adopt(network)
+        return box
+
+    def _labels(self):
+        labels = resource_labels()
+        if self.session_id is not None:
+            labels[SESSION_LABEL] = str(self.session_id)
+        return labels
 
-    def start(self, hostname):
+    async def start(self, hostname, priority=docker_jobs.START):
+        self.id = str(uuid.uuid4())
         self._cleaned_up = False
+        self._priority = priority
+        self.timings = {}
         try:
-            network = CLIENT.networks.create(name=str(uuid.uuid4()))
-            self.id = network.name
-            self.network = network
-
-            self.tidal_container = t_cont = self._supertidebox_container()
-
-            w_cont = CLIENT.containers.run(
-                image=WEBSSH2_IMAGE,
-                ports={
-                    "2222/tcp": ("0.0.0.0", None),
-                },
-                detach=True,
-                network=network.id,
-                volumes={
-                    WEBSSH_CONFIG_PATH: {"bind": "/usr/src/config.json", "mode": "ro"},
-                },
-            )
-            # Resolve autoassigned ports.
-            w_cont = CLIENT.containers.get(w_cont.id)
-            logging.info("Started webssh2 container")
-            wait_for_healthy_webssh(w_cont)
-            self.webssh_container = w_cont
-
-            self.hostname = hostname
-            self.ssh_port = get_port(t_cont, SSH_PORT_NAME)
-            self.mp3_port = get_port(t_cont, MP3_PORT_NAME)
-            self.webssh_port = get_port(w_cont, WEBSSH_PORT_NAME)
+            self.host = PLACEMENT.acquire()
+            with self._phase("total"):
+                with self._phase("network"):
+                    self.network = await self.host.network_pool.lease(self._priority)
+
+                await self._supertidebox_container()
+
+            self.assign_hostname(hostname)
+            self.ssh_port = get_port(self.tidal_container, SSH_PORT_NAME)
+            self.mp3_port = get_port(self.tidal_container, MP3_PORT_NAME)
         except Exception as e:
-            self.stop()
+            await self.stop()
             raise Error("Failed to start container") from e
+        logging.info(
+            "MusicBox %s started on %s: %s",
+            self.id,
+            self.host.name,
+            ", ".join(f"{k}={v:.2f}s" for k, v in self.timings.items()),
+        )
+
+    async def stop(self):
+        """Hands the container and network to the reaper and returns.
 
-    def stop(self):
+        The host counts the box until its container is gone.
+        """
         if self._cleaned_up:
             return
         self._cleaned_up = True
 
-        if self.tidal_container:
-            logging.info("Stopping tidal container")
-            self.tidal_container.stop()
-            self.tidal_container.remove()
-            self.tidal_container = None
-        if self.webssh_container:
-            logging.info("Stopping webssh container")
-            self.webssh_container.stop()
-            self.webssh_container.remove()
-        if self.network:
-            self.network.remove()
+        if self.host:
+            REAPER.spawn(
+                _teardown(self.host, self.tidal_container, self.network, self.paused)
+            )
+        self.tidal_container = None
+        self.network = None
+        self.host = None
+        self.paused = False
+
+    async def pause(self):
+        """Freezes the container's processes, keeping their memory."""
+        if self.paused or not self.tidal_container:
+            return
+        await _docker(self.tidal_container.pause)
+        self.paused = True
+        self.host.paused += 1
+
+    async def resume(self):
+        if not self.paused:
+            return
+        # Somebody is waiting for the session, so this goes ahead of starts.
+        await _docker(self.tidal_container.unpause, priority=docker_jobs.STOP)
+        self.paused = False
+        self.host.paused -= 1
+
+    def assign_hostname(self, hostname):
+        """Sets the host name for URLs unless the docker host has its own."""
+        self.hostname = self.host.public_hostname or hostname
+
+    def assign_session(self, session_id):
+        self.session_id = session_id
+        if self.tidal_container is not None:
+            asyncio.ensure_future(self._record_session())
+
+    async def _record_session(self):
+        try:
+            await _docker(self.tidal_container.rename, _container_name(self.session_id))
+        except Error as e:
+            # The session can't be adopted after a restart, nothing else.
+            logging.warning("Failed to rename container of %s: %s", self.id, e)
+
+    def _address(self, port, published_port):
+        if self.host.route_to_networks:
+            networks = self.tidal_container.attrs["NetworkSettings"]["Networks"]
+            ip = networks.get(self.network.name, {}).get("IPAddress")
+            if ip:
+                return (ip, port)
+        return (self.host.probe_host, published_port)
+
+    def get_ssh_address(self):
+        """Returns (host, port) where this process can reach the SSH server."""
+        return self._address(SSH_PORT, self.ssh_port)
+
+    def get_mp3_address(self):
+        """Returns (host, port) where this process can reach the mp3 stream."""
+        return self._address(MP3_PORT, self.mp3_port)
 
     def __del__(self):
         if not self._cleaned_up:
             logging.warning("Instance being destroyed without cleaning up")
 
 
+async def _docker(fn, *args, priority=docker_jobs.START, **kwargs):
+    """Runs a blocking docker SDK call out of the io loop.
+
+    Raises:
+      Error: if the call failed or timed out.
+    """
+    try:
+        return await SCHEDULER.run(fn, *args, priority=priority, **kwargs)
+    except (
+        docker_jobs.Error,
+        docker.errors.DockerException,
+        requests.RequestException,
+    ) as e:
+        raise Error(str(e)) from e
+
+
+def _run_container(
+    client, image, ports: List[str], network, *, labels, name, **host_config
+):
+    """Creates and starts a container with published `ports`.
+
+    Uses the low level API so the container is inspected once, after it has
+    started and its ports are assigned. `containers.run` followed by
+    `containers.get` inspects it twice.
+    """
+    api = client.api
+    container_id = api.create_container(
+        image,
+        detach=True,
+        labels=labels,
+        name=name,
+        ports=[tuple(p.split("/")) for p in ports],
+        host_config=api.create_host_config(
+            port_bindings={p: ("0.0.0.0", None) for p in ports},
+            network_mode=network.id,
+            **host_config,
+        ),
+    )["Id"]
+    try:
+        api.start(container_id)
+        return client.containers.prepare_model(api.inspect_container(container_id))
+    except Exception:
+        api.remove_container(container_id, force=True)
+        raise
+
+
+def _scrub_network(network):
+    """Disconnects any endpoints left on `network`."""
+    network.reload()
+    for container_id in network.attrs.get("Containers") or {}:
+        network.disconnect(container_id, force=True)
+
+
+def resource_labels():
+    """Returns the labels identifying resources created by this process."""
+    return {
+        SERVER_LABEL: SERVER_ID,
+        SERVER_INSTANCE_LABEL: SERVER_INSTANCE_ID,
+        WORKER_LABEL: str(WORKER_ID),
+    }
+
+
+def _container_name(session_id):
+    return f"multitidal-s{session_id}-{uuid.uuid4().hex[:8]}"
+
+
+def _left_behind(labels) -> bool:
+    """Returns whether a resource with `labels` was left by an earlier run.
+
+    Only resources of this worker are considered, so workers running at the
+    same time leave each other's alone. The first worker also takes those of
+    workers beyond the current number of workers.
+    """
+    labels = labels or {}
+    if labels.get(SERVER_INSTANCE_LABEL) == SERVER_INSTANCE_ID:
+        return False
+    try:
+        worker = int(labels.get(WORKER_LABEL, 0))
+    except ValueError:
+        return False
+    return worker == WORKER_ID or (WORKER_ID == 0 and worker >= WORKERS)
+
+
+def _session_of(labels, names) -> Optional[int]:
+    value = (labels or {}).get(SESSION_LABEL)
+    if value is not None and value.isdigit():
+        return int(value)
+    for name in names:
+        match = CONTAINER_NAME_RE.match(name)
+        if match:
+            return int(match.group(1))
+    return None
+
+
+async def _reconcile_host(host) -> List[Tuple[int, MusicBox]]:
+    """Adopts healthy containers left on `host` and removes the rest."""
+    server_filter = {"label": f"{SERVER_LABEL}={SERVER_ID}"}
+    summaries, networks = await asyncio.gather(
+        _docker(
+            host.client.api.containers,
+            all=True,
+            filters=server_filter,
+            priority=docker_jobs.STOP,
+        ),
+        _docker(
+            host.client.networks.list,
+            filters=server_filter,
+            priority=docker_jobs.STOP,
+        ),
+    )
+    networks = {n.name: n for n in networks if _left_behind(n.attrs.get("Labels"))}
+    candidates = []
+    orphans = []
+    for summary in summaries:
+        if not _left_behind(summary.get("Labels")):
+            continue
+        session_id = _session_of(summary.get("Labels"), summary.get("Names") or [])
+        attached = (summary.get("NetworkSettings") or {}).get("Networks") or {}
+        network = next((networks[n] for n in attached if n in networks), None)
+        if (
+            session_id is None
+            or network is None
+            or summary.get("State") not in ("running", "paused")
+        ):
+            orphans.append(summary["Id"])
+        else:
+            candidates.append((session_id, summary["Id"], network))
+
+    results = await asyncio.gather(
+        *(_adopt_container(host, *c) for c in candidates), return_exceptions=True
+    )
+    adopted = []
+    for (session_id, container_id, _), result in zip(candidates, results):
+        if isinstance(result, MusicBox):
+            adopted.append((session_id, result))
+        else:
+            logging.info("Not adopting container %s: %s", container_id[:12], result)
+            orphans.append(container_id)
+    used = {box.network.id for _, box in adopted if box.network is not None}
+    REAPER.spawn(
+        _remove_orphans(
+            host, orphans, [n for n in networks.values() if n.id not in used]
+        )
+    )
+    logging.info(
+        "Adopted %d containers on %s, removing %d orphans",
+        len(adopted),
+        host.name,
+        len(orphans),
+    )
+    return adopted
+
+
+async def _adopt_container(host, session_id, container_id, network) -> MusicBox:
+    attrs = await _docker(
+        host.client.api.inspect_container, container_id, priority=docker_jobs.STOP
+    )
+    container = host.client.containers.prepare_model(attrs)
+    if container.status == "running":
+        address = (host.probe_host, get_port(container, SSH_PORT_NAME))
+        if not await readiness.check_port_open(*address):
+            raise Error("SSH port is closed")
+    return MusicBox.adopt(host, container, network, session_id)
+
+
+async def _remove_orphans(host, container_ids, networks):
+    """Removes containers and then networks left by an earlier run.
+
+    Runs at speculative priority so sessions starting meanwhile go first.
+    """
+    priority = docker_jobs.SPECULATIVE
+
+    async def remove_network(network):
+        with contextlib.suppress(Error):
+            await _docker(_scrub_network, network, priority=priority)
+        await REAPER.remove_network(network, priority)
+
+    await asyncio.gather(
+        *(REAPER.remove_container(host.client, c, priority) for c in container_ids)
+    )
+    await asyncio.gather(*(remove_network(n) for n in networks))
+
+
+async def _teardown(host, container, network, paused):
+    """Removes the container and network of a stopped MusicBox."""
+    try:
+        if container is not None:
+            logging.info("Removing tidal container %s", container.short_id)
+            if paused:
+                # Older daemons refuse to kill paused containers.
+                with contextlib.suppress(Error):
+                    await _docker(
+                        container.unpause,
+                        priority=docker_jobs.STOP,
+                        timeout=REAPER.timeout,
+                    )
+            await REAPER.remove_container(host.client, container.id)
+        if network is not None:
+            await host.network_pool.release(network)
+    finally:
+        if paused:
+            host.paused -= 1
+        PLACEMENT.release(host)
+
+
 def get_port(container, port_name):
     return int(container.ports[port_name][0]["HostPort"])
 
 
-def check_port_open(port):
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    result = sock.connect_ex(("127.0.0.1", port))
-    sock.close()
-    return result == 0
-
-
-def wait_for_healthy_tidebox(container):
-    attempts = 30
-    while attempts > 0:
-        unused_exit_code, output = container.exec_run(["cat", "/tmp/supervisord.log"])
-        if b"success: sshd" in output:
-            logging.info("SSHd started inside tidal")
-            break
-        logging.info("SSHd still not started remaining: %d", attempts)
-        attempts -= 1
-        time.sleep(0.5)
-    else:
-        raise Exception("Tidal container SSH port never became healthy")
-
-
-def wait_for_healthy_webssh(container):
-    attempts = 30
-    while attempts > 0:
-        log_output = container.logs()
-        if b"WebSSH2 service listening on 0.0.0.0:2222" in log_output:
-            logging.info("WebSSH listening started inside tidal")
-            break
-        logging.info("WebSSH still not started remaining: %d", attempts)
-        attempts -= 1
-        time.sleep(0.5)
-    else:
-        raise Exception("Tidal container SSH port never became healthy")
+async def wait_ready(host, container, rule: readiness.Rule):
+    try:
+        await readiness.wait_ready(
+            host.client,
+            container,
+            rule,
+            probe_address=(host.probe_host, get_port(container, rule.port_name)),
+        )
+    except readiness.Error as e:
+        raise Error(str(e)) from e
@@ -0,0 +1,276 @@
+#!/usr/bin/env python
+"""Load generator simulating many keyboards, observers and list watchers.
+
+Without --url it starts a server in this process on fake instances, so it runs
+offline and without docker:
+
+    $ python multitidal/loadgen.py --keyboards=200 --observers=200 --watchers=50
+
+Fan-out latency is measured for session state events, from the first client
+that received an event to every other client receiving the same event.
+"""
+
+import asyncio
+import collections
+import json
+import logging
+import random
+import resource
+import time
+
+from typing import Dict, List, Tuple
+
+import tornado.httpserver
+import tornado.ioloop
+import tornado.netutil
+import tornado.options
+import tornado.websocket
+
+from tornado.options import define, options
+
+from multitidal import fake_backend
+from multitidal import logs
+from multitidal import protocol
+from multitidal import server_lib
+
+define("url", default=None, help="server to load, in-process if unset", type=str)
+define("keyboards", default=100, help="number of /console clients", type=int)
+define("observers", default=100, help="number of /observe/new clients", type=int)
+define("watchers", default=20, help="number of /watch_list clients", type=int)
+define("duration", default=30.0, help="seconds to keep clients connected", type=float)
+define("ramp", default=5.0, help="seconds over which clients connect", type=float)
+define(
+    "keystroke_rate",
+    default=5.0,
+    help="keystroke messages per second from each keyboard",
+    type=float,
+)
+define(
+    "server_pid",
+    default=None,
+    help="process id of the --url server to report memory of",
+    type=int,
+)
+define("fake_start_latency", default=1.0, help="seconds a fake start takes", type=float)
+define("fake_stop_latency", default=0.2, help="seconds a fake stop takes", type=float)
+define("fake_failure_rate", default=0.0, help="fraction of failing starts", type=float)
+define("fake_capacity", default=None, help="fake instances that fit at once", type=int)
+define("max_sessions", default=None, help="running sessions in-process", type=int)
+define("seed", default=None, help="random seed for repeatable runs", type=int)
+
+
+class Report:
+    start_latencies: List[float]
+    # Receipt times of each (session id, state) event.
+    receipts: Dict[Tuple[int, str], List[float]]
+
+    def __init__(self):
+        self.start_latencies = []
+        self.start_failures = 0
+        self.first_started = None
+        self.last_started = None
+        self.receipts = collections.defaultdict(list)
+        self.counts = collections.Counter()
+
+    def on_event(self, seen, session):
+        """Records a client receiving a session state.
+
+        Args:
+          seen: events the client already received. Queue position updates
+            repeat the state, only the first message counts.
+          session: the session dict of the message.
+        """
+        event = (session["id"], session["state"])
+        if event not in seen:
+            seen.add(event)
+            self.receipts[event].append(time.monotonic())
+
+    def on_started(self, started_at):
+        now = time.monotonic()
+        self.start_latencies.append(now - started_at)
+        if self.first_started is None:
+            self.first_started = started_at
+        self.last_started = now
+
+    def fanout_latencies(self):
+        latencies = []
+        for times in self.receipts.values():
+            first = min(times)
+            latencies.extend(t - first for t in times)
+        return sorted(latencies)
+
+    def lines(self):
+        starts = sorted(self.start_latencies)
+        lines = [
+            f"sessions started: {len(starts)}, failed: {self.start_failures}",
+        ]
+        if starts:
+            elapsed = self.last_started - self.first_started
+            lines.append(f"start throughput: {len(starts) / elapsed:.1f} sessions/s")
+            lines.append("start latency: " + _percentiles(starts))
+        fanout = self.fanout_latencies()
+        if fanout:
+            lines.append(f"fan-out latency over {len(fanout)} receipts: ")
+            lines[-1] += _percentiles(fanout)
+        lines.extend(f"{k}: {v}" for k, v in sorted(self.counts.items()))
+        return lines
+
+
+def _percentiles(values):
+    def at(fraction):
+        return values[min(len(values) - 1, int(len(values) * fraction))]
+
+    return ", ".join(
+        f"p{int(f * 100)}={at(f) * 1000:.1f}ms" for f in (0.5, 0.9, 0.99, 1.0)
+    )
+
+
+async def _connect(url, report, **kwargs):
+    try:
+        return await tornado.websocket.websocket_connect(url, **kwargs)
+    except OSError as e:
+        report.counts["connect errors"] += 1
+        logging.warning("Failed to connect to %s: %s", url, e)
+        return None
+
+
+async def keyboard(ws_url, report, deadline):
+    ws = await _connect(
+        ws_url + "/console", report, subprotocols=[protocol.BINARY_SUBPROTOCOL]
+    )
+    if ws is None:
+        return
+    binary = ws.selected_subprotocol == protocol.BINARY_SUBPROTOCOL
+
+    async def drain():
+        while await ws.read_message() is not None:
+            report.counts["console messages received"] += 1
+
+    reader = asyncio.ensure_future(drain())
+    try:
+        while time.monotonic() < deadline:
+            await asyncio.sleep(random.expovariate(options.keystroke_rate))
+            if binary:
+                await ws.write_message(
+                    protocol.encode(protocol.KEYSTROKES, b"d1"), binary=True
+                )
+            else:
+                await ws.write_message(
+                    json.dumps({"client_command": "keystrokes", "keystrokes": "d1"})
+                )
+            report.counts["keystroke messages sent"] += 1
+    except tornado.websocket.WebSocketClosedError:
+        report.counts["console disconnects"] += 1
+    finally:
+        ws.close()
+        reader.cancel()
+
+
+async def observer(ws_url, report, deadline):
+    started_at = time.monotonic()
+    ws = await _connect(ws_url + "/observe/new", report)
+    if ws is None:
+        return
+    seen = set()
+    while time.monotonic() < deadline:
+        try:
+            raw = await asyncio.wait_for(ws.read_message(), deadline - time.monotonic())
+        except asyncio.TimeoutError:
+            break
+        if raw is None:
+            report.counts["observer disconnects"] += 1
+            break
+        msg = json.loads(raw)
+        report.counts["observer messages received"] += 1
+        if "session" in msg:
+            report.on_event(seen, msg["session"])
+        if msg.get("status") == "connected":
+            report.on_started(started_at)
+        elif msg.get("status") == "error":
+            report.start_failures += 1
+    ws.close()
+
+
+async def watcher(ws_url, report, deadline):
+    ws = await _connect(ws_url + "/watch_list", report)
+    if ws is None:
+        return
+    seen = set()
+    while time.monotonic() < deadline:
+        try:
+            raw = await asyncio.wait_for(ws.read_message(), deadline - time.monotonic())
+        except asyncio.TimeoutError:
+            break
+        if raw is None:
+            report.counts["watcher disconnects"] += 1
+            break
+        msg = json.loads(raw)
+        report.counts["watcher messages received"] += 1
+        if msg.get("command") == "session_state":
+            report.on_event(seen, msg["session"])
+    ws.close()
+
+
+def _memory_lines(pid):
+    if pid is None:
+        peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return [f"peak RSS of server and clients: {peak_kb / 1024:.1f} MiB"]
+    lines = []
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith(("VmRSS", "VmHWM")):
+                    lines.append("server " + " ".join(line.split()))
+    except OSError as e:
+        lines.append(f"server memory unavailable: {e}")
+    return lines
+
+
+async def run():
+    if options.url is None:
+        fake_backend.install(
+            fake_backend.FakeBackend(
+                start_latency=options.fake_start_latency,
+                stop_latency=options.fake_stop_latency,
+                start_failure_rate=options.fake_failure_rate,
+                capacity=options.fake_capacity,
+                seed=options.seed,
+            )
+        )
+        app = server_lib.Application(max_sessions=options.max_sessions, debug=False)
+        sockets = tornado.netutil.bind_sockets(0, address="127.0.0.1")
+        tornado.httpserver.HTTPServer(app).add_sockets(sockets)
+        port = sockets[0].getsockname()[1]
+        ws_url = f"ws://127.0.0.1:{port}"
+    else:
+        app = None
+        ws_url = options.url.replace("http", "ws", 1)
+
+    report = Report()
+    deadline = time.monotonic() + options.ramp + options.duration
+    clients = (
+        [watcher] * options.watchers
+        + [observer] * options.observers
+        + [keyboard] * options.keyboards
+    )
+    tasks = []
+    for client in clients:
+        tasks.append(asyncio.ensure_future(client(ws_url, report, deadline)))
+        await asyncio.sleep(options.ramp / len(clients))
+    await asyncio.gather(*tasks)
+
+    for line in report.lines() + _memory_lines(options.server_pid):
+        print(line)
+    if app is not None:
+        await app.stop()
+
+
+def main():
+    tornado.options.parse_command_line()
+    logs.install()
+    random.seed(options.seed)
+    tornado.ioloop.IOLoop.current().run_sync(run)
+
+
+if __name__ == "__main__":
+    main()
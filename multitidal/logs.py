@@ -0,0 +1,146 @@
+"""Keeps log I/O off the io loop.
+
+`install` moves the root logger's handlers to a background thread. Records
+reach it through a bounded queue, and records that don't fit are dropped and
+counted rather than blocking the loop. Per-message logs go through
+`RateLimitedLog`, which passes a few records of each message per second.
+
+Records about a session carry its id in a `session_id` attribute, set with
+`extra=session_extra(session_id)`.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import time
+
+from typing import Dict, List, Optional
+
+from . import metrics
+
+QUEUE_SIZE = 10000
+# Records of each rate limited message passed per second.
+MESSAGE_RATE = 10
+
+DROPPED = metrics.counter(
+    "multitidal_log_records_dropped_total",
+    "Log records dropped because the log queue was full or sampled out.",
+    labels=("reason",),
+)
+
+
+def session_extra(session_id):
+    return {"session_id": session_id}
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            DROPPED.labels("queue_full").inc()
+
+
+class _Listener(logging.handlers.QueueListener):
+    def enqueue_sentinel(self):
+        # Waits for room rather than failing on a full queue at exit.
+        self.queue.put(self._sentinel)
+
+    def stop(self):
+        if self._thread is not None:
+            super().stop()
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line."""
+
+    def __init__(self, worker_id=None):
+        super().__init__()
+        self.worker_id = worker_id
+
+    def format(self, record):
+        entry = {
+            "time": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        session_id = getattr(record, "session_id", None)
+        if session_id is not None:
+            entry["session_id"] = session_id
+        if self.worker_id is not None:
+            entry["worker"] = self.worker_id
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry)
+
+
+def install(
+    queue_size=QUEUE_SIZE, json_format=False, worker_id=None
+) -> Optional[logging.handlers.QueueListener]:
+    """Moves the root logger's handlers behind a queue.
+
+    Must be called in the process that logs, after forking: the writer thread
+    doesn't survive a fork.
+
+    Args:
+      queue_size: records waiting to be written before new ones are dropped.
+      json_format: whether to write records as JSON objects.
+      worker_id: worker id added to JSON records.
+
+    Returns:
+      The listener writing the records, None if there are no handlers.
+    """
+    root = logging.getLogger()
+    handlers: List[logging.Handler] = root.handlers[:]
+    if not handlers:
+        return None
+    for handler in handlers:
+        root.removeHandler(handler)
+        if json_format:
+            handler.setFormatter(JsonFormatter(worker_id))
+    records: queue.Queue = queue.Queue(queue_size)
+    root.addHandler(_DroppingQueueHandler(records))
+    listener = _Listener(records, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+class RateLimitedLog:
+    """Logs at most `rate` records of each message per second.
+
+    Records over the limit are counted as dropped. The next record of the
+    message that passes reports how many were left out.
+    """
+
+    # Start of the current second and records passed and dropped in it, by
+    # message.
+    _windows: Dict[str, List]
+
+    def __init__(self, logger=None, rate=MESSAGE_RATE):
+        self.logger = logger or logging.getLogger()
+        self.rate = rate
+        self._windows = {}
+
+    def log(self, level, msg, *args, session_id=None):
+        if not self.logger.isEnabledFor(level):
+            return
+        now = time.monotonic()
+        window = self._windows.get(msg)
+        if window is None or now - window[0] >= 1.0:
+            dropped = window[2] if window is not None else 0
+            window = self._windows[msg] = [now, 0, 0]
+            if dropped:
+                msg += f" ({dropped} similar records dropped)"
+        if window[1] >= self.rate:
+            window[2] += 1
+            DROPPED.labels("sampled").inc()
+            return
+        window[1] += 1
+        self.logger.log(level, msg, *args, extra=session_extra(session_id))
+
+    def info(self, msg, *args, session_id=None):
+        self.log(logging.INFO, msg, *args, session_id=session_id)
@@ -3,11 +3,22 @@ class SessionsList extends React.Component {
         super(props);
         this.state = {sessions: []};
         this.ws = null;
+        // Last change received, to only get the missed ones on reconnect.
+        this.epoch = null;
+        this.version = null;
+        this.reconnectTimeout = null;
     }
 
     componentDidMount() {
-        this.ws = new WebSocket(
-            "ws://" + window.location.host + "/watch_list");
+        this.connect();
+    }
+
+    connect() {
+        let url = "ws://" + window.location.host + "/watch_list";
+        if (this.epoch !== null) {
+            url += "?since=" + this.version + "&epoch=" + this.epoch;
+        }
+        this.ws = new WebSocket(url);
         // Connection opened
         this.ws.addEventListener('open', function (event) {
             console.log('opened');
@@ -19,27 +30,48 @@ class SessionsList extends React.Component {
             var json = JSON.parse(event.data)
             that.onMessage(json);
         });
+        this.ws.addEventListener('close', function (event) {
+            if (that.ws !== null) {
+                that.reconnectTimeout = setTimeout(() => that.connect(), 1000);
+            }
+        });
     }
 
     componentWillUnmount(){
-        this.ws.close();
+        clearTimeout(this.reconnectTimeout);
+        const ws = this.ws;
         this.ws = null;
+        ws.close();
+    }
+
+    static listEntry(session) {
+        return {
+            id: session.id,
+            state: session.state,
+            kb: session.kb,
+            kb_pressed: false,
+            timeout: null
+        };
     }
 
     onMessage(message) {
         console.log(message);
         console.log(this.state.sessions);
         
-        if (message.command === "session_add") {
-            var newSessions = this.state.sessions.slice(0);
-            newSessions.push(
-                             {
-                                 id: message.session.id,
-                                 state: message.session.state,
-                                 kb: message.session.kb,
-                                 kb_pressed: false,
-                                 timeout: null
-                             });
+        if (message.epoch !== undefined) {
+            this.epoch = message.epoch;
+        }
+        if (message.version !== undefined) {
+            this.version = message.version;
+        }
+        if (message.command === "snapshot") {
+            this.setState({
+                sessions: message.sessions.map(SessionsList.listEntry)
+            });
+        } else if (message.command === "session_add") {
+            var newSessions = this.state.sessions.filter((session) =>
+                session.id !== message.session.id);
+            newSessions.push(SessionsList.listEntry(message.session));
             this.setState({
                 sessions: newSessions
             });
@@ -56,9 +88,9 @@ class SessionsList extends React.Component {
             this.setState({
                 sessions: newSessions
             });
-        } else if (message.command === "keystrokes") {
-            const s_id = message.keystrokes.session.id;
-            this.activateSession(s_id);
+        } else if (message.command === "activity") {
+            message.sessions.forEach(
+                (activity) => this.activateSession(activity.id));
         }
     }
 
@@ -201,11 +233,14 @@ class SessionsList extends React.Component {
   }
 }
 
+// Key of the token that re-attaches a reloaded page to the session it created.
+const RESUME_TOKEN_KEY = 'multitidal.resume_token';
+
 class Main extends React.Component {
     constructor(props) {
         super(props);
         this.state = {
-            session: null
+            session: sessionStorage.getItem(RESUME_TOKEN_KEY) ? {id: 'new'} : null
         };
     }
 
@@ -217,6 +252,7 @@ class Main extends React.Component {
     }
 
     cancelObservation() {
+        sessionStorage.removeItem(RESUME_TOKEN_KEY);
         this.observeSession(null);
     }
 
@@ -298,12 +334,19 @@ class Observation extends React.Component {
         this.state = {
             ssh_url: null,
             mp3_url: null,
-            lost_keyboard: false
+            queue_position: null,
+            lost_keyboard: false,
+            rejected: null
         };
     }
 
     componentDidMount() {
-        this.ws = new WebSocket("ws://" + window.location.host + "/observe/" + this.props.session.id);
+        let url = "ws://" + window.location.host + "/observe/" + this.props.session.id;
+        const token = sessionStorage.getItem(RESUME_TOKEN_KEY);
+        if (this.props.session.id === 'new' && token) {
+            url += "?resume=" + encodeURIComponent(token);
+        }
+        this.ws = new WebSocket(url);
         // Connection opened
         this.ws.addEventListener('open', function (event) {
             console.log('opened');
@@ -325,21 +368,38 @@ class Observation extends React.Component {
     onMessage(data) {
         console.log("Got message");
         console.log(data);
-        if (data.status === 'connected') {
+        if (data.resume_token) {
+            sessionStorage.setItem(RESUME_TOKEN_KEY, data.resume_token);
+        } else if (data.status === 'unknown session' || data.status === 'error') {
+            sessionStorage.removeItem(RESUME_TOKEN_KEY);
+        } else if (data.status === 'connected') {
             this.setState({
                 ssh_url: data.ssh.url,
                 mp3_url: data.mp3.url,
+                queue_position: null,
                 lost_keyboard: this.props.session.kb && !data.session.kb
             });
+        } else if (data.status === 'queued') {
+            this.setState({queue_position: data.position});
+        } else if (data.status === 'rejected') {
+            this.setState({rejected: data.reason});
+        } else if (data.status === 'connecting') {
+            this.setState({queue_position: null});
         }
     }
 
     render() {
         let body;
-        if (!this.state.ssh_url) {
+        if (this.state.rejected) {
+            body = (<div className="alert alert-warning" role="alert">
+                      {this.state.rejected}
+                    </div>);
+        } else if (!this.state.ssh_url) {
             body = (<div className="progress">
                        <div className="progress-bar progress-bar-success progress-bar-striped active" role="progressbar" aria-valuenow="100" aria-valuemin="0" aria-valuemax="100" style={{width: "100%"}} >
-                           Loading...
+                           {this.state.queue_position ?
+                            "Waiting for a free slot, " + this.state.queue_position + " in line..." :
+                            "Loading..."}
                        </div>
                      </div>
                     );
@@ -0,0 +1,197 @@
+"""In-process metrics rendered in the Prometheus text format.
+
+Metrics are created once at import time with `counter`, `gauge` and
+`histogram`. Recording is a dict lookup and an addition, so it can sit on hot
+paths; code on the hottest ones can keep the child returned by `labels`.
+"""
+
+import bisect
+import math
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Buckets for durations in seconds, from a fast docker call to a slow start.
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+# Buckets for sizes in bytes.
+BYTES_BUCKETS = (0, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+class Error(Exception):
+    pass
+
+
+class _Value:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+    def dec(self, amount=1):
+        self.value -= amount
+
+    def set(self, value):
+        self.value = value
+
+
+class _Buckets:
+    __slots__ = ("_bounds", "counts", "sum")
+
+    def __init__(self, bounds):
+        self._bounds = bounds
+        # The last count is the +Inf bucket.
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self._bounds, value)] += 1
+        self.sum += value
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name, documentation, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._function: Optional[Callable[[], Dict[Tuple[str, ...], float]]] = None
+        if not self.label_names:
+            self._default = self.labels()
+
+    def labels(self, *values):
+        """Returns the child for `values` of the metric's labels."""
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.label_names):
+                raise Error(f"{self.name} takes labels {self.label_names}")
+            child = self._children[key] = self._new_child()
+        return child
+
+    def set_function(self, fn):
+        """Makes the metric report `fn()`, a dict of label values to values."""
+        self._function = fn
+
+    def _new_child(self):
+        return _Value()
+
+    def _label_str(self, key, extra=()):
+        pairs = list(zip(self.label_names, key)) + list(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        if self._function is not None:
+            values = self._function()
+        else:
+            values = {k: c.value for k, c in self._children.items()}
+        for key, value in sorted(values.items()):
+            lines.append(f"{self.name}{self._label_str(key)} {_number(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def inc(self, amount=1):
+        self._default.inc(amount)
+
+
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def inc(self, amount=1):
+        self._default.inc(amount)
+
+    def dec(self, amount=1):
+        self._default.dec(amount)
+
+    def set(self, value):
+        self._default.set(value)
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(self, name, documentation, labels=(), buckets=DURATION_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labels)
+
+    def _new_child(self):
+        return _Buckets(self.buckets)
+
+    def observe(self, value):
+        self._default.observe(value)
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        bounds = [_number(b) for b in self.buckets] + ["+Inf"]
+        for key, child in sorted(self._children.items()):
+            total = 0
+            for bound, count in zip(bounds, child.counts):
+                total += count
+                labels = self._label_str(key, [("le", bound)])
+                lines.append(f"{self.name}_bucket{labels} {total}")
+            labels = self._label_str(key)
+            lines.append(f"{self.name}_sum{labels} {_number(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {total}")
+        return lines
+
+
+class Registry:
+    _metrics: Dict[str, _Metric]
+
+    def __init__(self):
+        self._metrics = {}
+
+    def register(self, metric):
+        if metric.name in self._metrics:
+            raise Error(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def counter(name, documentation, labels=()) -> Counter:
+    return REGISTRY.register(Counter(name, documentation, labels))
+
+
+def gauge(name, documentation, labels=()) -> Gauge:
+    return REGISTRY.register(Gauge(name, documentation, labels))
+
+
+def histogram(name, documentation, labels=(), buckets=DURATION_BUCKETS) -> Histogram:
+    return REGISTRY.register(Histogram(name, documentation, labels, buckets))
+
+
+def _escape(value):
+    return str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _number(value):
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if value.is_integer():
+            return str(int(value))
+    return repr(value)
@@ -0,0 +1,27 @@
+"""Binary framing for /console messages.
+
+Clients that offer BINARY_SUBPROTOCOL when connecting send binary frames made
+of a type byte followed by the payload. Clients that don't keep sending JSON
+messages.
+"""
+
+from typing import Tuple
+
+BINARY_SUBPROTOCOL = "multitidal.binary.v1"
+
+# Frame types.
+KEYSTROKES = 0x01
+
+
+class Error(Exception):
+    pass
+
+
+def encode(frame_type: int, payload: bytes) -> bytes:
+    return bytes((frame_type,)) + payload
+
+
+def decode(frame: bytes) -> Tuple[int, bytes]:
+    if not frame:
+        raise Error("Empty frame")
+    return frame[0], frame[1:]
@@ -0,0 +1,16 @@
+import pytest
+
+from multitidal import protocol
+
+
+def test_decodes_encoded_frames():
+    frame = protocol.encode(protocol.KEYSTROKES, b"ab")
+
+    assert frame == b"\x01ab"
+    assert protocol.decode(frame) == (protocol.KEYSTROKES, b"ab")
+    assert protocol.decode(b"\x01") == (protocol.KEYSTROKES, b"")
+
+
+def test_refuses_empty_frames():
+    with pytest.raises(protocol.Error):
+        protocol.decode(b"")
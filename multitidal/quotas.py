@@ -0,0 +1,156 @@
+"""Per-client limits on sessions and websocket messages.
+
+Clients are told apart by address. Each one gets token buckets for creating
+sessions and for sending messages, and a cap on sessions it has at once.
+Resuming a session by its token doesn't create one, so it isn't limited.
+Sessions only count while somebody is attached and they haven't failed.
+"""
+
+import json
+import time
+
+from typing import Dict
+
+from . import metrics
+
+# Sessions a client can create per second on average, and at once.
+SESSION_RATE = 0.2
+SESSION_BURST = 5
+# Sessions a client can have at once.
+MAX_SESSIONS = 3
+# Websocket messages a client can send per second on average, and at once.
+MESSAGE_RATE = 200.0
+MESSAGE_BURST = 400
+
+# Websocket close code of rejected clients.
+POLICY_VIOLATION = 1008
+
+REJECTED = metrics.counter(
+    "multitidal_quota_rejections_total",
+    "Sessions and messages rejected by per-client limits.",
+    labels=("limit",),
+)
+CLIENTS = metrics.gauge("multitidal_quota_clients", "Clients tracked by quotas.")
+
+
+class Error(Exception):
+    pass
+
+
+class TokenBucket:
+    def __init__(self, rate, burst, now):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = now
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self, now) -> bool:
+        self._refill(now)
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    def is_full(self, now) -> bool:
+        self._refill(now)
+        return self.tokens >= self.burst
+
+
+class _Client:
+    def __init__(self, quotas, now):
+        self.session_bucket = TokenBucket(
+            quotas.session_rate, quotas.session_burst, now
+        )
+        self.message_bucket = TokenBucket(
+            quotas.message_rate, quotas.message_burst, now
+        )
+        self.sessions = 0
+
+
+class Quotas:
+    """Limits of every client, 0 turns a limit off."""
+
+    _clients: Dict[str, _Client]
+
+    def __init__(
+        self,
+        *,
+        session_rate=SESSION_RATE,
+        session_burst=SESSION_BURST,
+        max_sessions=MAX_SESSIONS,
+        message_rate=MESSAGE_RATE,
+        message_burst=MESSAGE_BURST,
+    ):
+        self.session_rate = session_rate
+        self.session_burst = session_burst
+        self.max_sessions = max_sessions
+        self.message_rate = message_rate
+        self.message_burst = message_burst
+        self._clients = {}
+        CLIENTS.set_function(lambda: {(): len(self._clients)})
+
+    def _client(self, key, now) -> _Client:
+        client = self._clients.get(key)
+        if client is None:
+            client = self._clients[key] = _Client(self, now)
+        return client
+
+    def acquire_session(self, key):
+        """Counts in a session created by client `key`.
+
+        Raises:
+          Error: with the reason if the client is over a limit.
+        """
+        now = time.monotonic()
+        client = self._client(key, now)
+        if self.max_sessions and client.sessions >= self.max_sessions:
+            REJECTED.labels("concurrent_sessions").inc()
+            raise Error(f"Too many sessions, close one of your {client.sessions} first")
+        if self.session_rate and not client.session_bucket.take(now):
+            REJECTED.labels("session_rate").inc()
+            raise Error("Too many new sessions, try again later")
+        client.sessions += 1
+
+    def hold_session(self, key):
+        """Counts in a session of client `key` again, without limits.
+
+        For sessions somebody attached to again after they were released.
+        """
+        self._client(key, time.monotonic()).sessions += 1
+
+    def release_session(self, key):
+        client = self._clients.get(key)
+        if client is not None:
+            client.sessions = max(0, client.sessions - 1)
+
+    def allow_message(self, key) -> bool:
+        if not self.message_rate:
+            return True
+        now = time.monotonic()
+        if self._client(key, now).message_bucket.take(now):
+            return True
+        REJECTED.labels("message_rate").inc()
+        return False
+
+    def prune(self):
+        """Forgets clients without sessions that are back to full buckets."""
+        now = time.monotonic()
+        for key, client in list(self._clients.items()):
+            if (
+                not client.sessions
+                and client.session_bucket.is_full(now)
+                and client.message_bucket.is_full(now)
+            ):
+                del self._clients[key]
+
+
+def reject(handler, reason):
+    """Tells a websocket client why it is disconnected, and disconnects it."""
+    if handler.ws_connection is None:
+        return
+    handler.write_message(json.dumps({"status": "rejected", "reason": reason}))
+    handler.close(POLICY_VIOLATION, reason)
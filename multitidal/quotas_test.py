@@ -0,0 +1,52 @@
+import pytest
+
+from multitidal import quotas
+
+
+def test_token_bucket_refills_at_its_rate_up_to_its_burst():
+    bucket = quotas.TokenBucket(rate=2.0, burst=3, now=0.0)
+
+    assert [bucket.take(0.0) for _ in range(4)] == [True, True, True, False]
+    assert bucket.take(0.5)
+    assert not bucket.take(0.5)
+    assert not bucket.is_full(1.0)
+    assert bucket.is_full(10.0)
+    assert [bucket.take(10.0) for _ in range(4)] == [True, True, True, False]
+
+
+def test_limits_sessions_a_client_has_at_once():
+    limits = quotas.Quotas(session_rate=0, max_sessions=2)
+    limits.acquire_session("a")
+    limits.acquire_session("a")
+    with pytest.raises(quotas.Error):
+        limits.acquire_session("a")
+    limits.acquire_session("b")
+
+    limits.release_session("a")
+    limits.acquire_session("a")
+
+
+def test_resumed_sessions_count_without_limits():
+    limits = quotas.Quotas(session_rate=0, max_sessions=1)
+    limits.acquire_session("a")
+    limits.hold_session("a")
+    limits.release_session("a")
+    with pytest.raises(quotas.Error):
+        limits.acquire_session("a")
+
+
+def test_limits_new_sessions_per_second():
+    limits = quotas.Quotas(session_rate=0.001, session_burst=2, max_sessions=0)
+    limits.acquire_session("a")
+    limits.acquire_session("a")
+    with pytest.raises(quotas.Error):
+        limits.acquire_session("a")
+
+
+def test_limits_messages_and_forgets_idle_clients():
+    limits = quotas.Quotas(message_rate=0.001, message_burst=2)
+    assert [limits.allow_message("a") for _ in range(3)] == [True, True, False]
+    assert limits.allow_message("b")
+
+    limits.prune()
+    assert not limits.allow_message("a")
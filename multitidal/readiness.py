@@ -0,0 +1,218 @@
+"""Waits for containers to become ready without polling the docker API.
+
+Readiness is declared per image with a `Rule`. A container is ready once the
+rule's log marker shows up and the rule's port accepts TCP connections. Log
+output is streamed with `follow` so the marker is noticed as soon as it is
+written, and a docker event watch fails the wait as soon as the container dies.
+"""
+
+import asyncio
+import logging
+import threading
+
+from typing import Optional, Tuple
+
+# Delay between TCP connection attempts once the log marker was seen.
+PORT_PROBE_INTERVAL = 0.05
+
+
+class Error(Exception):
+    pass
+
+
+class Rule:
+    def __init__(
+        self,
+        log_marker: bytes,
+        log_path: Optional[str] = None,
+        port_name: Optional[str] = None,
+        timeout: float = 15.0,
+    ):
+        """Describes when a container of some image is ready.
+
+        Args:
+          log_marker: bytes the container writes once it has started.
+          log_path: file inside the container to watch for the marker. The
+            container's stdout and stderr are watched if None.
+          port_name: container port, e.g. "22/tcp", that has to accept
+            connections on its published host port.
+          timeout: seconds to wait before giving up.
+        """
+        self.log_marker = log_marker
+        self.log_path = log_path
+        self.port_name = port_name
+        self.timeout = timeout
+
+
+async def check_port_open(host, port) -> bool:
+    try:
+        _, writer = await asyncio.open_connection(host, port)
+    except OSError:
+        return False
+    writer.close()
+    return True
+
+
+async def wait_for_port(host, port):
+    while not await check_port_open(host, port):
+        await asyncio.sleep(PORT_PROBE_INTERVAL)
+
+
+class _Watcher:
+    """Runs a blocking docker stream in a daemon thread.
+
+    The stream is consumed until `on_chunk` returns True. The watch then
+    resolves `future` with `result`.
+    """
+
+    def __init__(self, loop, future, name):
+        self._loop = loop
+        self._future = future
+        self._name = name
+        self._closed = threading.Event()
+        self._stream = None
+
+    def start(self, open_stream, on_chunk, result):
+        threading.Thread(
+            target=self._run,
+            args=(open_stream, on_chunk, result),
+            name=self._name,
+            daemon=True,
+        ).start()
+
+    def _resolve(self, result=None, exc=None):
+        def resolve():
+            if self._future.done():
+                return
+            if exc is not None:
+                self._future.set_exception(exc)
+            else:
+                self._future.set_result(result)
+
+        if not self._closed.is_set():
+            self._loop.call_soon_threadsafe(resolve)
+
+    def _run(self, open_stream, on_chunk, result):
+        try:
+            self._stream = open_stream()
+            if self._closed.is_set():
+                self.close()
+                return
+            for chunk in self._stream:
+                if self._closed.is_set():
+                    return
+                if on_chunk(chunk):
+                    self._resolve(result=result)
+                    return
+        except Exception as e:  # pylint: disable=broad-except
+            self._resolve(exc=Error(f"{self._name} failed: {e}"))
+            return
+        self._resolve(exc=Error(f"{self._name} ended unexpectedly"))
+
+    def close(self):
+        self._closed.set()
+        close = getattr(self._stream, "close", None)
+        if close is not None:
+            try:
+                close()
+            except Exception:  # pylint: disable=broad-except
+                pass
+
+
+def _marker_scanner(marker: bytes):
+    tail = b""
+
+    def on_chunk(chunk):
+        nonlocal tail
+        data = tail + chunk
+        if marker in data:
+            return True
+        # Keep enough bytes to match a marker split between chunks.
+        tail = data[-len(marker) :]
+        return False
+
+    return on_chunk
+
+
+def _log_stream(client, container, rule: Rule):
+    if rule.log_path is None:
+        return container.logs(stream=True, follow=True)
+    # `timeout` bounds the lifetime of the tail in case the watch is abandoned.
+    exec_id = client.api.exec_create(
+        container.id,
+        [
+            "timeout",
+            str(int(rule.timeout) + 1),
+            "tail",
+            "-F",
+            "-n",
+            "+1",
+            rule.log_path,
+        ],
+    )["Id"]
+    return client.api.exec_start(exec_id, stream=True)
+
+
+async def wait_ready(
+    client, container, rule: Rule, probe_address: Optional[Tuple[str, int]] = None
+):
+    """Returns once `container` satisfies `rule`.
+
+    Args:
+      client: docker client the container belongs to.
+      container: a started container.
+      rule: readiness rule for the container's image.
+      probe_address: (host, port) where `rule.port_name` is published.
+
+    Raises:
+      Error: the container died or did not become ready within the timeout.
+    """
+    loop = asyncio.get_event_loop()
+    log_seen = loop.create_future()
+    died = loop.create_future()
+    logs = _Watcher(loop, log_seen, f"logs of {container.short_id}")
+    events = _Watcher(loop, died, f"events of {container.short_id}")
+    logs.start(
+        lambda: _log_stream(client, container, rule),
+        _marker_scanner(rule.log_marker),
+        None,
+    )
+    events.start(
+        lambda: client.events(
+            filters={"container": container.id, "event": ["die", "oom"]},
+            decode=True,
+        ),
+        lambda event: True,
+        Error(f"Container {container.short_id} exited before becoming ready"),
+    )
+
+    async def ready():
+        await log_seen
+        logging.info("Container %s logged its ready marker", container.short_id)
+        if rule.port_name is not None and probe_address is not None:
+            await wait_for_port(*probe_address)
+
+    ready_task = asyncio.ensure_future(ready())
+    try:
+        done, _ = await asyncio.wait(
+            [ready_task, died],
+            timeout=rule.timeout,
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        if ready_task in done:
+            ready_task.result()
+        elif died in done:
+            raise died.result()
+        else:
+            raise Error(
+                f"Container {container.short_id} not ready after {rule.timeout}s"
+            )
+    finally:
+        ready_task.cancel()
+        logs.close()
+        events.close()
+        for f in (log_seen, died):
+            if f.done() and not f.cancelled():
+                f.exception()  # Mark retrieved.
+            else:
+                f.cancel()
@@ -0,0 +1,118 @@
+"""Removes the docker resources of stopped sessions in the background.
+
+Stopping a session hands its container and network to the reaper and returns
+at once. Containers are force-removed, which kills them without the grace
+period `docker stop` waits for. Removals run concurrently, bounded by the
+docker job scheduler, and failed ones are retried.
+"""
+
+import asyncio
+import logging
+
+from typing import Set
+
+import docker
+
+from . import docker_jobs
+from . import metrics
+
+# Seconds before a single removal is abandoned and retried.
+REAP_TIMEOUT = 10.0
+REAP_ATTEMPTS = 3
+# Seconds before the first retry, doubled for every further one.
+RETRY_DELAY = 1.0
+
+REAPED = metrics.counter(
+    "multitidal_reaped_total",
+    "Docker resources the reaper removed, found gone or gave up on.",
+    labels=("resource", "result"),
+)
+PENDING = metrics.gauge(
+    "multitidal_reaper_pending", "Teardowns the reaper has not finished."
+)
+
+
+class Reaper:
+    _tasks: Set[asyncio.Future]
+
+    def __init__(self, scheduler, *, timeout=REAP_TIMEOUT, attempts=REAP_ATTEMPTS):
+        """Creates a reaper.
+
+        Args:
+          scheduler: docker_jobs.JobScheduler running the docker calls.
+          timeout: seconds before a single removal is abandoned.
+          attempts: number of times a removal is tried.
+        """
+        self._scheduler = scheduler
+        self.timeout = timeout
+        self.attempts = max(1, attempts)
+        self._tasks = set()
+        PENDING.set_function(lambda: {(): len(self._tasks)})
+
+    def spawn(self, coro):
+        """Runs the teardown `coro` in the background. `drain` waits for it."""
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._on_done)
+
+    def _on_done(self, task):
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logging.error("Teardown failed", exc_info=task.exception())
+
+    async def remove_container(
+        self, client, container_id, priority=docker_jobs.STOP
+    ) -> bool:
+        """Kills and removes a container.
+
+        Returns:
+          False if it could not be removed after all attempts.
+        """
+        return await self._retry(
+            "container",
+            container_id[:12],
+            client.api.remove_container,
+            container_id,
+            force=True,
+            priority=priority,
+        )
+
+    async def remove_network(self, network, priority=docker_jobs.STOP) -> bool:
+        return await self._retry(
+            "network", network.name, network.remove, priority=priority
+        )
+
+    async def _retry(self, resource, name, fn, *args, priority, **kwargs) -> bool:
+        for attempt in range(1, self.attempts + 1):
+            try:
+                await self._scheduler.run(
+                    fn, *args, priority=priority, timeout=self.timeout, **kwargs
+                )
+            except docker.errors.NotFound:
+                REAPED.labels(resource, "gone").inc()
+                return True
+            except Exception as e:  # pylint: disable=broad-except
+                logging.warning(
+                    "Failed to remove %s %s, attempt %d of %d: %s",
+                    resource,
+                    name,
+                    attempt,
+                    self.attempts,
+                    e,
+                )
+                if attempt < self.attempts:
+                    await asyncio.sleep(RETRY_DELAY * 2 ** (attempt - 1))
+                continue
+            REAPED.labels(resource, "removed").inc()
+            return True
+        logging.error("Giving up on removing %s %s", resource, name)
+        REAPED.labels(resource, "failed").inc()
+        return False
+
+    async def drain(self):
+        """Waits for every teardown, including ones spawned meanwhile."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def stats(self):
+        return {"pending": len(self._tasks)}
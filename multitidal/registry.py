@@ -0,0 +1,204 @@
+"""Session registry shared between worker processes.
+
+Every session is owned by the worker that created it. Workers publish their
+sessions' records and send each other events through the registry: the owner
+announces added, changed and removed sessions, and other workers ask the owner
+to count their observers in.
+"""
+
+import json
+import sqlite3
+import time
+
+from typing import Dict, List, NamedTuple, Optional
+
+# Events older than this many seconds are deleted.
+EVENT_RETENTION = 60.0
+
+# Event kinds.
+SESSION_ADD = "session_add"
+SESSION_STATE = "session_state"
+SESSION_REMOVE = "session_remove"
+ACTIVITY = "activity"
+OBSERVE = "observe"
+UNOBSERVE = "unobserve"
+TERMINAL_ATTACHED = "terminal_attached"
+
+
+class Event(NamedTuple):
+    origin: int
+    kind: str
+    session_id: Optional[int]
+    payload: dict
+
+
+class Registry:
+    """Registry for a single process. No other workers, so no events."""
+
+    def __init__(self, worker_id=0):
+        self.worker_id = worker_id
+        self._next_id = 0
+
+    def allocate_session_id(self) -> int:
+        session_id = self._next_id
+        self._next_id += 1
+        return session_id
+
+    def claim_session_id(self, session_id) -> bool:
+        """Takes `session_id` for a session adopted from an earlier run.
+
+        Returns:
+          False if the id was allocated since.
+        """
+        if session_id < self._next_id:
+            return False
+        self._next_id = session_id + 1
+        return True
+
+    def put_session(self, session_id, record: dict):
+        pass
+
+    def delete_session(self, session_id):
+        pass
+
+    def remote_sessions(self) -> Dict[int, dict]:
+        """Returns records of sessions owned by other workers by session id."""
+        return {}
+
+    def send(self, kind, session_id, payload=None, target=None):
+        """Sends an event to all other workers or to worker `target`."""
+
+    def receive(self) -> List[Event]:
+        """Returns events sent to this worker since the last call."""
+        return []
+
+    def trim(self):
+        """Deletes events every worker has had time to receive."""
+
+    def close(self):
+        pass
+
+
+class SqliteRegistry(Registry):
+    """Registry kept in an SQLite database in WAL mode.
+
+    Readers don't block the writer in WAL mode, so workers can poll for events
+    while another one writes.
+    """
+
+    def __init__(self, path, worker_id):
+        super().__init__(worker_id)
+        self._db = sqlite3.connect(path, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("PRAGMA busy_timeout=5000")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " owner INTEGER NOT NULL,"
+            " record TEXT NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS events ("
+            " seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " origin INTEGER NOT NULL,"
+            " target INTEGER,"
+            " kind TEXT NOT NULL,"
+            " session_id INTEGER,"
+            " payload TEXT NOT NULL,"
+            " created REAL NOT NULL)"
+        )
+        (last_seq,) = self._db.execute(
+            "SELECT COALESCE(MAX(seq), 0) FROM events"
+        ).fetchone()
+        self._last_seq = last_seq
+        self._forget_previous_incarnation()
+
+    def _forget_previous_incarnation(self):
+        """Drops sessions left behind by a worker with the same id."""
+        stale = [
+            row[0]
+            for row in self._db.execute(
+                "SELECT id FROM sessions WHERE owner = ?", (self.worker_id,)
+            )
+        ]
+        for session_id in stale:
+            self.delete_session(session_id)
+            self.send(SESSION_REMOVE, session_id, {"session": {"id": session_id}})
+
+    def allocate_session_id(self) -> int:
+        cursor = self._db.execute(
+            "INSERT INTO sessions (owner, record) VALUES (?, '{}')",
+            (self.worker_id,),
+        )
+        return cursor.lastrowid
+
+    def claim_session_id(self, session_id) -> bool:
+        try:
+            self._db.execute(
+                "INSERT INTO sessions (id, owner, record) VALUES (?, ?, '{}')",
+                (session_id, self.worker_id),
+            )
+        except sqlite3.IntegrityError:
+            return False
+        return True
+
+    def put_session(self, session_id, record: dict):
+        self._db.execute(
+            "UPDATE sessions SET record = ? WHERE id = ?",
+            (json.dumps(record), session_id),
+        )
+
+    def delete_session(self, session_id):
+        self._db.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+
+    def remote_sessions(self) -> Dict[int, dict]:
+        rows = self._db.execute(
+            "SELECT id, owner, record FROM sessions WHERE owner != ?",
+            (self.worker_id,),
+        )
+        sessions = {}
+        for session_id, owner, record in rows:
+            record = json.loads(record)
+            if record:
+                record["owner"] = owner
+                sessions[session_id] = record
+        return sessions
+
+    def send(self, kind, session_id, payload=None, target=None):
+        self._db.execute(
+            "INSERT INTO events"
+            " (origin, target, kind, session_id, payload, created)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                self.worker_id,
+                target,
+                kind,
+                session_id,
+                json.dumps(payload or {}),
+                time.time(),
+            ),
+        )
+
+    def receive(self) -> List[Event]:
+        rows = self._db.execute(
+            "SELECT seq, origin, kind, session_id, payload FROM events"
+            " WHERE seq > ? AND origin != ? AND (target IS NULL OR target = ?)"
+            " ORDER BY seq",
+            (self._last_seq, self.worker_id, self.worker_id),
+        ).fetchall()
+        if not rows:
+            return []
+        self._last_seq = rows[-1][0]
+        return [
+            Event(origin, kind, session_id, json.loads(payload))
+            for _, origin, kind, session_id, payload in rows
+        ]
+
+    def trim(self):
+        self._db.execute(
+            "DELETE FROM events WHERE created < ?", (time.time() - EVENT_RETENTION,)
+        )
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,52 @@
+from multitidal import registry
+
+
+def open_workers(tmp_path, count=2):
+    path = str(tmp_path / "registry.sqlite3")
+    return [registry.SqliteRegistry(path, worker_id) for worker_id in range(count)]
+
+
+def test_workers_allocate_distinct_ids_and_see_each_others_sessions(tmp_path):
+    first, second = open_workers(tmp_path)
+    a = first.allocate_session_id()
+    b = second.allocate_session_id()
+    first.put_session(a, {"session": {"id": a}})
+    second.put_session(b, {"session": {"id": b}})
+
+    assert a != b
+    assert first.remote_sessions() == {b: {"session": {"id": b}, "owner": 1}}
+    assert second.remote_sessions() == {a: {"session": {"id": a}, "owner": 0}}
+    assert not first.claim_session_id(b)
+
+
+def test_events_reach_other_workers_or_their_target(tmp_path):
+    first, second, third = open_workers(tmp_path, 3)
+    first.send(registry.SESSION_ADD, 1, {"session": {"id": 1}})
+    first.send(registry.OBSERVE, 1, target=2)
+
+    assert first.receive() == []
+    assert second.receive() == [
+        registry.Event(0, registry.SESSION_ADD, 1, {"session": {"id": 1}})
+    ]
+    assert third.receive() == [
+        registry.Event(0, registry.SESSION_ADD, 1, {"session": {"id": 1}}),
+        registry.Event(0, registry.OBSERVE, 1, {}),
+    ]
+    assert third.receive() == []
+
+
+def test_restarted_worker_drops_its_previous_sessions(tmp_path):
+    first, second = open_workers(tmp_path)
+    session_id = first.allocate_session_id()
+    first.put_session(session_id, {"session": {"id": session_id}})
+    first.close()
+
+    restarted = registry.SqliteRegistry(str(tmp_path / "registry.sqlite3"), 0)
+
+    assert not second.remote_sessions()
+    assert not restarted.remote_sessions()
+    assert second.receive() == [
+        registry.Event(
+            0, registry.SESSION_REMOVE, session_id, {"session": {"id": session_id}}
+        )
+    ]
@@ -1,32 +1,337 @@
 #!/usr/bin/env python
 import logging
+import os.path
+import signal
+import tempfile
 
 import docker
+import tornado.httpserver
 import tornado.ioloop
+import tornado.netutil
+import tornado.process
 import tornado.web
 
 from tornado.options import define, options
 
+from multitidal import audio_relay
+from multitidal import instance_manager
+from multitidal import logs
+from multitidal import quotas
+from multitidal import reaper
+from multitidal import registry
 from multitidal import server_lib
+from multitidal import sessions
 
 define("port", default=3000, help="run on the given port", type=int)
+define(
+    "workers",
+    default=1,
+    help="number of server processes sharing the port, 0 for one per CPU",
+    type=int,
+)
+define(
+    "registry_path",
+    default=None,
+    help="SQLite file holding the session registry shared by --workers",
+    type=str,
+)
+define(
+    "warm_pool_size",
+    default=0,
+    help="number of pre-started instances kept ready for new sessions",
+    type=int,
+)
+define(
+    "warm_pool_min_size",
+    default=0,
+    help="number of pre-started instances kept while no sessions are starting",
+    type=int,
+)
+define(
+    "warm_pool_idle_timeout",
+    default=300,
+    help="seconds without new sessions before the warm pool shrinks",
+    type=float,
+)
+
+define(
+    "max_sessions",
+    default=None,
+    help="maximum number of running sessions per process, more wait in a queue",
+    type=int,
+)
+define(
+    "max_host_load",
+    default=1.0,
+    help="fraction of docker host capacity above which new sessions wait in a queue",
+    type=float,
+)
+define(
+    "idle_pause_timeout",
+    default=0,
+    help="seconds without keystrokes or observer actions before a session's"
+    " containers are paused, 0 to never pause",
+    type=float,
+)
+define(
+    "session_grace",
+    default=sessions.SESSION_GRACE,
+    help="seconds a session keeps running after its observers and keyboard"
+    " left, for them to reconnect, 0 to release it at once",
+    type=float,
+)
+define(
+    "audio_buffer_bytes",
+    default=audio_relay.BUFFER_BYTES,
+    help="bytes of each session's mp3 stream buffered for listeners,"
+    " listeners further behind are dropped",
+    type=int,
+)
+define(
+    "audio_start_bytes",
+    default=audio_relay.START_BYTES,
+    help="bytes of buffered mp3 stream sent to new listeners at once,"
+    " more starts playback sooner but further behind",
+    type=int,
+)
+
+define(
+    "docker_concurrency",
+    default=4,
+    help="maximum number of docker API calls in flight at once",
+    type=int,
+)
+define(
+    "docker_timeout",
+    default=60,
+    help="seconds before a single docker API call is abandoned",
+    type=float,
+)
+define(
+    "reap_timeout",
+    default=reaper.REAP_TIMEOUT,
+    help="seconds before removing a stopped session's container is retried",
+    type=float,
+)
+define(
+    "reap_attempts",
+    default=reaper.REAP_ATTEMPTS,
+    help="number of times removing a stopped session's container is tried",
+    type=int,
+)
+define(
+    "network_pool_size",
+    default=4,
+    help="number of docker networks each process creates per docker host ahead of time",
+    type=int,
+)
+define(
+    "route_to_session_network",
+    default=instance_manager.ROUTE_TO_SESSION_NETWORK,
+    help="connect to sessions of the local docker daemon by their address on"
+    " the session network instead of their published ports, for a server"
+    " running on the docker host",
+    type=bool,
+)
+define(
+    "tidebox_image",
+    default=instance_manager.SUPERTIDEBOX_IMAGE,
+    help="image sessions run, pin it by digest as repository@sha256:..."
+    " for every host to run the same image",
+    type=str,
+)
+define(
+    "server_id",
+    default=instance_manager.SERVER_ID,
+    help="identifies this server's containers on shared docker hosts, keep it"
+    " across restarts to adopt the sessions left running",
+    type=str,
+)
+define(
+    "docker_hosts",
+    default="local",
+    help="comma-separated docker daemons to run sessions on,"
+    " 'local' or URLs like tcp://10.0.0.2:2375",
+    type=str,
+)
+define(
+    "placement_policy",
+    default="least_loaded",
+    help="how sessions are spread over --docker_hosts: "
+    + ", ".join(instance_manager.PLACEMENT_POLICIES),
+    type=str,
+)
+define(
+    "production",
+    default=False,
+    help="serve the bundle built by build_assets.py with long-lived caching,"
+    " and turn off debug mode",
+    type=bool,
+)
+define(
+    "quota_session_rate",
+    default=quotas.SESSION_RATE,
+    help="sessions each client can create per second on average, 0 for no limit",
+    type=float,
+)
+define(
+    "quota_session_burst",
+    default=quotas.SESSION_BURST,
+    help="sessions each client can create at once",
+    type=int,
+)
+define(
+    "quota_max_sessions",
+    default=quotas.MAX_SESSIONS,
+    help="sessions each client can have at once, 0 for no limit",
+    type=int,
+)
+define(
+    "quota_message_rate",
+    default=quotas.MESSAGE_RATE,
+    help="websocket messages each client can send per second on average,"
+    " 0 for no limit",
+    type=float,
+)
+define(
+    "quota_message_burst",
+    default=quotas.MESSAGE_BURST,
+    help="websocket messages each client can send at once",
+    type=int,
+)
+define(
+    "xheaders",
+    default=False,
+    help="take client addresses from X-Real-Ip or X-Forwarded-For headers of a"
+    " reverse proxy",
+    type=bool,
+)
+define(
+    "log_queue_size",
+    default=logs.QUEUE_SIZE,
+    help="log records waiting to be written before new ones are dropped",
+    type=int,
+)
+define(
+    "log_message_rate",
+    default=logs.MESSAGE_RATE,
+    help="records per second logged of each per-message log line",
+    type=int,
+)
+define("log_json", default=False, help="write logs as JSON lines", type=bool)
+define(
+    "host_max_sessions",
+    default=None,
+    help="maximum number of sessions on each docker host",
+    type=int,
+)
+
+
+def make_placement():
+    hosts = [
+        instance_manager.Host.from_url(
+            url.strip(),
+            max_sessions=options.host_max_sessions,
+            network_pool_size=options.network_pool_size,
+        )
+        for url in options.docker_hosts.split(",")
+        if url.strip()
+    ]
+    return instance_manager.Placement(
+        hosts, policy=instance_manager.PLACEMENT_POLICIES[options.placement_policy]
+    )
+
+
+def install_logging(worker_id=None):
+    logs.install(
+        queue_size=options.log_queue_size,
+        json_format=options.log_json,
+        worker_id=worker_id,
+    )
 
 
 def main():
-    try:
-        docker.client.from_env().ping()
-    except Exception:  # pylint: disable=broad-except
-        logging.error("Docker not responding")
-        return 1
     tornado.options.parse_command_line()
-    app = server_lib.Application()
-    app.listen(options.port)
-    print(f"Server started at port {options.port}")
+    if options.placement_policy not in instance_manager.PLACEMENT_POLICIES:
+        logging.error("Unknown placement policy %s", options.placement_policy)
+        return 1
+    for url in options.docker_hosts.split(","):
+        url = url.strip()
+        try:
+            if url == "local":
+                docker.client.from_env().ping()
+            elif url:
+                docker.DockerClient(base_url=url).ping()
+        except Exception:  # pylint: disable=broad-except
+            logging.error("Docker not responding at %s", url)
+            return 1
+    instance_manager.SCHEDULER.configure(
+        max_concurrency=options.docker_concurrency,
+        default_timeout=options.docker_timeout,
+    )
+    instance_manager.REAPER = reaper.Reaper(
+        instance_manager.SCHEDULER,
+        timeout=options.reap_timeout,
+        attempts=options.reap_attempts,
+    )
+    instance_manager.SERVER_ID = options.server_id
+    instance_manager.SUPERTIDEBOX_IMAGE = options.tidebox_image
+    instance_manager.ROUTE_TO_SESSION_NETWORK = options.route_to_session_network
+    instance_manager.WORKERS = options.workers or tornado.process.cpu_count()
+
+    app_args = dict(
+        warm_pool_size=options.warm_pool_size,
+        warm_pool_min_size=options.warm_pool_min_size,
+        warm_pool_idle_timeout=options.warm_pool_idle_timeout,
+        max_sessions=options.max_sessions,
+        max_host_load=options.max_host_load,
+        idle_pause_timeout=options.idle_pause_timeout,
+        session_grace=options.session_grace,
+        production=options.production,
+        quotas=quotas.Quotas(
+            session_rate=options.quota_session_rate,
+            session_burst=options.quota_session_burst,
+            max_sessions=options.quota_max_sessions,
+            message_rate=options.quota_message_rate,
+            message_burst=options.quota_message_burst,
+        ),
+        audio_buffer_bytes=options.audio_buffer_bytes,
+        audio_start_bytes=options.audio_start_bytes,
+    )
+    server_lib.MESSAGE_LOG = logs.RateLimitedLog(rate=options.log_message_rate)
+    if options.workers == 1:
+        install_logging()
+        instance_manager.PLACEMENT = make_placement()
+        app = server_lib.Application(**app_args)
+        app.listen(options.port, xheaders=options.xheaders)
+        print(f"Server started at port {options.port}")
+    else:
+        registry_path = options.registry_path or os.path.join(
+            tempfile.gettempdir(), f"multitidal-{options.port}.sqlite3"
+        )
+        sockets = tornado.netutil.bind_sockets(options.port)
+        worker_id = tornado.process.fork_processes(options.workers)
+        instance_manager.WORKER_ID = worker_id
+        install_logging(worker_id)
+        # Created after forking so every worker gets its own network pool ids.
+        instance_manager.PLACEMENT = make_placement()
+        app = server_lib.Application(
+            registry=registry.SqliteRegistry(registry_path, worker_id),
+            # Autoreload can't restart forked workers.
+            debug=False,
+            **app_args,
+        )
+        server = tornado.httpserver.HTTPServer(app, xheaders=options.xheaders)
+        server.add_sockets(sockets)
+        print(f"Worker {worker_id} started at port {options.port}")
+    io_loop = tornado.ioloop.IOLoop.current()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: io_loop.add_callback_from_signal(io_loop.stop))
     try:
-        tornado.ioloop.IOLoop.instance().start()
-    except Exception:  # pylint: disable=broad-except
-        app.stop()
-        raise
+        io_loop.start()
+    finally:
+        logging.info("Stopping sessions")
+        io_loop.run_sync(app.stop)
     return 0
 
 
@@ -1,36 +1,91 @@
-import abc
-import concurrent.futures
 import json
-import functools
 import logging
 import os.path
 
-from tornado.ioloop import IOLoop
+from tornado.ioloop import IOLoop, PeriodicCallback
 import tornado.websocket
 import tornado.template
 
+from . import activity as activity_lib
+from . import assets
+from . import audio_relay
 from . import instance_manager
+from . import logs
+from . import metrics
+from . import protocol
+from . import quotas as quotas_lib
+from . import sessions
+from . import streams
+from . import warm_pool as warm_pool_lib
 
-
-class Error(Exception):
-    pass
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+# Logs of every websocket message, rate limited.
+MESSAGE_LOG = logs.RateLimitedLog()
 
 
 class Application(tornado.web.Application):
-    def __init__(self):
-        self._sc = SessionsController()
-        base_path = os.path.dirname(os.path.abspath(__file__))
+    def __init__(  # pylint: disable=too-many-locals
+        self,
+        *,
+        warm_pool_size=0,
+        warm_pool_min_size=0,
+        warm_pool_idle_timeout=300,
+        max_sessions=None,
+        max_host_load=1.0,
+        idle_pause_timeout=0,
+        session_grace=sessions.SESSION_GRACE,
+        quotas=None,
+        audio_buffer_bytes=audio_relay.BUFFER_BYTES,
+        audio_start_bytes=audio_relay.START_BYTES,
+        registry=None,
+        debug=True,
+        production=False,
+    ):
+        """Creates the application.
+
+        Args:
+          production: whether to serve the prebuilt script bundle, see
+            assets.build, and to cache templates and static files. Implies
+            debug=False.
+        """
+        self._sc = sessions.SessionsController(
+            warm_pool=warm_pool_lib.WarmPool(
+                size=warm_pool_size,
+                min_size=warm_pool_min_size,
+                idle_timeout=warm_pool_idle_timeout,
+            ),
+            registry=registry,
+            max_sessions=max_sessions,
+            max_host_load=max_host_load,
+            idle_pause_timeout=idle_pause_timeout,
+            session_grace=session_grace,
+            quotas=quotas,
+            audio=audio_relay.RelayPool(
+                buffer_bytes=audio_buffer_bytes, start_bytes=audio_start_bytes
+            ),
+        )
         settings = dict(
-            debug=True,
-            template_path=os.path.join(base_path, "templates"),
-            static_path=os.path.join(base_path, "media"),
+            debug=debug and not production,
+            template_path=os.path.join(BASE_PATH, "templates"),
+            static_path=os.path.join(BASE_PATH, "media"),
+            static_handler_class=assets.PrecompressedStaticHandler,
+            compress_response=production,
         )
         handlers = [
             (r"/console", KeyboardHandler, dict(sc=self._sc)),
-            (r"/", IndexHandler),
+            (
+                r"/",
+                IndexHandler,
+                dict(bundle=assets.bundle_path() if production else None),
+            ),
+            (r"/metrics", MetricsHandler),
+            (r"/admin/images", ImagesHandler),
             (r"/list", ListHandler, dict(sc=self._sc)),
             (r"/watch_list", WatchListHandler, dict(sc=self._sc)),
             (r"/observe/(new|\d+)?", ObserveHandler, dict(sc=self._sc)),
+            (r"/audio/(\d+)\.mp3", streams.AudioHandler, dict(sc=self._sc)),
+            (r"/terminal/(\d+)", streams.TerminalHandler),
+            (r"/terminal/(\d+)/ws", streams.TerminalSocketHandler, dict(sc=self._sc)),
             (
                 r"/media/(.*)",
                 tornado.web.StaticFileHandler,
@@ -38,22 +93,30 @@ class Application(tornado.web.Application):
             ),
         ]
         tornado.web.Application.__init__(self, handlers, **settings)
-        tornado.autoreload.add_reload_hook(self.stop)
-
-    def stop(self):
-        IOLoop.instance().add_callback(self._sc.stop)
+        IOLoop.instance().add_callback(instance_manager.BACKEND.start)
+        IOLoop.instance().add_callback(self._sc.adopt_sessions)
+        IOLoop.instance().add_callback(self._sc.warm_pool.start)
+        self._activity_flusher = PeriodicCallback(
+            self._sc.on_tick, activity_lib.TICK_MS
+        )
+        self._activity_flusher.start()
 
+    async def stop(self):
+        """Stops every session and waits for their teardown.
 
-class SessionObserver(abc.ABC):
-    @abc.abstractmethod
-    def on_session_state_change(self, session, state):
-        raise NotImplementedError()
+        Autoreload restarts the process without it, the restarted server
+        adopts the running sessions.
+        """
+        self._activity_flusher.stop()
+        await self._sc.stop()
 
 
-class KeyboardHandler(tornado.websocket.WebSocketHandler, SessionObserver):
+class KeyboardHandler(tornado.websocket.WebSocketHandler, sessions.SessionObserver):
     i = 0
-    _instance: instance_manager.MusicBox
+    _instance: instance_manager.Instance
     _session = None
+    # Whether the client was sent SSH details of the running session.
+    _ssh_sent = False
 
     def check_origin(self, origin):
         return True
@@ -67,20 +130,63 @@ class KeyboardHandler(tornado.websocket.WebSocketHandler, SessionObserver):
         self.i = self.__class__.i
 
         logging.info("A keyboard connected: %d", self.i)
-        self._session = self._sc.keyboard_connected(self)
+        streams.CONNECTIONS.labels("console").inc()
+        try:
+            self._session = self._sc.keyboard_connected(
+                self, resume_token=self.get_argument("resume", None)
+            )
+        except quotas_lib.Error as e:
+            logging.info("Rejected keyboard %d: %s", self.i, e)
+            quotas_lib.reject(self, str(e))
 
     def on_close(self):
         logging.info("A keyboard disconnected: %d", self.i)
-        self._sc.keyboard_disconnected(self)
+        streams.CONNECTIONS.labels("console").dec()
+        if self._session is not None:
+            self._sc.keyboard_disconnected(self)
+
+    def select_subprotocol(self, subprotocols):
+        if protocol.BINARY_SUBPROTOCOL in subprotocols:
+            return protocol.BINARY_SUBPROTOCOL
+        return None
+
+    def get_compression_options(self):
+        # Only used if the client asks for permessage-deflate.
+        return {}
 
     def on_message(self, message):
-        logging.info("message from %s: %s", self.i, message)
+        streams.MESSAGES_RECEIVED.labels("console").inc()
+        if self._session is None:
+            return
+        if not self._sc.allow_message(self):
+            quotas_lib.reject(self, "Too many messages")
+            return
+        if isinstance(message, bytes):
+            try:
+                frame_type, payload = protocol.decode(message)
+            except protocol.Error as e:
+                logging.warning("Bad frame from keyboard %s: %s", self.i, e)
+                return
+            if frame_type == protocol.KEYSTROKES:
+                self._sc.on_keystrokes(self._session, len(payload))
+            else:
+                logging.warning("Unknown frame type from %s: %d", self.i, frame_type)
+            return
+        MESSAGE_LOG.info(
+            "message from keyboard %s: %s", self.i, message, session_id=self._session.i
+        )
         msg = json.loads(message)
         if msg["client_command"] == "keystrokes":
-            self._sc.on_keystrokes(self._session)
+            self._sc.on_keystrokes(self._session, len(msg["keystrokes"]))
 
     def on_session_state_change(self, session, state):
-        if state == Session.RUNNING:
+        if state == sessions.Session.PAUSED or (
+            state == sessions.Session.RUNNING and self._ssh_sent
+        ):
+            # The keyboard's SSH connection survives pausing.
+            return
+        self._ssh_sent = state == sessions.Session.RUNNING
+        if state == sessions.Session.RUNNING:
             host, port = session.get_ssh_hostport()
             resp = {
                 "mode": "ssh",
@@ -89,271 +195,93 @@ class KeyboardHandler(tornado.websocket.WebSocketHandler, SessionObserver):
                     "port": port,
                 },
                 "audio": session.get_mp3_url(),
+                "screen_ready": session.screen_ready,
             }
         else:
             resp = {
                 "mode": "idle",
             }
-        logging.info("Sending ssh details to keyboard client: %s", str(resp))
-        self.write_message(json.dumps(resp))
-
-
-class Session:
-    IDLE, STARTING, RUNNING, FAILED, STOPPING = range(5)
-
-    i = 0
-
-    def __init__(self, session_controller, hostname, keyboard=None):
-        """Initializes a session object.
-
-        Args:
-          session_controller: reference to the parent controller.
-          host: Current host name to use for constructing URLs.
-          keyboard: Whether this session is initialized by a keyboard client.
-        """
-        self.i = Session.i
-        Session.i += 1
-        self._observers = []
-        self._keyboard = keyboard
-        self._state = self.IDLE
-        self._musicbox = instance_manager.MusicBox()
-        self._session_controller = session_controller
-        self._hostname = hostname
-
-    def add_observer(self, observer: SessionObserver):
-        self._observers.append(observer)
-        observer.on_session_state_change(self, self._state)
-
-    def remove_observer(self, observer):
-        self._observers.remove(observer)
-
-    def set_keyboard(self, keyboard: KeyboardHandler):
-        self._keyboard = keyboard
-        self._change_state(self._state)
-
-    def _change_state(self, new_state):
-        self._state = new_state
-        for o in self._observers:
-            o.on_session_state_change(self, new_state)
-        if self._keyboard:
-            self._keyboard.on_session_state_change(self, new_state)
-        self._session_controller.on_session_state_change(self, new_state)
-
-    async def start(self):
-        self._change_state(self.STARTING)
-        try:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as e:
-                await IOLoop.instance().run_in_executor(
-                    e, functools.partial(self._musicbox.start, hostname=self._hostname)
-                )
-        except (Error, instance_manager.Error) as e:
-            self._change_state(self.FAILED)
-            raise Error(f"Failed to start session: {e}") from e
-        self._change_state(self.RUNNING)
-
-    async def stop(self):
-        self._change_state(self.STOPPING)
-        try:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as e:
-                await IOLoop.instance().run_in_executor(e, self._musicbox.stop)
-        finally:
-            self._change_state(self.IDLE)
-
-    def get_state(self):
-        return self._state
-
-    def has_observers(self) -> bool:
-        return len(self._observers) > 0
-
-    def has_keyboard(self):
-        return self._keyboard is not None
-
-    def get_mp3_url(self):
-        return (
-            f"http://{self._musicbox.hostname}:{self._musicbox.mp3_port}/" "stream.mp3"
+        resp["id"] = session.i
+        resp["resume_token"] = session.resume_token
+        logging.info(
+            "Sending %s mode to keyboard %d",
+            resp["mode"],
+            self.i,
+            extra=logs.session_extra(session.i),
         )
+        self.write_message(json.dumps(resp))
 
-    def get_ssh_url(self):
-        return (
-            f"http://{self._hostname}:{self._musicbox.webssh_port}/ssh/host/"
-            + f'{self._musicbox.tidal_container.attrs["Config"]["Hostname"]}'
-            + "?port=22"
-        )
-
-    def get_ssh_hostport(self):
-        return (self._musicbox.hostname, self._musicbox.ssh_port)
-
-    def __del__(self):
-        if self._state != self.IDLE:
-            logging.warning("Destroying non-idle session")
-
-    def to_dict(self):
-        state_map = ["idle", "starting", "running", "failed", "stopping"]
-        return {
-            "id": self.i,
-            "state": state_map[self._state],
-            "kb": self.has_keyboard(),
-        }
-
-
-class SessionsController:
-    def __init__(self):
-        self._sessions = {}
-        self._keyboard_to_session = {}
-        self._observer_to_session = {}
-
-        self._list_watchers = []
-
-    def list_sessions(self):
-        return self._sessions.values()
-
-    def add_list_watcher(self, handler):
-        self._list_watchers.append(handler)
-        for s in self._sessions.values():
-            handler.on_session_add(s)
-
-    def remove_list_watcher(self, handler):
-        self._list_watchers.remove(handler)
+    def on_screen_ready(self, session):
+        if self._ssh_sent:
+            self.write_message(json.dumps({"event": "screen_ready"}))
 
-    def on_keystrokes(self, session):
-        for w in self._list_watchers:
-            w.on_keystrokes(session)
 
-    def add_session(self, session):
-        self._sessions[session.i] = session
-        for w in self._list_watchers:
-            w.on_session_add(session)
+class IndexHandler(tornado.web.RequestHandler):
+    def initialize(self, bundle):
+        self._bundle = bundle
 
-    def remove_session(self, session):
-        del self._sessions[session.i]
-        for w in self._list_watchers:
-            w.on_session_remove(session)
+    def get(self):
+        self.render("index.html", bundle=self._bundle)
 
-    def on_session_state_change(self, session, state):
-        for w in self._list_watchers:
-            w.on_session_state_change(session, state)
-
-    async def start_observation(self, observer, session_id) -> Session:
-        if session_id is None:
-            session = Session(
-                self,
-                hostname=observer.request.host.split(":")[0],
-            )
-            self.add_session(session)
-        else:
-            session = self._sessions[int(session_id)]
-        session.add_observer(observer)
-        self._observer_to_session[observer] = session
-        if session.get_state() == Session.IDLE:
-            await session.start()
-        return session
-
-    async def stop_observation(self, observer: SessionObserver):
-        session = self._observer_to_session[observer]
-        session.remove_observer(observer)
-        del self._observer_to_session[observer]
-        if not session.has_observers():
-            await session.stop()
-            if not session.has_keyboard():
-                self.remove_session(session)
-
-    def keyboard_connected(self, keyboard: KeyboardHandler) -> Session:
-        session = Session(self, hostname=keyboard.request.host.split(":")[0])
-        session.set_keyboard(keyboard)
-        self.add_session(session)
-        self._keyboard_to_session[keyboard] = session
-        return session
-
-    def keyboard_disconnected(self, keyboard: KeyboardHandler):
-        session = self._keyboard_to_session[keyboard]
-        session.set_keyboard(None)
-        del self._keyboard_to_session[keyboard]
-        if not session.has_observers():
-            self.remove_session(session)
 
-    async def stop(self):
-        for session in list(self._sessions.values()):
-            await session.stop()
-            self.remove_session(session)
+class MetricsHandler(tornado.web.RequestHandler):
+    def get(self):
+        self.set_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.write(metrics.REGISTRY.render())
 
 
-class IndexHandler(tornado.web.RequestHandler):
+class ImagesHandler(tornado.web.RequestHandler):
     def get(self):
-        self.render("index.html")
+        self.set_header("Content-Type", "application/json")
+        self.write(json.dumps(instance_manager.BACKEND.image_status()))
 
 
 class ListHandler(tornado.web.RequestHandler):
-    _sc: SessionsController
+    """Returns the session list, or 304 if it didn't change since the ETag."""
+
+    _sc: sessions.SessionsController
 
     def initialize(self, sc):
         self._sc = sc
 
+    def compute_etag(self):
+        return f'"{self._sc.changes.epoch}-{self._sc.changes.version}"'
+
     def get(self):
-        self.write(
-            json.dumps(
-                [
-                    {
-                        "id": s.i,
-                        "kb": s.has_keyboard(),
-                    }
-                ]
-                for s in self._sc.list_sessions()
-            )
-        )
+        self.set_etag_header()
+        if self.check_etag_header():
+            self.set_status(304)
+            return
+        snapshot = self._sc.snapshot()
+        del snapshot["command"]
+        self.set_header("Content-Type", "application/json")
+        self.write(json.dumps(snapshot))
 
 
 class WatchListHandler(tornado.websocket.WebSocketHandler):
+    """Streams changes to the session list.
+
+    Reconnecting clients pass the epoch and version of the last change they
+    got, /watch_list?since=<version>&epoch=<epoch>, to get only the changes
+    they missed.
+    """
+
     def initialize(self, sc):
         self._sc = sc
 
     def open(self):  # pylint: disable=arguments-differ
-        self._sc.add_list_watcher(self)
+        streams.CONNECTIONS.labels("watch_list").inc()
+        since = self.get_argument("since", None)
+        self._sc.add_list_watcher(
+            self,
+            since=int(since) if since and since.isdigit() else None,
+            epoch=self.get_argument("epoch", None),
+        )
 
     def on_close(self):
+        streams.CONNECTIONS.labels("watch_list").dec()
         self._sc.remove_list_watcher(self)
 
-    def on_session_remove(self, session):
-        self.write_message(
-            json.dumps(
-                {
-                    "command": "session_remove",
-                    "session": session.to_dict(),
-                }
-            )
-        )
-
-    def on_session_add(self, session):
-        self.write_message(
-            json.dumps(
-                {
-                    "command": "session_add",
-                    "session": session.to_dict(),
-                }
-            )
-        )
-
-    def on_session_state_change(self, session, unused_state):
-        self.write_message(
-            json.dumps(
-                {
-                    "command": "session_state",
-                    "session": session.to_dict(),
-                }
-            )
-        )
-
-    def on_keystrokes(self, session):
-        self.write_message(
-            json.dumps(
-                {
-                    "command": "keystrokes",
-                    "keystrokes": {
-                        "session": session.to_dict(),
-                    },
-                }
-            )
-        )
-
 
 class ObserveHandler(tornado.websocket.WebSocketHandler):
     i = 0
@@ -365,9 +293,11 @@ class ObserveHandler(tornado.websocket.WebSocketHandler):
         self._sc = sc
         self._session = None
 
-    async def _start_observation(self, session_id):
+    async def _start_observation(self, session_id, resume_token):
         try:
-            await self._sc.start_observation(self, session_id)
+            self._session = await self._sc.start_observation(
+                self, session_id, resume_token=resume_token
+            )
         except tornado.web.HTTPError:
             self.write_message(
                 json.dumps(
@@ -376,7 +306,10 @@ class ObserveHandler(tornado.websocket.WebSocketHandler):
                     }
                 )
             )
-        except Error as e:
+        except quotas_lib.Error as e:
+            logging.info("Rejected observer %d: %s", self.i, e)
+            quotas_lib.reject(self, str(e))
+        except sessions.Error as e:
             logging.exception("Failed to start observation: %s", str(e))
 
     def open(self, session_id):  # pylint: disable=arguments-differ
@@ -386,17 +319,31 @@ class ObserveHandler(tornado.websocket.WebSocketHandler):
         if session_id != "new":
             msg += f" of session {session_id}"
         logging.info(msg)
+        streams.CONNECTIONS.labels("observe").inc()
 
         if session_id == "new":
             session_id = None
-        IOLoop.instance().add_callback(self._start_observation, session_id)
+        IOLoop.instance().add_callback(
+            self._start_observation, session_id, self.get_argument("resume", None)
+        )
 
     def on_close(self):
         logging.info("Web stopped observing: %d", self.i)
+        streams.CONNECTIONS.labels("observe").dec()
         IOLoop.instance().add_callback(self._sc.stop_observation, self)
 
     def on_message(self, message):
-        logging.info("message from %s: %s", self.i, message)
+        MESSAGE_LOG.info(
+            "message from observer %s: %s",
+            self.i,
+            message,
+            session_id=getattr(self._session, "i", None),
+        )
+        streams.MESSAGES_RECEIVED.labels("observe").inc()
+        if not self._sc.allow_message(self):
+            quotas_lib.reject(self, "Too many messages")
+            return
+        self._sc.on_observer_message(self)
 
     def on_console_close(self):
         logging.info("Observed console closed")
@@ -408,57 +355,6 @@ class ObserveHandler(tornado.websocket.WebSocketHandler):
             )
         )
 
-    def on_session_state_change(self, session, state):
-        if state == Session.RUNNING:
-            self.on_connection_details(
-                session,
-                session.get_ssh_url(),
-                session.get_mp3_url(),
-            )
-        elif state == Session.STOPPING:
-            self.write_message(
-                json.dumps(
-                    {
-                        "id": session.i,
-                        "status": "disconnected",
-                    }
-                )
-            )
-        elif state == Session.STARTING:
-            self.write_message(
-                json.dumps(
-                    {
-                        "id": session.i,
-                        "session": session.to_dict(),
-                        "status": "connecting",
-                    }
-                )
-            )
-        elif state == Session.FAILED:
-            self.write_message(
-                json.dumps(
-                    {
-                        "id": session.i,
-                        "status": "error",
-                    }
-                )
-            )
+    def on_session_state_change(self, unused_session, state):
+        if state == sessions.Session.FAILED:
             self.close()
-        elif state == Session.IDLE:
-            pass
-        else:
-            logging.error("Unexpected session state in WS handler: %s", state)
-
-    def on_connection_details(self, session, ssh_url, mp3_url):
-        resp = {
-            "status": "connected",
-            "ssh": {
-                "url": ssh_url,
-            },
-            "mp3": {
-                "url": mp3_url,
-            },
-            "session": session.to_dict(),
-        }
-        logging.info("Sending ssh details to web client: %s", str(resp))
-        self.write_message(json.dumps(resp))
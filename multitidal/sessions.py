@@ -0,0 +1,883 @@
+"""Sessions and the controller keeping track of them.
+
+A session is created by the observer or keyboard client that asks for it and
+runs a MusicBox while anybody is attached. The controller owns the sessions of
+this process and mirrors those of other workers through the registry.
+"""
+
+import abc
+import asyncio
+import itertools
+import logging
+import secrets
+import time
+
+from tornado.ioloop import IOLoop
+import tornado.web
+
+from . import activity as activity_lib
+from . import admission as admission_lib
+from . import audio_relay
+from . import broadcast
+from . import changes as changes_lib
+from . import instance_manager
+from . import logs
+from . import metrics
+from . import registry as registry_lib
+from . import warm_pool as warm_pool_lib
+
+# Number of ticks between deleting old events from the session registry.
+REGISTRY_TRIM_TICKS = 100
+# Number of ticks between looking for idle sessions to pause.
+IDLE_CHECK_TICKS = 10
+# Seconds a session is kept running after its last observer or keyboard left,
+# for them to reconnect after a page reload or a dropped connection.
+SESSION_GRACE = 30.0
+# Grace period of sessions adopted from an earlier run, which also covers the
+# restart.
+ADOPTED_SESSION_GRACE = 120.0
+# Minimum seconds between telling another worker about activity in its session.
+REMOTE_TOUCH_INTERVAL = 1.0
+
+SESSIONS = metrics.gauge(
+    "multitidal_sessions", "Sessions owned by this process.", labels=("state",)
+)
+STATE_SECONDS = metrics.histogram(
+    "multitidal_session_state_seconds",
+    "Time sessions spent in a state before moving on.",
+    labels=("state", "next_state"),
+)
+KEYSTROKES = metrics.counter(
+    "multitidal_keystrokes_total", "Keystrokes typed into sessions."
+)
+
+
+class Error(Exception):
+    pass
+
+
+class SessionObserver(abc.ABC):
+    @abc.abstractmethod
+    def on_session_state_change(self, session, state):
+        raise NotImplementedError()
+
+    def on_screen_ready(self, session):
+        """Called once a web terminal attached to the session's screen."""
+
+
+class Session:
+    IDLE, STARTING, RUNNING, FAILED, STOPPING, QUEUED, PAUSED = range(7)
+    STATE_NAMES = [
+        "idle",
+        "starting",
+        "running",
+        "failed",
+        "stopping",
+        "queued",
+        "paused",
+    ]
+
+    def __init__(self, session_controller, hostname, keyboard=None, session_id=None):
+        """Initializes a session object.
+
+        Args:
+          session_controller: reference to the parent controller.
+          host: Current host name to use for constructing URLs.
+          keyboard: Whether this session is initialized by a keyboard client.
+          session_id: id claimed for an adopted session, allocated if None.
+        """
+        if session_id is None:
+            session_id = session_controller.registry.allocate_session_id()
+        self.i = session_id
+        self._observers = []
+        # Observers connected to other worker processes.
+        self._remote_observers = 0
+        self._keyboard = keyboard
+        self._state = self.IDLE
+        self._state_since = time.monotonic()
+        self._musicbox = instance_manager.BACKEND.new_instance()
+        self._musicbox.assign_session(self.i)
+        self._session_controller = session_controller
+        self._hostname = hostname
+        # Last message sent to observers.
+        self.observer_message = None
+        # Position in the admission queue while QUEUED.
+        self.queue_position = None
+        self._admitted = False
+        # Monotonic time of the last keystroke or observer action.
+        self.last_active = time.monotonic()
+        self._pause_lock = asyncio.Lock()
+        # Lets the client that created the session attach to it again.
+        self.resume_token = secrets.token_urlsafe(16)
+        # Monotonic time the session is released at unless somebody attaches.
+        self.release_at = None
+        # Whether a web terminal created the screen keyboards attach to.
+        self.screen_ready = False
+        # Quota key of the client that created the session.
+        self.client = None
+        # Whether the session counts against the client's quota.
+        self.holds_quota = False
+
+    def add_observer(self, observer: SessionObserver):
+        self._observers.append(observer)
+        msg = session_state_message(self, self._state)
+        if msg is not None:
+            self._session_controller.hub.send(
+                observer, msg, kind=broadcast.BroadcastHub.STATE, key=self.i
+            )
+        observer.on_session_state_change(self, self._state)
+
+    def remove_observer(self, observer):
+        self._observers.remove(observer)
+
+    def add_remote_observer(self):
+        self._remote_observers += 1
+
+    def remove_remote_observer(self):
+        self._remote_observers = max(0, self._remote_observers - 1)
+
+    def set_screen_ready(self):
+        if not self.screen_ready and self.is_live():
+            self.screen_ready = True
+            if self._keyboard:
+                self._keyboard.on_screen_ready(self)
+
+    def set_keyboard(self, keyboard: SessionObserver):
+        self._keyboard = keyboard
+        self._change_state(self._state)
+
+    def _change_state(self, new_state):
+        if new_state != self._state:
+            now = time.monotonic()
+            STATE_SECONDS.labels(
+                self.STATE_NAMES[self._state], self.STATE_NAMES[new_state]
+            ).observe(now - self._state_since)
+            self._state_since = now
+        self._state = new_state
+        msg = self.observer_message = session_state_message(self, new_state)
+        if msg is not None:
+            self._session_controller.hub.publish(
+                self._observers, msg, kind=broadcast.BroadcastHub.STATE, key=self.i
+            )
+        for o in list(self._observers):
+            o.on_session_state_change(self, new_state)
+        if self._keyboard:
+            self._keyboard.on_session_state_change(self, new_state)
+        self._session_controller.on_session_state_change(self, new_state)
+
+    def _on_queue_position(self, position):
+        self.queue_position = position
+        self._change_state(self.QUEUED)
+
+    def _release_slot(self):
+        if self._admitted:
+            self._admitted = False
+            self._session_controller.admission.release()
+
+    async def start(self):
+        admission = self._session_controller.admission
+        if not await admission.acquire(self, on_position=self._on_queue_position):
+            return
+        self._admitted = True
+        self.queue_position = None
+        self.screen_ready = False
+        self.last_active = time.monotonic()
+        self._change_state(self.STARTING)
+        pooled = self._session_controller.warm_pool.acquire()
+        if pooled is not None:
+            logging.info(
+                "Session %d got a pooled MusicBox",
+                self.i,
+                extra=logs.session_extra(self.i),
+            )
+            pooled.assign_hostname(self._hostname)
+            pooled.assign_session(self.i)
+            self._musicbox = pooled
+            self._change_state(self.RUNNING)
+            return
+        try:
+            await self._musicbox.start(hostname=self._hostname)
+        except (Error, instance_manager.Error) as e:
+            self._release_slot()
+            self._change_state(self.FAILED)
+            raise Error(f"Failed to start session: {e}") from e
+        self._change_state(self.RUNNING)
+
+    def adopt(self, instance: instance_manager.Instance):
+        """Takes over an instance left running by an earlier run."""
+        self._session_controller.admission.occupy()
+        self._admitted = True
+        self._musicbox = instance
+        # Its screen was set up before the restart.
+        self.screen_ready = True
+        self.last_active = time.monotonic()
+        self._change_state(self.PAUSED if instance.paused else self.RUNNING)
+
+    async def stop(self):
+        if self._state == self.QUEUED:
+            self._session_controller.admission.withdraw(self)
+            self.queue_position = None
+            self._change_state(self.IDLE)
+            return
+        self._change_state(self.STOPPING)
+        try:
+            async with self._pause_lock:
+                await self._musicbox.stop()
+        finally:
+            self._release_slot()
+            self._change_state(self.IDLE)
+
+    async def pause(self):
+        async with self._pause_lock:
+            if self._state != self.RUNNING:
+                return
+            await self._musicbox.pause()
+            self._change_state(self.PAUSED)
+
+    async def resume(self):
+        async with self._pause_lock:
+            if self._state != self.PAUSED:
+                return
+            await self._musicbox.resume()
+            self._change_state(self.RUNNING)
+
+    def is_pausing(self):
+        return self._pause_lock.locked()
+
+    def get_state(self):
+        return self._state
+
+    def is_live(self) -> bool:
+        """Returns whether the session's terminal and audio can be used."""
+        return self._state in (self.RUNNING, self.PAUSED)
+
+    def has_observers(self) -> bool:
+        return len(self._observers) + self._remote_observers > 0
+
+    def has_keyboard(self):
+        return self._keyboard is not None
+
+    def get_mp3_url(self):
+        return f"/audio/{self.i}.mp3"
+
+    def get_mp3_address(self):
+        return self._musicbox.get_mp3_address()
+
+    def get_ssh_url(self):
+        return f"/terminal/{self.i}"
+
+    def get_ssh_address(self):
+        return self._musicbox.get_ssh_address()
+
+    def get_ssh_hostport(self):
+        return (self._musicbox.hostname, self._musicbox.ssh_port)
+
+    def __del__(self):
+        if self._state != self.IDLE:
+            logging.warning("Destroying non-idle session")
+
+    def to_dict(self):
+        return {
+            "id": self.i,
+            "state": self.STATE_NAMES[self._state],
+            "kb": self.has_keyboard(),
+        }
+
+
+class RemoteSession:
+    """A session owned by another worker process.
+
+    Mirrors the record the owner keeps in the registry. Observers connected to
+    this process are counted in by the owner, which starts and stops the
+    session.
+    """
+
+    def __init__(self, session_controller, session_id, record):
+        self.i = session_id
+        self._session_controller = session_controller
+        self._observers = []
+        self.record = record
+        # Monotonic time activity was last sent to the owner.
+        self.touched_at = None
+
+    @property
+    def owner(self):
+        return self.record["owner"]
+
+    def add_observer(self, observer: SessionObserver):
+        self._observers.append(observer)
+        self._session_controller.registry.send(
+            registry_lib.OBSERVE, self.i, target=self.owner
+        )
+        msg = self.record.get("observer_message")
+        if msg is not None:
+            self._session_controller.hub.send(
+                observer, msg, kind=broadcast.BroadcastHub.STATE, key=self.i
+            )
+
+    def remove_observer(self, observer):
+        self._observers.remove(observer)
+        self._session_controller.registry.send(
+            registry_lib.UNOBSERVE, self.i, target=self.owner
+        )
+
+    def update(self, record):
+        record["owner"] = self.owner
+        self.record = record
+        msg = record.get("observer_message")
+        if msg is not None:
+            self._session_controller.hub.publish(
+                self._observers, msg, kind=broadcast.BroadcastHub.STATE, key=self.i
+            )
+        state = self.get_state()
+        for o in list(self._observers):
+            o.on_session_state_change(self, state)
+
+    def get_state(self):
+        return Session.STATE_NAMES.index(self.record["session"]["state"])
+
+    def is_live(self) -> bool:
+        return self.get_state() in (Session.RUNNING, Session.PAUSED)
+
+    def has_observers(self) -> bool:
+        return len(self._observers) > 0
+
+    def has_keyboard(self):
+        return self.record["session"]["kb"]
+
+    def get_ssh_url(self):
+        return f"/terminal/{self.i}"
+
+    def get_ssh_address(self):
+        return tuple(self.record["ssh_address"])
+
+    def get_mp3_address(self):
+        return tuple(self.record["mp3_address"])
+
+    def to_dict(self):
+        return self.record["session"]
+
+
+class SessionsController:
+    def __init__(
+        self,
+        warm_pool=None,
+        registry=None,
+        *,
+        max_sessions=None,
+        max_host_load=1.0,
+        idle_pause_timeout=0,
+        session_grace=SESSION_GRACE,
+        quotas=None,
+        audio=None,
+    ):
+        """Initializes the controller.
+
+        Args:
+          idle_pause_timeout: seconds without keystrokes or observer actions
+            after which a session is paused, never if 0.
+          session_grace: seconds a session keeps running after everybody
+            left, released at once if 0.
+          quotas: quotas.Quotas limiting what each client can do, no limits
+            if None.
+          audio: relays of the sessions' mp3 streams.
+        """
+        self.idle_pause_timeout = idle_pause_timeout
+        self.session_grace = session_grace
+        self.quotas = quotas
+        self.audio = audio or audio_relay.RelayPool()
+        self.warm_pool = warm_pool or warm_pool_lib.WarmPool()
+        self.registry = registry or registry_lib.Registry()
+        self.max_host_load = max_host_load
+        self.admission = admission_lib.AdmissionController(
+            max_sessions=max_sessions, has_capacity=self._has_capacity
+        )
+        self._sessions = {}
+        self._remote_sessions = {
+            session_id: RemoteSession(self, session_id, record)
+            for session_id, record in self.registry.remote_sessions().items()
+        }
+        self._keyboard_to_session = {}
+        self._observer_to_session = {}
+        self._resume_tokens = {}
+
+        self._list_watchers = []
+        self.changes = changes_lib.ChangeLog()
+        self._activity = activity_lib.KeystrokeActivity()
+        self.hub = broadcast.BroadcastHub()
+        SESSIONS.set_function(self._count_sessions)
+        self._ticks = 0
+
+    def _count_sessions(self):
+        counts = {(name,): 0 for name in Session.STATE_NAMES}
+        for session in self._sessions.values():
+            counts[(Session.STATE_NAMES[session.get_state()],)] += 1
+        return counts
+
+    def list_sessions(self):
+        return itertools.chain(self._sessions.values(), self._remote_sessions.values())
+
+    def get_session(self, session_id):
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = self._remote_sessions.get(session_id)
+        return session
+
+    def snapshot(self):
+        """Returns the session list at the current version of `changes`."""
+        return {
+            "command": "snapshot",
+            "epoch": self.changes.epoch,
+            "version": self.changes.version,
+            "sessions": [s.to_dict() for s in self.list_sessions()],
+        }
+
+    def add_list_watcher(self, handler, since=None, epoch=None):
+        """Sends `handler` the session list and then every change to it.
+
+        Args:
+          since: version of the list the watcher has, from an earlier
+            connection. It gets the changes since then if they are still
+            logged, a snapshot otherwise.
+          epoch: epoch of `since`.
+        """
+        self._list_watchers.append(handler)
+        missed = None if since is None else self.changes.since(since, epoch)
+        if missed is None:
+            self.hub.send(handler, self.snapshot())
+        for change in missed or ():
+            self.hub.send(handler, change)
+
+    def remove_list_watcher(self, handler):
+        self._list_watchers.remove(handler)
+        self.hub.forget(handler)
+
+    def _has_capacity(self):
+        return self.warm_pool.has_ready() or instance_manager.BACKEND.has_capacity(
+            self.max_host_load
+        )
+
+    def on_keystrokes(self, session, count=1):
+        KEYSTROKES.inc(count)
+        self._activity.record(session.i, count)
+        self.touch(session)
+
+    def touch(self, session):
+        """Records activity in `session`, resuming it if it is paused.
+
+        The owner of a remote session is sent an activity event instead.
+        """
+        now = time.monotonic()
+        if isinstance(session, RemoteSession):
+            if (
+                session.touched_at is None
+                or now - session.touched_at >= REMOTE_TOUCH_INTERVAL
+            ):
+                session.touched_at = now
+                self.registry.send(
+                    registry_lib.ACTIVITY,
+                    session.i,
+                    {"command": "activity", "sessions": [{"id": session.i}]},
+                    target=session.owner,
+                )
+            return
+        session.last_active = now
+        if session.get_state() == Session.PAUSED or session.is_pausing():
+            IOLoop.current().spawn_callback(self._resume_session, session)
+
+    def on_terminal_attached(self, session):
+        """Tells the owner of `session` a web terminal attached to it."""
+        if isinstance(session, Session):
+            session.set_screen_ready()
+        else:
+            self.registry.send(
+                registry_lib.TERMINAL_ATTACHED, session.i, target=session.owner
+            )
+
+    def on_observer_message(self, observer):
+        session = self._observer_to_session.get(observer)
+        if session is not None:
+            self.touch(session)
+
+    async def _resume_session(self, session):
+        try:
+            await session.resume()
+        except instance_manager.Error as e:
+            logging.error("Failed to resume session %d: %s", session.i, e)
+
+    async def _pause_session(self, session):
+        try:
+            await session.pause()
+        except instance_manager.Error as e:
+            logging.error("Failed to pause session %d: %s", session.i, e)
+            return
+        # Activity while the containers were being paused.
+        if session.last_active > time.monotonic() - self.idle_pause_timeout:
+            await self._resume_session(session)
+
+    async def adopt_sessions(self):
+        """Creates sessions for instances an earlier run left running."""
+        instances = await instance_manager.BACKEND.reconcile()
+        for session_id, instance in sorted(instances.items()):
+            if not self.registry.claim_session_id(session_id):
+                logging.warning(
+                    "Session id %d is taken, dropping its instance", session_id
+                )
+                IOLoop.current().spawn_callback(instance.stop)
+                continue
+            session = Session(self, hostname=None, session_id=session_id)
+            self.add_session(session)
+            session.adopt(instance)
+            self._orphan(session, max(self.session_grace, ADOPTED_SESSION_GRACE))
+            logging.info(
+                "Adopted session %d", session_id, extra=logs.session_extra(session_id)
+            )
+
+    def _orphan(self, session, grace=None):
+        """Releases `session` unless somebody attaches within `grace` seconds.
+
+        Queued sessions leave the queue right away rather than take a slot
+        nobody is waiting for, and failed ones are released too: resuming
+        them wouldn't start them again.
+        """
+        self._update_quota(session)
+        grace = self.session_grace if grace is None else grace
+        if grace > 0 and session.get_state() not in (Session.QUEUED, Session.FAILED):
+            session.release_at = time.monotonic() + grace
+        else:
+            IOLoop.current().spawn_callback(self._release_session, session)
+
+    def _release_orphaned_sessions(self):
+        now = time.monotonic()
+        for session in list(self._sessions.values()):
+            if session.release_at is None or session.release_at > now:
+                continue
+            session.release_at = None
+            if not session.has_observers() and not session.has_keyboard():
+                logging.info(
+                    "Nobody reconnected to session %d",
+                    session.i,
+                    extra=logs.session_extra(session.i),
+                )
+                IOLoop.current().spawn_callback(self._release_session, session)
+
+    def _pause_idle_sessions(self):
+        idle_since = time.monotonic() - self.idle_pause_timeout
+        for session in list(self._sessions.values()):
+            # Keyboard clients type over their own SSH connection, unseen here.
+            if (
+                session.get_state() == Session.RUNNING
+                and not session.has_keyboard()
+                and session.last_active < idle_since
+                and not session.is_pausing()
+            ):
+                logging.info(
+                    "Pausing idle session %d",
+                    session.i,
+                    extra=logs.session_extra(session.i),
+                )
+                IOLoop.current().spawn_callback(self._pause_session, session)
+
+    def on_tick(self):
+        self.hub.flush_held()
+        # Host capacity can free up without a session stopping here.
+        self.admission.dispatch()
+        msg = self._activity.flush()
+        if msg is not None:
+            self.hub.publish(
+                self._list_watchers, msg, kind=broadcast.BroadcastHub.ACTIVITY
+            )
+            self.registry.send(registry_lib.ACTIVITY, None, msg)
+        self._receive_registry_events()
+        self._ticks += 1
+        if self._ticks % REGISTRY_TRIM_TICKS == 0:
+            self.registry.trim()
+            if self.quotas is not None:
+                self.quotas.prune()
+        if self._ticks % IDLE_CHECK_TICKS == 0:
+            self._release_orphaned_sessions()
+            if self.idle_pause_timeout:
+                self._pause_idle_sessions()
+
+    def _receive_registry_events(self):
+        for event in self.registry.receive():
+            self._on_registry_event(event)
+
+    def _on_registry_event(self, event: registry_lib.Event):
+        if event.kind in (registry_lib.SESSION_ADD, registry_lib.SESSION_STATE):
+            remote = self._remote_sessions.get(event.session_id)
+            if remote is None:
+                event.payload["owner"] = event.origin
+                remote = RemoteSession(self, event.session_id, event.payload)
+                self._remote_sessions[event.session_id] = remote
+                self._publish_change("session_add", remote.to_dict())
+            else:
+                remote.update(event.payload)
+                self.on_session_state_change(remote, remote.get_state())
+        elif event.kind == registry_lib.SESSION_REMOVE:
+            self.audio.close(event.session_id)
+            if self._remote_sessions.pop(event.session_id, None) is not None:
+                self._publish_change("session_remove", event.payload["session"])
+        elif event.kind == registry_lib.ACTIVITY:
+            self._on_remote_activity(event.payload)
+        elif event.session_id in self._sessions:
+            self._on_owned_session_event(event, self._sessions[event.session_id])
+
+    def _on_owned_session_event(self, event: registry_lib.Event, session: Session):
+        """Handles an event another worker sent about a session of this one."""
+        if event.kind == registry_lib.OBSERVE:
+            session.add_remote_observer()
+            session.release_at = None
+            self._update_quota(session)
+            self.touch(session)
+            if session.get_state() == Session.IDLE:
+                IOLoop.current().spawn_callback(self._start_session, session)
+        elif event.kind == registry_lib.UNOBSERVE:
+            session.remove_remote_observer()
+            if not session.has_observers():
+                self._orphan(session)
+        elif event.kind == registry_lib.TERMINAL_ATTACHED:
+            session.set_screen_ready()
+
+    def _on_remote_activity(self, msg):
+        # Touches of remote sessions have no keystrokes to show.
+        typed = [a for a in msg["sessions"] if a.get("keystrokes")]
+        if typed:
+            self.hub.publish(
+                self._list_watchers,
+                dict(msg, sessions=typed),
+                kind=broadcast.BroadcastHub.ACTIVITY,
+            )
+        for activity in msg["sessions"]:
+            session = self._sessions.get(activity["id"])
+            if session is not None:
+                self.touch(session)
+
+    @staticmethod
+    def _session_record(session):
+        running = session.is_live()
+        return {
+            "session": session.to_dict(),
+            "observer_message": session.observer_message,
+            "ssh_address": session.get_ssh_address() if running else None,
+            "mp3_address": session.get_mp3_address() if running else None,
+        }
+
+    def add_session(self, session):
+        self._sessions[session.i] = session
+        self._resume_tokens[session.resume_token] = session
+        record = self._session_record(session)
+        self.registry.put_session(session.i, record)
+        self.registry.send(registry_lib.SESSION_ADD, session.i, record)
+        self._publish_change("session_add", session.to_dict())
+
+    def remove_session(self, session):
+        del self._sessions[session.i]
+        if session.holds_quota:
+            session.holds_quota = False
+            self.quotas.release_session(session.client)
+        self._resume_tokens.pop(session.resume_token, None)
+        self._activity.forget(session.i)
+        self.audio.close(session.i)
+        self.registry.delete_session(session.i)
+        self.registry.send(
+            registry_lib.SESSION_REMOVE, session.i, {"session": session.to_dict()}
+        )
+        self._publish_change("session_remove", session.to_dict())
+
+    def on_session_state_change(self, session, unused_state):
+        if session.i in self._sessions:
+            self._update_quota(session)
+            record = self._session_record(session)
+            self.registry.put_session(session.i, record)
+            self.registry.send(registry_lib.SESSION_STATE, session.i, record)
+        self._publish_change(
+            "session_state",
+            session.to_dict(),
+            kind=broadcast.BroadcastHub.STATE,
+            key=session.i,
+        )
+
+    def _publish_change(self, command, session_dict, **kwargs):
+        change = self.changes.append({"command": command, "session": session_dict})
+        self.hub.publish(self._list_watchers, change, **kwargs)
+
+    def _new_session(self, handler) -> Session:
+        """Creates a session for the client of `handler`.
+
+        Raises:
+          quotas.Error: if the client is over its quota.
+        """
+        client = handler.request.remote_ip
+        if self.quotas is not None:
+            self.quotas.acquire_session(client)
+        session = Session(self, hostname=handler.request.host.split(":")[0])
+        session.client = client
+        session.holds_quota = self.quotas is not None
+        self.add_session(session)
+        return session
+
+    def _update_quota(self, session):
+        """Counts `session` against its client's quota while it is in use.
+
+        Failed sessions and those nobody is attached to don't count, though
+        they are kept for a while in case somebody comes back.
+        """
+        if self.quotas is None or session.client is None:
+            return
+        in_use = session.get_state() != Session.FAILED and (
+            session.has_observers() or session.has_keyboard()
+        )
+        if in_use and not session.holds_quota:
+            self.quotas.hold_session(session.client)
+        elif session.holds_quota and not in_use:
+            self.quotas.release_session(session.client)
+        session.holds_quota = in_use
+
+    def allow_message(self, handler) -> bool:
+        """Returns whether the client of `handler` may send another message."""
+        return self.quotas is None or self.quotas.allow_message(
+            handler.request.remote_ip
+        )
+
+    async def start_observation(self, observer, session_id, resume_token=None):
+        """Attaches `observer` to a session.
+
+        Args:
+          session_id: id of the session to observe, a new one if None.
+          resume_token: token of a session the observer created before. It is
+            attached to that session instead of a new one if it still exists.
+        """
+        owned = session_id is None
+        if owned:
+            session = self._resume_tokens.get(resume_token)
+            if session is None:
+                session = self._new_session(observer)
+        else:
+            session = self.get_session(int(session_id))
+            if session is None:
+                raise tornado.web.HTTPError(404)
+        if owned:
+            self.hub.send(
+                observer, {"resume_token": session.resume_token, "id": session.i}
+            )
+        session.add_observer(observer)
+        self._observer_to_session[observer] = session
+        if isinstance(session, Session):
+            session.release_at = None
+            self._update_quota(session)
+        self.touch(session)
+        if isinstance(session, Session) and session.get_state() == Session.IDLE:
+            await session.start()
+        return session
+
+    async def _start_session(self, session):
+        try:
+            await session.start()
+        except Error as e:
+            logging.error("Failed to start session %d: %s", session.i, e)
+
+    async def _release_session(self, session):
+        # Count in observers that other workers attached since the last tick.
+        self._receive_registry_events()
+        if session.has_observers() or session.i not in self._sessions:
+            return
+        if session.get_state() != Session.IDLE:
+            await session.stop()
+        if not session.has_keyboard() and not session.has_observers():
+            self.remove_session(session)
+
+    async def stop_observation(self, observer: SessionObserver):
+        self.hub.forget(observer)
+        session = self._observer_to_session.pop(observer, None)
+        if session is None:
+            # The observation never started.
+            return
+        session.remove_observer(observer)
+        if isinstance(session, Session) and not session.has_observers():
+            self._orphan(session)
+
+    def keyboard_connected(self, keyboard, resume_token=None) -> Session:
+        """Attaches `keyboard` to a new session or the one of `resume_token`."""
+        session = self._resume_tokens.get(resume_token)
+        if session is None or session.has_keyboard():
+            session = self._new_session(keyboard)
+        else:
+            logging.info(
+                "Keyboard resumed session %d",
+                session.i,
+                extra=logs.session_extra(session.i),
+            )
+            session.release_at = None
+        self._keyboard_to_session[keyboard] = session
+        session.set_keyboard(keyboard)
+        return session
+
+    def keyboard_disconnected(self, keyboard: SessionObserver):
+        session = self._keyboard_to_session[keyboard]
+        session.set_keyboard(None)
+        del self._keyboard_to_session[keyboard]
+        if not session.has_observers():
+            self._orphan(session)
+
+    async def stop(self):
+        sessions = list(self._sessions.values())
+        await asyncio.gather(*(s.stop() for s in sessions))
+        for session in sessions:
+            # Released meanwhile if its clients disconnected.
+            if session.i in self._sessions:
+                self.remove_session(session)
+        await self.warm_pool.stop()
+        await instance_manager.BACKEND.stop()
+        self.registry.close()
+
+
+# Observer statuses of sessions on their way to RUNNING, or back to it.
+_PROGRESS_STATUSES = {
+    Session.STARTING: "connecting",
+    Session.QUEUED: "queued",
+    Session.PAUSED: "paused",
+}
+
+
+def session_state_message(session, state):
+    """Returns the message sent to observers of `session` in `state`."""
+    if state == Session.RUNNING:
+        resp = {
+            "status": "connected",
+            "ssh": {
+                "url": session.get_ssh_url(),
+            },
+            "mp3": {
+                "url": session.get_mp3_url(),
+            },
+            "session": session.to_dict(),
+        }
+        logging.debug(
+            "Sending ssh details to web clients: %s",
+            resp,
+            extra=logs.session_extra(session.i),
+        )
+        return resp
+    if state == Session.STOPPING:
+        return {
+            "id": session.i,
+            "status": "disconnected",
+        }
+    if state == Session.FAILED:
+        return {
+            "id": session.i,
+            "status": "error",
+        }
+    if state in _PROGRESS_STATUSES:
+        resp = {
+            "id": session.i,
+            "session": session.to_dict(),
+            "status": _PROGRESS_STATUSES[state],
+        }
+        if state == Session.QUEUED:
+            resp["position"] = session.queue_position
+        return resp
+    if state != Session.IDLE:
+        logging.error("Unexpected session state in WS handler: %s", state)
+    return None
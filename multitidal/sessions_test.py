@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from multitidal import fake_backend
+from multitidal import instance_manager
+from multitidal import registry
+from multitidal import sessions
+
+
+def make_controllers(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        instance_manager, "BACKEND", fake_backend.FakeBackend(start_latency=0)
+    )
+    path = str(tmp_path / "registry.sqlite3")
+    return (
+        sessions.SessionsController(registry=registry.SqliteRegistry(path, 0)),
+        sessions.SessionsController(registry=registry.SqliteRegistry(path, 1)),
+    )
+
+
+def test_touching_a_remote_session_resumes_it(tmp_path, monkeypatch):
+    owner, other = make_controllers(tmp_path, monkeypatch)
+
+    async def run():
+        session = sessions.Session(owner, hostname="localhost")
+        owner.add_session(session)
+        await session.start()
+        await session.pause()
+        other.on_tick()
+        remote = other.get_session(session.i)
+        assert isinstance(remote, sessions.RemoteSession)
+
+        other.touch(remote)
+        owner.on_tick()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        return session.get_state()
+
+    assert asyncio.run(run()) == sessions.Session.RUNNING
+
+
+def test_remote_touches_are_rate_limited(tmp_path, monkeypatch):
+    owner, other = make_controllers(tmp_path, monkeypatch)
+    session = sessions.Session(owner, hostname="localhost")
+    owner.add_session(session)
+    other.on_tick()
+    remote = other.get_session(session.i)
+
+    other.touch(remote)
+    other.touch(remote)
+
+    events = [e for e in owner.registry.receive() if e.kind == registry.ACTIVITY]
+    assert len(events) == 1
+    assert events[0].payload["sessions"] == [{"id": session.i}]
+
+
+def test_sessions_over_the_limit_wait_in_line(monkeypatch):
+    backend = fake_backend.FakeBackend(start_latency=0, stop_latency=0)
+    monkeypatch.setattr(instance_manager, "BACKEND", backend)
+    controller = sessions.SessionsController(max_sessions=1)
+
+    async def run():
+        started = [sessions.Session(controller, hostname="localhost") for _ in range(3)]
+        tasks = [asyncio.ensure_future(s.start()) for s in started]
+        await tasks[0]
+        await asyncio.sleep(0)
+        states = [(s.get_state(), s.queue_position) for s in started]
+
+        await started[0].stop()
+        await tasks[1]
+        await asyncio.sleep(0)
+        states.append((started[2].get_state(), started[2].queue_position))
+        await started[2].stop()
+        await tasks[2]
+        return states
+
+    assert asyncio.run(run()) == [
+        (sessions.Session.RUNNING, None),
+        (sessions.Session.QUEUED, 1),
+        (sessions.Session.QUEUED, 2),
+        (sessions.Session.QUEUED, 1),
+    ]
+    assert backend.stats() == {"active": 1, "failed": 0}
+
+
+def test_failed_start_leaves_the_session_failed(monkeypatch):
+    backend = fake_backend.FakeBackend(start_latency=0, start_failure_rate=1.0)
+    monkeypatch.setattr(instance_manager, "BACKEND", backend)
+    controller = sessions.SessionsController(max_sessions=1)
+    session = sessions.Session(controller, hostname="localhost")
+
+    async def run():
+        with pytest.raises(sessions.Error):
+            await session.start()
+
+    asyncio.run(run())
+    assert session.get_state() == sessions.Session.FAILED
+    assert backend.stats() == {"active": 0, "failed": 1}
+    assert controller.admission.stats()["running"] == 0
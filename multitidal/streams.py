@@ -0,0 +1,140 @@
+"""Handlers streaming a live session's terminal and audio to browsers."""
+
+import json
+import logging
+
+from typing import Optional
+
+import tornado.iostream
+import tornado.web
+import tornado.websocket
+
+from . import audio_relay
+from . import instance_manager
+from . import metrics
+from . import quotas
+from . import terminal
+
+CONNECTIONS = metrics.gauge(
+    "multitidal_connections", "Open client connections.", labels=("endpoint",)
+)
+MESSAGES_RECEIVED = metrics.counter(
+    "multitidal_websocket_messages_received_total",
+    "Websocket messages received from clients.",
+    labels=("endpoint",),
+)
+
+
+class AudioHandler(tornado.web.RequestHandler):
+    """Streams a session's mp3 through the session's audio relay."""
+
+    _listener: Optional[audio_relay.Listener] = None
+
+    def initialize(self, sc):
+        self._sc = sc
+
+    async def get(self, session_id):
+        session = self._sc.get_session(int(session_id))
+        if session is None or not session.is_live():
+            raise tornado.web.HTTPError(404)
+        host, port = session.get_mp3_address()
+        self._listener = self._sc.audio.listen(
+            session.i,
+            f"http://{host}:{port}{instance_manager.MP3_PATH}",
+            on_drop=self.request.connection.close,
+        )
+        self.set_header("Content-Type", "audio/mpeg")
+        self.set_header("Cache-Control", "no-cache, no-store")
+        CONNECTIONS.labels("audio").inc()
+        try:
+            while True:
+                for chunk in await self._listener.read():
+                    self.write(chunk)
+                await self.flush()
+        except audio_relay.Error as e:
+            logging.info("Audio listener of session %d stopped: %s", session.i, e)
+        except tornado.iostream.StreamClosedError:
+            pass
+        finally:
+            CONNECTIONS.labels("audio").dec()
+            self._sc.audio.release(session.i, self._listener)
+
+    def on_connection_close(self):
+        # Wakes up the read loop, which releases the listener.
+        if self._listener is not None:
+            self._listener.drop()
+
+
+class TerminalHandler(tornado.web.RequestHandler):
+    def get(self, session_id):
+        self.render("terminal.html", session_id=session_id)
+
+
+class TerminalSocketHandler(tornado.websocket.WebSocketHandler):
+    """Bridges a browser terminal to the SSH server of a running session.
+
+    The browser sends JSON messages: {"type": "data", "data": <str>} with
+    typed input and {"type": "resize", "cols": <int>, "rows": <int>}. Terminal
+    output is sent back as binary messages.
+    """
+
+    _terminal: Optional[terminal.SSHTerminal]
+
+    def check_origin(self, origin):
+        return True
+
+    def initialize(self, sc):
+        self._sc = sc
+        self._terminal = None
+        self._session = None
+
+    # pylint: disable=arguments-differ,invalid-overridden-method
+    async def open(self, session_id):
+        CONNECTIONS.labels("terminal").inc()
+        session = self._sc.get_session(int(session_id))
+        if session is None or not session.is_live():
+            self.close(reason="session not running")
+            return
+        self._session = session
+        self._sc.touch(session)
+        self._terminal = terminal.SSHTerminal(
+            on_output=self._on_terminal_output, on_close=self.close
+        )
+        size = (
+            int(self.get_argument("cols", terminal.DEFAULT_SIZE[0])),
+            int(self.get_argument("rows", terminal.DEFAULT_SIZE[1])),
+        )
+        host, port = session.get_ssh_address()
+        try:
+            await self._terminal.open(
+                host,
+                port,
+                instance_manager.SSH_LOGIN,
+                instance_manager.SSH_PASSWORD,
+                size=size,
+            )
+        except terminal.Error as e:
+            logging.error("Session %d: %s", session.i, e)
+            return
+        self._sc.on_terminal_attached(session)
+
+    def _on_terminal_output(self, data):
+        if self.ws_connection is not None:
+            self.write_message(data, binary=True)
+
+    def on_message(self, message):
+        MESSAGES_RECEIVED.labels("terminal").inc()
+        if not self._sc.allow_message(self):
+            self.close(quotas.POLICY_VIOLATION, "Too many messages")
+            return
+        msg = json.loads(message)
+        if msg["type"] == "data":
+            self._terminal.write(msg["data"].encode())
+            self._sc.on_keystrokes(self._session, len(msg["data"]))
+        elif msg["type"] == "resize":
+            self._terminal.resize(int(msg["cols"]), int(msg["rows"]))
+
+    def on_close(self):
+        CONNECTIONS.labels("terminal").dec()
+        if self._terminal is not None:
+            self._terminal.close()
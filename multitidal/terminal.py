@@ -0,0 +1,78 @@
+import asyncio
+import logging
+
+from typing import Optional
+
+import asyncssh
+
+TERM_TYPE = "xterm-color"
+DEFAULT_SIZE = (80, 24)
+READ_SIZE = 16 * 1024
+
+
+class Error(Exception):
+    pass
+
+
+class SSHTerminal:
+    """An interactive SSH shell whose output is passed to a callback.
+
+    `on_output` is called with raw bytes from the remote terminal and
+    `on_close` once the shell exits or the connection drops.
+    """
+
+    _conn: Optional[asyncssh.SSHClientConnection] = None
+    _process: Optional[asyncssh.SSHClientProcess] = None
+    _reader: Optional[asyncio.Task] = None
+
+    def __init__(self, on_output, on_close):
+        self._on_output = on_output
+        self._on_close = on_close
+        self._closed = False
+
+    async def open(self, host, port, username, password, size=DEFAULT_SIZE):
+        try:
+            self._conn = await asyncssh.connect(
+                host,
+                port,
+                username=username,
+                password=password,
+                known_hosts=None,
+            )
+            self._process = await self._conn.create_process(
+                term_type=TERM_TYPE, term_size=size, encoding=None
+            )
+        except (OSError, asyncssh.Error) as e:
+            self.close()
+            raise Error(f"Failed to open terminal on {host}:{port}: {e}") from e
+        self._reader = asyncio.ensure_future(self._read())
+
+    async def _read(self):
+        try:
+            while True:
+                data = await self._process.stdout.read(READ_SIZE)
+                if not data:
+                    break
+                self._on_output(data)
+        except (OSError, asyncssh.Error) as e:
+            logging.info("Terminal connection lost: %s", e)
+        finally:
+            self.close()
+
+    def write(self, data: bytes):
+        if self._process is not None and not self._closed:
+            self._process.stdin.write(data)
+
+    def resize(self, cols, rows):
+        if self._process is not None and not self._closed:
+            self._process.change_terminal_size(cols, rows)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._reader is not None and self._reader is not asyncio.current_task():
+            self._reader.cancel()
+        if self._conn is not None:
+            self._conn.close()
+        self._on_close()
@@ -0,0 +1,107 @@
+"""Pre-started instances handed out to new sessions."""
+
+import asyncio
+import collections
+import logging
+import time
+
+from typing import Deque, Optional
+
+from . import docker_jobs
+from . import instance_manager
+
+
+class WarmPool:
+    """Keeps started MusicBoxes ready to be handed out to new sessions.
+
+    The pool refills itself in the background after every acquisition. When no
+    box has been acquired for `idle_timeout` seconds it shrinks to `min_size`.
+    """
+
+    _ready: Deque[instance_manager.Instance]
+    _maintenance_task: Optional[asyncio.Task] = None
+
+    def __init__(self, size=0, min_size=0, idle_timeout=300.0):
+        self.size = size
+        self.min_size = min(min_size, size)
+        self.idle_timeout = idle_timeout
+
+        self._ready = collections.deque()
+        self._starting = 0
+        self._last_acquired = time.monotonic()
+        self._stopped = False
+
+    def start(self):
+        """Starts background maintenance. Must be called from the io loop."""
+        if self.size > 0 and self._maintenance_task is None:
+            self._maintenance_task = asyncio.ensure_future(self._maintain())
+
+    def acquire(self) -> Optional[instance_manager.Instance]:
+        """Returns a ready MusicBox or None if the pool is empty."""
+        self._last_acquired = time.monotonic()
+        box = self._ready.popleft() if self._ready else None
+        self._refill()
+        return box
+
+    def has_ready(self) -> bool:
+        return bool(self._ready)
+
+    def stats(self):
+        return {
+            "ready": len(self._ready),
+            "starting": self._starting,
+            "target": self._target_size(),
+        }
+
+    def _target_size(self):
+        if time.monotonic() - self._last_acquired > self.idle_timeout:
+            return self.min_size
+        return self.size
+
+    def _refill(self):
+        # Nothing can start before the images are pulled.
+        if self._stopped or not instance_manager.BACKEND.image_status()["ready"]:
+            return
+        missing = self._target_size() - len(self._ready) - self._starting
+        for _ in range(missing):
+            self._starting += 1
+            asyncio.ensure_future(self._start_one())
+
+    async def _start_one(self):
+        box = instance_manager.BACKEND.new_instance()
+        try:
+            await box.start(hostname=None, priority=docker_jobs.SPECULATIVE)
+        except instance_manager.Error:
+            # Retried on the next maintenance tick.
+            logging.exception("Failed to start a pooled MusicBox")
+            return
+        finally:
+            self._starting -= 1
+        if self._stopped:
+            await box.stop()
+            return
+        logging.info("Pooled MusicBox ready, pool size: %d", len(self._ready) + 1)
+        self._ready.append(box)
+
+    async def _trim(self):
+        while len(self._ready) > self._target_size():
+            box = self._ready.pop()
+            logging.info("Trimming idle pooled MusicBox")
+            await box.stop()
+
+    async def _maintain(self):
+        while not self._stopped:
+            try:
+                await self._trim()
+                self._refill()
+            except Exception:  # pylint: disable=broad-except
+                logging.exception("Warm pool maintenance failed")
+            await asyncio.sleep(instance_manager.POOL_MAINTENANCE_INTERVAL)
+
+    async def stop(self):
+        self._stopped = True
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            self._maintenance_task = None
+        ready, self._ready = list(self._ready), collections.deque()
+        await asyncio.gather(*(box.stop() for box in ready))
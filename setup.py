@@ -12,7 +12,9 @@ setup(
     install_requires=[
         "tornado==6.0.3",
         "docker==4.1.0",
+        "asyncssh==2.1.0",
     ],
+    extras_require={"brotli": ["brotli"]},
     tests_require=["pytest"],
     include_package_data=True,
 )